@@ -11,12 +11,22 @@ class BotConfig:
         use_webhook (bool): Чи використовувати webhook.
         skip_updates (bool): Пропускати старі оновлення.
         parse_mode (str): Режим парсингу повідомлень (HTML / Markdown).
+        connection_limit (int): Максимум одночасних з'єднань HTTP-сесії з Telegram API.
+        page_size (int): Кількість подій на одній сторінці списків (перегляд, редагування, видалення).
+        update_query_warn (int): Кількість SQL-запитів на одне оновлення, понад яку пишеться попередження.
+        user_cache_size (int): Найбільша кількість користувачів у кеші процесу.
+        user_cache_ttl (int): Час життя запису кешу користувачів (сек).
     """
     token: str
     admin_ids: list[int]
     use_webhook: bool = False
     skip_updates: bool = True
     parse_mode: str = "HTML"
+    connection_limit: int = 50
+    page_size: int = 10
+    update_query_warn: int = 15
+    user_cache_size: int = 10000
+    user_cache_ttl: int = 300
 
 
 @dataclass
@@ -39,10 +49,43 @@ class SchedulerConfig:
 
     Атрибути:
         timezone (str): Часовий пояс.
-        notification_times (list[int]): Список хвилин до події для нагадування.
+        notification_times (list[int]): Стандартні відступи нагадувань (хвилини до події),
+            якщо користувач не вказав власні.
+        horizon_hours (int): На скільки годин наперед завантажувати нагадування в чергу.
+        refresh_interval (int): Період (сек) довантаження черги нагадувань.
+        max_sleep (int): Найдовший (сек) сон циклу планувальника між пробудженнями.
+        auto_complete_interval (int): Найбільший період (сек) між проходами автозавершення минулих подій.
+        reminder_batch_size (int): Максимум нагадувань, що обираються з БД за один прохід.
+        send_concurrency (int): Максимум одночасних запитів надсилання нагадувань.
+        global_rate (float): Глобальний ліміт повідомлень на секунду (ліміт Telegram ~30/с).
+        per_chat_rate (float): Ліміт повідомлень на секунду в один чат.
+        max_delivery_attempts (int): Максимум спроб доставки одного нагадування.
+        retry_base_delay (int): Базова затримка (сек) перед повтором; подвоюється з кожною спробою.
+        claim_lease (int): Тривалість оренди (сек) захоплених записів outbox.
+        digest_window (int): На скільки секунд наперед долучати нагадування користувача
+            до дайджесту разом із уже простроченим (0 — без об'єднання).
+        digest_max_items (int): Максимум подій в одному повідомленні-дайджесті.
+        metrics_host (str): Адреса локального HTTP-ендпоінта метрик.
+        metrics_port (int): Порт ендпоінта метрик (0 — вимкнено; для кількох процесів
+            на одному хості кожному потрібен свій порт).
     """
     timezone: str
     notification_times: list[int]
+    horizon_hours: int = 24
+    refresh_interval: int = 600
+    max_sleep: int = 300
+    auto_complete_interval: int = 300
+    reminder_batch_size: int = 500
+    send_concurrency: int = 20
+    global_rate: float = 30.0
+    per_chat_rate: float = 1.0
+    max_delivery_attempts: int = 5
+    retry_base_delay: int = 30
+    claim_lease: int = 300
+    digest_window: int = 120
+    digest_max_items: int = 15
+    metrics_host: str = "127.0.0.1"
+    metrics_port: int = 0
 
 
 @dataclass
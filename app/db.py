@@ -1,3 +1,7 @@
+from datetime import datetime, timezone
+
+from sqlalchemy import DateTime, event, text
+from sqlalchemy.types import TypeDecorator
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import DeclarativeBase
 
@@ -10,6 +14,24 @@ engine = create_async_engine(
     future=True
 )
 
+
+def enable_sqlite_foreign_keys(async_engine) -> None:
+    """
+    Вмикає зовнішні ключі для кожного нового з'єднання SQLite.
+
+    Без `PRAGMA foreign_keys` SQLite не виконує `ON DELETE CASCADE`, тож
+    масове видалення подій лишало б їхні нагадування й записи outbox.
+    """
+    @event.listens_for(async_engine.sync_engine, "connect")
+    def _foreign_keys_on(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA foreign_keys=ON")
+        cursor.close()
+
+
+if engine.dialect.name == "sqlite":
+    enable_sqlite_foreign_keys(engine)
+
 # Асинхронна сесія збереження
 async_session = async_sessionmaker(
     bind=engine,
@@ -25,6 +47,32 @@ class Base(DeclarativeBase):
     pass
 
 
+class UtcDateTime(TypeDecorator):
+    """
+    `DateTime(timezone=True)`, що завжди повертає aware datetime в UTC.
+
+    SQLite не зберігає часовий пояс і повертає naive значення, тож порівняння
+    з `utc_now()` падало б з TypeError. Значення перед записом переводяться
+    в UTC (naive вважаються UTC), після читання отримують `tzinfo=UTC`.
+    """
+    impl = DateTime(timezone=True)
+    cache_ok = True
+
+    def process_bind_param(self, value: datetime | None, dialect) -> datetime | None:
+        if value is None:
+            return None
+        if value.tzinfo is None:
+            return value.replace(tzinfo=timezone.utc)
+        return value.astimezone(timezone.utc)
+
+    def process_result_value(self, value: datetime | None, dialect) -> datetime | None:
+        if value is None:
+            return None
+        if value.tzinfo is None:
+            return value.replace(tzinfo=timezone.utc)
+        return value.astimezone(timezone.utc)
+
+
 async def get_session() -> AsyncSession:
     """
     Генератор асинхронної сесії бази даних для залежностей.
@@ -34,3 +82,23 @@ async def get_session() -> AsyncSession:
     """
     async with async_session() as session:
         yield session
+
+
+async def try_advisory_xact_lock(session: AsyncSession, key: int) -> bool:
+    """
+    Пробує взяти транзакційний advisory-lock PostgreSQL без очікування.
+
+    Блокування звільняється автоматично після завершення транзакції.
+    Для SQLite (один процес) завжди повертає True.
+
+    Args:
+        session (AsyncSession): Активна сесія.
+        key (int): Ключ блокування.
+
+    Returns:
+        bool: True, якщо блокування отримано.
+    """
+    if not config.db.use_postgres:
+        return True
+    result = await session.execute(text("SELECT pg_try_advisory_xact_lock(:key)"), {"key": key})
+    return bool(result.scalar())
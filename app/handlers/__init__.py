@@ -9,5 +9,8 @@ from . import (
     event_stats,
     event_chart,
     event_export,
+    event_find,
+    event_timezone,
+    event_metrics,
     event_fallback,
 )
\ No newline at end of file
@@ -5,11 +5,12 @@ from aiogram.types import Message, ReplyKeyboardMarkup, KeyboardButton
 from aiogram.fsm.context import FSMContext
 from aiogram.fsm.state import State, StatesGroup
 
-from app.db import async_session
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.models import User
 from app.repositories.event_repo import get_events_in_range
-from app.repositories.user_repo import get_user_by_telegram_id
 from app.services.event_add_service import (
-    validate_date, validate_time, finish_event_logic
+    validate_date, validate_time, parse_remind_offsets, finish_event_logic
 )
 from app.utils.i18n import L
 
@@ -91,8 +92,10 @@ async def add_time(message: Message, state: FSMContext):
         await state.update_data(time=parsed_time)
         await state.set_state(AddEventState.remind)
         await message.answer(L({
-            "uk": "🔔 За скільки хвилин до події надіслати нагадування?",
-            "en": "🔔 How many minutes before the event to send a reminder?"
+            "uk": "🔔 За скільки хвилин до події надіслати нагадування? "
+                  "Можна кілька через кому (10, 60, 1440) або `-` для стандартних:",
+            "en": "🔔 How many minutes before the event to send reminders? "
+                  "Several comma separated (10, 60, 1440) or `-` for defaults:"
         }))
     except ValueError:
         await message.answer(L({
@@ -104,14 +107,14 @@ async def add_time(message: Message, state: FSMContext):
 @router.message(AddEventState.remind)
 async def add_category(message: Message, state: FSMContext):
     """
-    Отримує кількість хвилин до нагадування і переводить FSM у стан введення категорії.
+    Отримує відступи нагадувань (хвилини через кому) і переводить FSM у стан введення категорії.
     """
     if message.text == "/cancel":
         return
 
     try:
-        remind = int(message.text.strip())
-        await state.update_data(remind_before=remind)
+        offsets = parse_remind_offsets(message.text)
+        await state.update_data(remind_offsets=offsets)
         await state.set_state(AddEventState.category)
         await message.answer(L({
             "uk": "🏷 Категорія (або `-`):",
@@ -119,8 +122,8 @@ async def add_category(message: Message, state: FSMContext):
         }))
     except ValueError:
         await message.answer(L({
-            "uk": "❌ Введи лише число (хвилини до події)",
-            "en": "❌ Please enter a number (minutes before event)"
+            "uk": "❌ Введи хвилини до події числами через кому або `-`",
+            "en": "❌ Please enter minutes before event, comma separated, or `-`"
         }))
 
 
@@ -142,7 +145,7 @@ async def add_tag(message: Message, state: FSMContext):
 
 
 @router.message(AddEventState.tag)
-async def ask_repeat(message: Message, state: FSMContext):
+async def ask_repeat(message: Message, state: FSMContext, lang: str):
     if message.text == "/cancel":
         return
 
@@ -150,8 +153,6 @@ async def ask_repeat(message: Message, state: FSMContext):
     await state.update_data(tag=None if tag == "-" else tag)
     await state.set_state(AddEventState.repeat)
 
-    lang = "uk" if message.from_user.language_code == "uk" else "en"
-
     keyboard = ReplyKeyboardMarkup(
         keyboard=[
             [KeyboardButton(text="🔁 Без повтору" if lang == "uk" else "🔁 None")],
@@ -174,7 +175,7 @@ async def ask_repeat(message: Message, state: FSMContext):
 
 
 @router.message(AddEventState.repeat)
-async def finish_event(message: Message, state: FSMContext):
+async def finish_event(message: Message, state: FSMContext, session: AsyncSession, user: User | None):
     """
     Завершує процес додавання події. Перевіряє конфлікти в часі,
     зберігає дані FSM і запускає логіку збереження або запит підтвердження.
@@ -209,9 +210,11 @@ async def finish_event(message: Message, state: FSMContext):
     start = event_datetime - timedelta(minutes=15)
     end = event_datetime + timedelta(minutes=15)
 
-    async with async_session() as session:
-        user = await get_user_by_telegram_id(session, message.from_user.id)
-        nearby_events = await get_events_in_range(session, user.id, start.date(), end.date())
+    if not user:
+        await finish_event_logic(message, state, session, user)
+        return
+
+    nearby_events = await get_events_in_range(session, user.id, start.date(), end.date(), tz=user.timezone)
 
     overlapping = [
         e for e in nearby_events if abs(
@@ -230,4 +233,4 @@ async def finish_event(message: Message, state: FSMContext):
             "en": f"⚠️ There are already events near this time:\n{events_text}\n\nAdd anyway? (yes/no)"
         }))
     else:
-        await finish_event_logic(message, state)
+        await finish_event_logic(message, state, session, user)
@@ -7,7 +7,7 @@ from app.utils.i18n import L
 router = Router()
 
 @router.message(F.text == "/cancel")
-async def cancel_handler(message: Message, state: FSMContext):
+async def cancel_handler(message: Message, state: FSMContext, lang: str):
     """
     Обробник команди /cancel для скасування поточної FSM-операції.
 
@@ -25,4 +25,4 @@ async def cancel_handler(message: Message, state: FSMContext):
         await message.answer(L({
             "uk": "❌ Операцію скасовано.",
             "en": "❌ Operation cancelled."
-        }), reply_markup=build_main_menu())
+        }), reply_markup=build_main_menu(lang))
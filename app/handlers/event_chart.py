@@ -1,11 +1,13 @@
 from aiogram import Router, F
 from aiogram.types import Message
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.models.models import User
 from app.services.chart_service import build_charts_for_user
 
 router = Router()
 
 @router.message(F.text.startswith("/chart"))
-async def chart_handler(message: Message):
+async def chart_handler(message: Message, session: AsyncSession, user: User | None):
     """
     Обробляє команду /chart [mode].
 
@@ -14,4 +16,4 @@ async def chart_handler(message: Message):
     """
     args = message.text.strip().split()
     mode = args[1] if len(args) > 1 else "all"
-    await build_charts_for_user(message, mode)
+    await build_charts_for_user(message, session, user, mode)
@@ -1,25 +1,37 @@
 from aiogram import Router, F
 from aiogram.types import Message, CallbackQuery
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.models.models import User
 from app.services.event_delete_service import show_events_for_deletion, delete_event_by_callback
 
 router = Router()
 
 @router.message(F.text == "/delete")
-async def delete_command(message: Message):
+async def delete_command(message: Message, session: AsyncSession, user: User | None):
     """
     Обробляє команду /delete.
 
     Відображає для користувача список подій, доступних для видалення.
     """
-    await show_events_for_deletion(message)
+    await show_events_for_deletion(message, session, user)
+
+
+@router.callback_query(F.data.startswith("delete_page:"))
+async def delete_more(callback: CallbackQuery, session: AsyncSession, user: User | None):
+    """
+    Обробляє кнопку "Показати ще" у списку подій для видалення.
+    """
+    await callback.message.edit_reply_markup(reply_markup=None)
+    await show_events_for_deletion(callback.message, session, user, callback.data.split(":", 1)[1])
+    await callback.answer()
 
 
 @router.callback_query(F.data.startswith("delete_event:"))
-async def confirm_delete(callback: CallbackQuery):
+async def confirm_delete(callback: CallbackQuery, session: AsyncSession, user: User | None):
     """
     Обробляє callback при підтвердженні видалення події.
 
     Отримує ID події з callback-даних та викликає логіку видалення.
     """
     event_id = int(callback.data.split(":")[1])
-    await delete_event_by_callback(callback, event_id)
+    await delete_event_by_callback(callback, session, user, event_id)
@@ -1,39 +1,40 @@
 from aiogram import Router, F
 from aiogram.types import Message, CallbackQuery, InlineKeyboardMarkup, InlineKeyboardButton
-from datetime import datetime
-
-from app.db import async_session
-from app.models.models import Event
-from app.repositories.user_repo import get_user_by_telegram_id
-from app.repositories.event_repo import get_today_user_events, mark_event_as_done, get_event_by_id
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.models.models import User
+from app.repositories.event_repo import get_passed_today_events, mark_event_as_done, mark_passed_today_done
+from app.utils.i18n import L
+from app.utils.tz import local_today
 
 router = Router()
 
-def simple_format_event(event: Event) -> str:
+def simple_format_event(event, lang: str | None = None) -> str:
     """
     Форматує подію у вигляді повідомлення для Telegram.
 
     Args:
-        event (Event): Об'єкт події.
+        event: Подія або рядок з колонками title, date, time, category, tag, is_done.
+        lang (str | None): Мова повідомлення (за замовчуванням — мова поточного оновлення).
 
     Returns:
         str: Відформатований рядок для відправки користувачу.
     """
+    time_str = event.time.strftime('%H:%M') if event.time else L({"uk": "без часу", "en": "no time"}, lang)
     lines = [
         f"<b>{event.title}</b>",
-        f"🗓 {event.date.strftime('%d.%m.%Y')} о {event.time.strftime('%H:%M') if event.time else 'без часу'}"
+        f"🗓 {event.date.strftime('%d.%m.%Y')} {L({'uk': 'о', 'en': 'at'}, lang)} {time_str}"
     ]
     if event.category:
-        lines.append(f"🏷 Категорія: {event.category}")
+        lines.append(f"🏷 {L({'uk': 'Категорія', 'en': 'Category'}, lang)}: {event.category}")
     if event.tag:
-        lines.append(f"🔖 Теги: {event.tag}")
+        lines.append(f"🔖 {L({'uk': 'Теги', 'en': 'Tags'}, lang)}: {event.tag}")
     if event.is_done:
-        lines.append("✅ Виконано")
+        lines.append(L({"uk": "✅ Виконано", "en": "✅ Done"}, lang))
     return "\n".join(lines)
 
 
 @router.message(F.text.startswith("/done"))
-async def show_today_events_to_mark_done(message: Message):
+async def show_today_events_to_mark_done(message: Message, session: AsyncSession, user: User | None, lang: str):
     """
     Обробляє команду /done. Виводить список сьогоднішніх подій, які вже відбулися,
     і дозволяє позначити їх як виконані за допомогою кнопки.
@@ -41,56 +42,115 @@ async def show_today_events_to_mark_done(message: Message):
     Args:
         message (Message): Об'єкт повідомлення Telegram.
     """
-    today = datetime.now().date()
-
-    async with async_session() as session:
-        user = await get_user_by_telegram_id(session, message.from_user.id)
-        if not user:
-            await message.answer("⚠️ Ви ще не зареєстровані. Напишіть /start.")
-            return
-
-        events = await get_today_user_events(session, user.id, today)
-
-        if not events:
-            await message.answer("📭 Немає подій на сьогодні, які можна відзначити як виконані.")
-            return
+    if not user:
+        await message.answer(L({
+            "uk": "⚠️ Ви ще не зареєстровані. Напишіть /start.",
+            "en": "⚠️ You are not registered yet. Please send /start."
+        }, lang))
+        return
+
+    today = local_today(user.timezone)
+    events = await get_passed_today_events(session, user.id, today, tz=user.timezone)
+
+    if not events:
+        await message.answer(L({
+            "uk": "📭 Немає подій на сьогодні, які можна відзначити як виконані.",
+            "en": "📭 No events today that can be marked as done."
+        }, lang))
+        return
+
+    for event in events:
+        await message.answer(
+            simple_format_event(event, lang),
+            reply_markup=InlineKeyboardMarkup(inline_keyboard=[[
+                InlineKeyboardButton(text=L({"uk": "✅ Виконано", "en": "✅ Done"}, lang), callback_data=f"done:{event.id}")
+            ]])
+        )
 
-        for event in events:
-            await message.answer(
-                simple_format_event(event),
-                reply_markup=InlineKeyboardMarkup(inline_keyboard=[[
-                    InlineKeyboardButton(text="✅ Виконано", callback_data=f"done:{event.id}")
-                ]])
-            )
+    if len(events) > 1:
+        await message.answer(
+            L({
+                "uk": f"Подій, що вже минули: {len(events)}",
+                "en": f"Events already passed: {len(events)}"
+            }, lang),
+            reply_markup=InlineKeyboardMarkup(inline_keyboard=[[
+                InlineKeyboardButton(
+                    text=L({"uk": "✅ Позначити всі як виконані", "en": "✅ Mark all as done"}, lang),
+                    callback_data="done_all"
+                )
+            ]])
+        )
 
 
 @router.callback_query(F.data.startswith("done:"))
-async def mark_event_done_callback(callback: CallbackQuery):
+async def mark_event_done_callback(callback: CallbackQuery, session: AsyncSession, user: User | None, lang: str):
     """
     Обробляє натискання кнопки "✅ Виконано". Позначає відповідну подію як виконану,
-    якщо вона належить поточному користувачу.
+    якщо вона належить поточному користувачу; один запит `UPDATE ... RETURNING`
+    повертає і результат перевірки, і дані для повідомлення.
 
     Args:
         callback (CallbackQuery): Callback-запит від користувача Telegram.
     """
     event_id = int(callback.data.split(":")[1])
+    not_found = L({
+        "uk": "⚠️ Подія не знайдена або не належить вам.",
+        "en": "⚠️ Event not found or does not belong to you."
+    }, lang)
+
+    if not user:
+        await callback.answer(not_found, show_alert=True)
+        return
+
+    event = await mark_event_as_done(session, event_id, user.id)
+
+    if not event:
+        await callback.answer(not_found, show_alert=True)
+        return
+
+    await callback.message.edit_text(
+        L({
+            "uk": f"✅ <b>Позначено як виконане:</b>\n{simple_format_event(event, lang)}",
+            "en": f"✅ <b>Marked as done:</b>\n{simple_format_event(event, lang)}"
+        }, lang),
+        parse_mode="HTML"
+    )
+    await callback.answer(L({"uk": "✅ Виконано.", "en": "✅ Done."}, lang))
+
+
+@router.callback_query(F.data == "done_all")
+async def mark_all_passed_done_callback(callback: CallbackQuery, session: AsyncSession,
+                                        user: User | None, lang: str):
+    """
+    Обробляє натискання кнопки "✅ Позначити всі як виконані". Одним запитом
+    позначає виконаними всі сьогоднішні події користувача, час яких уже настав.
 
-    async with async_session() as session:
-        user = await get_user_by_telegram_id(session, callback.from_user.id)
-        if not user:
-            await callback.answer("⚠️ Подія не знайдена або не належить вам.", show_alert=True)
-            return
-
-        success = await mark_event_as_done(session, event_id, user.id)
-
-        if not success:
-            await callback.answer("⚠️ Подія не знайдена або не належить вам.", show_alert=True)
-            return
-
-        event = await get_event_by_id(session, event_id)
-
-        await callback.message.edit_text(
-            f"✅ <b>Позначено як виконане:</b>\n{simple_format_event(event)}",
-            parse_mode="HTML"
-        )
-        await callback.answer("✅ Виконано.")
+    Args:
+        callback (CallbackQuery): Callback-запит від користувача Telegram.
+    """
+    if not user:
+        await callback.answer(L({
+            "uk": "⚠️ Ви ще не зареєстровані. Напишіть /start.",
+            "en": "⚠️ You are not registered yet. Please send /start."
+        }, lang), show_alert=True)
+        return
+
+    today = local_today(user.timezone)
+    events = await mark_passed_today_done(session, user.id, today, tz=user.timezone)
+
+    if not events:
+        await callback.answer(L({
+            "uk": "📭 Немає подій, які можна відзначити як виконані.",
+            "en": "📭 No events that can be marked as done."
+        }, lang), show_alert=True)
+        return
+
+    titles = "\n".join(f"• {event.title}" for event in events)
+    await callback.message.edit_text(
+        L({
+            "uk": f"✅ <b>Позначено як виконані ({len(events)}):</b>\n{titles}",
+            "en": f"✅ <b>Marked as done ({len(events)}):</b>\n{titles}"
+        }, lang),
+        parse_mode="HTML"
+    )
+    await callback.answer(L({"uk": "✅ Виконано.", "en": "✅ Done."}, lang))
@@ -2,6 +2,8 @@ from aiogram import Router, F
 from aiogram.types import Message, CallbackQuery, InlineKeyboardMarkup, InlineKeyboardButton
 from aiogram.fsm.state import State, StatesGroup
 from aiogram.fsm.context import FSMContext
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.models.models import User
 from app.utils.i18n import L
 
 from app.services.event_edit_service import (
@@ -24,13 +26,24 @@ class EditEventState(StatesGroup):
 
 
 @router.message(F.text == "/edit")
-async def list_events_for_edit(message: Message, state: FSMContext):
+async def list_events_for_edit(message: Message, state: FSMContext, session: AsyncSession, user: User | None):
     """
     Обробляє команду /edit.
 
     Виводить список подій, доступних для редагування.
     """
-    await list_events_to_edit(message, state)
+    await list_events_to_edit(message, state, session, user)
+
+
+@router.callback_query(F.data.startswith("edit_page:"))
+async def list_more_for_edit(callback: CallbackQuery, state: FSMContext, session: AsyncSession,
+                             user: User | None):
+    """
+    Обробляє кнопку "Показати ще" у списку подій для редагування.
+    """
+    await callback.message.edit_reply_markup(reply_markup=None)
+    await list_events_to_edit(callback.message, state, session, user, callback.data.split(":", 1)[1])
+    await callback.answer()
 
 
 @router.callback_query(F.data.startswith("edit_event:"))
@@ -66,11 +79,11 @@ async def ask_for_new_value(callback: CallbackQuery, state: FSMContext):
 
 
 @router.message(EditEventState.waiting_for_new_value)
-async def save_new_value(message: Message, state: FSMContext):
+async def save_new_value(message: Message, state: FSMContext, session: AsyncSession, user: User | None):
     """
     Отримує нове значення та застосовує зміни до події.
     """
-    await apply_edit(message, state)
+    await apply_edit(message, state, session, user)
 
 
 def build_edit_keyboard():
@@ -84,7 +97,8 @@ def build_edit_keyboard():
         [(L({"uk": "Назву", "en": "Title"}), "title"), (L({"uk": "Дату", "en": "Date"}), "date")],
         [(L({"uk": "Час", "en": "Time"}), "time"), (L({"uk": "Нагадування", "en": "Reminder"}), "remind")],
         [(L({"uk": "Категорію", "en": "Category"}), "category"), (L({"uk": "Теги", "en": "Tags"}), "tag")],
-        [(L({"uk": "Повторення", "en": "Repeat"}), "repeat")]
+        [(L({"uk": "Повторення", "en": "Repeat"}), "repeat"), (L({"uk": "Повтор до", "en": "Repeat until"}), "until")],
+        [(L({"uk": "Пропустити дату", "en": "Skip a date"}), "skip")]
     ]
     return InlineKeyboardMarkup(inline_keyboard=[
         [InlineKeyboardButton(text=label, callback_data=f"edit_field:{code}") for label, code in row]
@@ -1,6 +1,7 @@
 from aiogram import Router, F
 from aiogram.types import Message, CallbackQuery
-from app.db import async_session
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.models.models import User
 from app.services.export_service import (
     generate_csv_export,
     generate_txt_export,
@@ -14,7 +15,7 @@ router = Router()
 
 
 @router.callback_query(F.data.startswith("export:"))
-async def handle_export_callback(callback: CallbackQuery):
+async def handle_export_callback(callback: CallbackQuery, session: AsyncSession, user: User | None, lang: str):
     format_type = callback.data.split(":")[1]
 
     export_map = {
@@ -26,97 +27,91 @@ async def handle_export_callback(callback: CallbackQuery):
     }
 
     if format_type not in export_map:
-        await callback.answer("❌ Unknown format")
+        await callback.answer(L({"uk": "❌ Невідомий формат", "en": "❌ Unknown format"}, lang))
         return
 
-    async with async_session() as session:
-        result = await export_map[format_type](session, callback.from_user.id)
+    result = await export_map[format_type](session, user)
 
-        if result is None:
-            await callback.message.answer("⚠️ Ви ще не зареєстровані. Напишіть /start.")
-        elif result is False:
-            await callback.message.answer("📭 Немає подій для експорту.")
-        else:
-            await callback.message.answer_document(document=result)
+    if result is None:
+        await callback.message.answer(L({"uk": "⚠️ Ви ще не зареєстровані. Напишіть /start.", "en": "⚠️ You are not registered yet. Please send /start."}, lang))
+    elif result is False:
+        await callback.message.answer(L({"uk": "📭 У вас немає подій для експорту.", "en": "📭 You have no events to export."}, lang))
+    else:
+        await callback.message.answer_document(document=result)
 
     await callback.answer()
 
 
 @router.message(F.text == "/export_csv")
-async def export_csv(message: Message):
+async def export_csv(message: Message, session: AsyncSession, user: User | None, lang: str):
     """
     Обробляє команду /export_csv — експортує події користувача у форматі CSV.
     """
-    async with async_session() as session:
-        result = await generate_csv_export(session, message.from_user.id)
+    result = await generate_csv_export(session, user)
 
-        if result is None:
-            await message.answer(L({"uk": "⚠️ Ви ще не зареєстровані. Напишіть /start.", "en": "⚠️ You are not registered yet. Please send /start."}))
-        elif result is False:
-            await message.answer(L({"uk": "📭 У вас немає подій для експорту.", "en": "📭 You have no events to export."}))
-        else:
-            await message.answer_document(document=result)
+    if result is None:
+        await message.answer(L({"uk": "⚠️ Ви ще не зареєстровані. Напишіть /start.", "en": "⚠️ You are not registered yet. Please send /start."}, lang))
+    elif result is False:
+        await message.answer(L({"uk": "📭 У вас немає подій для експорту.", "en": "📭 You have no events to export."}, lang))
+    else:
+        await message.answer_document(document=result)
 
 
 @router.message(F.text == "/export_txt")
-async def export_txt(message: Message):
+async def export_txt(message: Message, session: AsyncSession, user: User | None, lang: str):
     """
     Обробляє команду /export_txt — експортує події користувача у форматі TXT.
     """
-    async with async_session() as session:
-        result = await generate_txt_export(session, message.from_user.id)
+    result = await generate_txt_export(session, user)
 
-        if result is None:
-            await message.answer(L({"uk": "⚠️ Ви ще не зареєстровані. Напишіть /start.", "en": "⚠️ You are not registered yet. Please send /start."}))
-        elif result is False:
-            await message.answer(L({"uk": "📭 У вас немає подій для експорту.", "en": "📭 You have no events to export."}))
-        else:
-            await message.answer_document(document=result)
+    if result is None:
+        await message.answer(L({"uk": "⚠️ Ви ще не зареєстровані. Напишіть /start.", "en": "⚠️ You are not registered yet. Please send /start."}, lang))
+    elif result is False:
+        await message.answer(L({"uk": "📭 У вас немає подій для експорту.", "en": "📭 You have no events to export."}, lang))
+    else:
+        await message.answer_document(document=result)
 
 
 @router.message(F.text == "/export_json")
-async def export_json(message: Message):
+async def export_json(message: Message, session: AsyncSession, user: User | None, lang: str):
     """
     Обробляє команду /export_json — експортує події користувача у форматі JSON.
     """
-    async with async_session() as session:
-        result = await generate_json_export(session, message.from_user.id)
+    result = await generate_json_export(session, user)
 
-        if result is None:
-            await message.answer(L({"uk": "⚠️ Ви ще не зареєстровані. Напишіть /start.", "en": "⚠️ You are not registered yet. Please send /start."}))
-        elif result is False:
-            await message.answer(L({"uk": "📭 У вас немає подій для експорту.", "en": "📭 You have no events to export."}))
-        else:
-            await message.answer_document(document=result)
+    if result is None:
+        await message.answer(L({"uk": "⚠️ Ви ще не зареєстровані. Напишіть /start.", "en": "⚠️ You are not registered yet. Please send /start."}, lang))
+    elif result is False:
+        await message.answer(L({"uk": "📭 У вас немає подій для експорту.", "en": "📭 You have no events to export."}, lang))
+    else:
+        await message.answer_document(document=result)
 
 
 @router.message(F.text == "/export_pdf")
-async def export_pdf(message: Message):
+async def export_pdf(message: Message, session: AsyncSession, user: User | None, lang: str):
     """
     Обробляє команду /export_pdf — експортує події користувача у форматі PDF.
     """
-    async with async_session() as session:
-        result = await generate_pdf_export(session, message.from_user.id)
+    result = await generate_pdf_export(session, user)
 
-        if result is None:
-            await message.answer(L({"uk": "⚠️ Ви ще не зареєстровані. Напишіть /start.", "en": "⚠️ You are not registered yet. Please send /start."}))
-        elif result is False:
-            await message.answer(L({"uk": "📭 У вас немає подій для експорту.", "en": "📭 You have no events to export."}))
-        else:
-            await message.answer_document(document=result)
+    if result is None:
+        await message.answer(L({"uk": "⚠️ Ви ще не зареєстровані. Напишіть /start.", "en": "⚠️ You are not registered yet. Please send /start."}, lang))
+    elif result is False:
+        await message.answer(L({"uk": "📭 У вас немає подій для експорту.", "en": "📭 You have no events to export."}, lang))
+    else:
+        await message.answer_document(document=result)
 
 
 @router.message(F.text == "/export_excel")
-async def export_excel(message: Message):
+async def export_excel(message: Message, session: AsyncSession, user: User | None, lang: str):
     """
     Обробляє команду /export_excel — експортує події користувача у форматі Excel (XLSX).
     """
-    async with async_session() as session:
-        result = await generate_excel_export(session, message.from_user.id)
-
-        if result is None:
-            await message.answer(L({"uk": "⚠️ Ви ще не зареєстровані. Напишіть /start.", "en": "⚠️ You are not registered yet. Please send /start."}))
-        elif result is False:
-            await message.answer(L({"uk": "📭 У вас немає подій для експорту.", "en": "📭 You have no events to export."}))
-        else:
-            await message.answer_document(document=result)
\ No newline at end of file
+    result = await generate_excel_export(session, user)
+
+    if result is None:
+        await message.answer(L({"uk": "⚠️ Ви ще не зареєстровані. Напишіть /start.", "en": "⚠️ You are not registered yet. Please send /start."}, lang))
+    elif result is False:
+        await message.answer(L({"uk": "📭 У вас немає подій для експорту.", "en": "📭 You have no events to export."}, lang))
+    else:
+        await message.answer_document(document=result)
\ No newline at end of file
@@ -0,0 +1,27 @@
+from aiogram import Router, F
+from aiogram.fsm.context import FSMContext
+from aiogram.types import Message, CallbackQuery
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.models import User
+from app.services.event_list_service import find_events, find_events_more
+
+router = Router()
+
+
+@router.message(F.text.startswith("/find"))
+async def find_command(message: Message, state: FSMContext, session: AsyncSession, user: User | None):
+    """
+    Обробляє команду /find.
+
+    Шукає події за назвою та описом і виводить найрелевантніші першими.
+    """
+    await find_events(message, state, session, user)
+
+
+@router.callback_query(F.data.startswith("find_page:"))
+async def find_more(callback: CallbackQuery, state: FSMContext, session: AsyncSession, user: User | None):
+    """
+    Обробляє кнопку "Показати ще" у результатах пошуку.
+    """
+    await find_events_more(callback, state, session, user)
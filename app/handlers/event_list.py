@@ -1,8 +1,10 @@
 from aiogram import Router, F
+from aiogram.fsm.context import FSMContext
 from aiogram.types import Message, CallbackQuery
-from datetime import datetime, timedelta
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.models.models import User
 from app.services.event_list_service import (
-    list_events, export_one_to_google,
+    list_events, list_events_more, export_one_to_google,
     import_from_google_calendar
 )
 from app.utils.i18n import L
@@ -11,82 +13,84 @@ router = Router()
 
 
 @router.message(F.text.startswith("/list"))
-async def list_nearest(message: Message):
+async def list_nearest(message: Message, state: FSMContext, session: AsyncSession, user: User | None):
     """
     Обробляє команду /list.
 
     Виводить події на сьогодні та завтра.
     """
-    today = datetime.now().date()
-    tomorrow = today + timedelta(days=90)
-    await list_events(message, today, tomorrow, L({
+    await list_events(message, session, user, "upcoming", L({
         "uk": "📅 <b>Найближчі події:</b>",
         "en": "📅 <b>Upcoming events:</b>"
-    }))
+    }), state=state)
 
 
 @router.message(F.text.startswith("/today"))
-async def list_today(message: Message):
+async def list_today(message: Message, state: FSMContext, session: AsyncSession, user: User | None):
     """
     Обробляє команду /today.
 
     Виводить події тільки на сьогодні.
     """
-    today = datetime.now().date()
-    await list_events(message, today, today, L({
+    await list_events(message, session, user, "today", L({
         "uk": "📅 <b>Події на сьогодні:</b>",
         "en": "📅 <b>Today's events:</b>"
-    }))
+    }), state=state)
 
 
 @router.message(F.text.startswith("/week"))
-async def list_week(message: Message):
+async def list_week(message: Message, state: FSMContext, session: AsyncSession, user: User | None):
     """
     Обробляє команду /week.
 
     Виводить події на найближчі 7 днів (включно з поточним днем).
     """
-    start = datetime.now().date()
-    end = start + timedelta(days=6)
-    await list_events(message, start, end, L({
+    await list_events(message, session, user, "week", L({
         "uk": "🗓 <b>Події на тиждень:</b>",
         "en": "🗓 <b>Events for the week:</b>"
-    }))
+    }), state=state)
 
 
 @router.message(F.text.startswith("/month"))
-async def list_month(message: Message):
+async def list_month(message: Message, state: FSMContext, session: AsyncSession, user: User | None):
     """
     Обробляє команду /month.
 
     Виводить події за поточний календарний місяць.
     """
-    now = datetime.now()
-    start = now.replace(day=1).date()
-    # Знаходимо останній день місяця
-    end = (now.replace(month=now.month % 12 + 1, day=1) - timedelta(days=1)).date()
-    await list_events(message, start, end, L({
+    await list_events(message, session, user, "month", L({
         "uk": "📂 <b>Події цього місяця:</b>",
         "en": "📂 <b>Events this month:</b>"
-    }))
+    }), state=state)
+
+
+@router.callback_query(F.data.startswith("list_page:"))
+async def list_more(callback: CallbackQuery, state: FSMContext, session: AsyncSession, user: User | None):
+    """
+    Обробляє кнопку "Показати ще" у списку подій.
+
+    Виводить наступну сторінку від курсора з callback-даних.
+    """
+    await list_events_more(callback, state, session, user)
 
 
 @router.callback_query(F.data.startswith("export_google:"))
-async def export_google(callback: CallbackQuery):
+async def export_google(callback: CallbackQuery, session: AsyncSession, user: User | None):
     """
     Обробляє callback для експорту однієї події в Google Calendar.
 
     Отримує ID події з callback-даних.
     """
     event_id = int(callback.data.split(":")[1])
-    await export_one_to_google(callback, event_id)
+    await export_one_to_google(callback.message, session, user, event_id)
+    await callback.answer()
 
 
 @router.message(F.text == "/import_google")
-async def import_google(message: Message):
+async def import_google(message: Message, session: AsyncSession, user: User | None):
     """
     Обробляє команду /import_google.
 
     Імпортує події користувача з Google Calendar у систему.
     """
-    await import_from_google_calendar(message)
+    await import_from_google_calendar(message, session, user)
@@ -0,0 +1,18 @@
+from aiogram import Router, F
+from aiogram.types import Message
+
+from app.config import config
+from app.scheduler.metrics import scheduler_metrics
+
+router = Router()
+
+
+@router.message(F.text == "/metrics", F.from_user.id.in_(config.bot.admin_ids))
+async def metrics_handler(message: Message):
+    """
+    Обробляє команду /metrics (лише для адміністраторів).
+
+    Показує запізнення нагадувань, тривалість проходів планувальника
+    та залишки черг поточного процесу.
+    """
+    await message.answer(f"📊 <b>Scheduler</b>\n<pre>{scheduler_metrics.summary()}</pre>")
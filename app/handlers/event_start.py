@@ -1,6 +1,7 @@
 from aiogram import Router, F
 from aiogram.types import Message
-from app.db import async_session
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.models.models import User
 from app.services.user_service import handle_user_start
 from app.handlers.event_menu import build_main_menu
 from app.utils.i18n import L
@@ -9,15 +10,16 @@ router = Router()
 
 
 @router.message(F.text == "/start")
-async def start_handler(message: Message):
+async def start_handler(message: Message, session: AsyncSession, user: User | None, lang: str):
     """
     Обробляє команду /start.
 
     Реєструє нового користувача або показує повідомлення, якщо вже зареєстрований.
     Виводить головне меню після відповіді.
     """
-    async with async_session() as session:
-        try:
+    try:
+        is_new = False
+        if user is None:
             user, is_new = await handle_user_start(
                 session,
                 telegram_id=message.from_user.id,
@@ -26,27 +28,27 @@ async def start_handler(message: Message):
                 last_name=message.from_user.last_name,
             )
 
-            if is_new:
-                await message.answer(
-                    L({
-                        "uk": f"👋 Привіт, {user.first_name or 'користувачу'}! Вас зареєстровано ✅",
-                        "en": f"👋 Hello, {user.first_name or 'user'}! You have been registered ✅"
-                    }),
-                    reply_markup=build_main_menu()
-                )
-            else:
-                await message.answer(
-                    L({
-                        "uk": "🔄 Ви вже зареєстровані в системі.",
-                        "en": "🔄 You are already registered in the system."
-                    }),
-                    reply_markup=build_main_menu()
-                )
-        except Exception:
-            # Загальний виняток
+        if is_new:
             await message.answer(
                 L({
-                    "uk": "⚠️ Виникла помилка при збереженні.",
-                    "en": "⚠️ An error occurred while saving."
-                })
+                    "uk": f"👋 Привіт, {user.first_name or 'користувачу'}! Вас зареєстровано ✅",
+                    "en": f"👋 Hello, {user.first_name or 'user'}! You have been registered ✅"
+                }),
+                reply_markup=build_main_menu(lang)
             )
+        else:
+            await message.answer(
+                L({
+                    "uk": "🔄 Ви вже зареєстровані в системі.",
+                    "en": "🔄 You are already registered in the system."
+                }),
+                reply_markup=build_main_menu(lang)
+            )
+    except Exception:
+        # Загальний виняток
+        await message.answer(
+            L({
+                "uk": "⚠️ Виникла помилка при збереженні.",
+                "en": "⚠️ An error occurred while saving."
+            })
+        )
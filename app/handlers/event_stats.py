@@ -1,12 +1,13 @@
 from aiogram import Router, F
 from aiogram.types import Message
-from app.db import async_session
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.models.models import User
 from app.services.stats_service import get_stats_report
 
 router = Router()
 
 @router.message(F.text.startswith("/stats"))
-async def stats_handler(message: Message):
+async def stats_handler(message: Message, session: AsyncSession, user: User | None):
     """
     Обробляє команду /stats [mode].
 
@@ -15,6 +16,8 @@ async def stats_handler(message: Message):
 
     Параметри:
         message (Message): вхідне повідомлення від користувача.
+        session (AsyncSession): сесія БД поточного оновлення.
+        user (User | None): користувач, визначений DbSessionMiddleware.
 
     Відповідь:
         Надсилає згенерований текстовий звіт користувачу.
@@ -22,8 +25,7 @@ async def stats_handler(message: Message):
     args = message.text.strip().split()
     mode = args[1] if len(args) > 1 else "all"
 
-    async with async_session() as session:
-        # Повертається кортеж (raw_data, formatted_string), беремо лише текст
-        _, result = await get_stats_report(session, message.from_user.id, mode)
+    # Повертається кортеж (raw_data, formatted_string), беремо лише текст
+    _, result = await get_stats_report(session, user, mode)
 
     await message.answer(result)
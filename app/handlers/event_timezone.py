@@ -0,0 +1,53 @@
+from aiogram import Router, F
+from aiogram.types import Message
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.models import User
+from app.services.user_service import set_user_timezone
+from app.utils.i18n import L
+from app.utils.tz import is_valid_timezone
+
+router = Router()
+
+
+@router.message(F.text.startswith("/timezone"))
+async def timezone_handler(message: Message, session: AsyncSession, user: User | None):
+    """
+    Обробляє команду /timezone.
+
+    Без аргументу показує поточний часовий пояс, з аргументом (наприклад,
+    `/timezone Europe/Warsaw`) — змінює його і перераховує нагадування.
+    """
+    args = message.text.strip().split(maxsplit=1)
+
+    if not user:
+        await message.answer(L({
+            "uk": "⚠️ Спочатку зареєструйтесь через /start.",
+            "en": "⚠️ Please register first via /start."
+        }))
+        return
+
+    lang = user.language
+    if len(args) < 2:
+        await message.answer(L({
+            "uk": f"🌍 Ваш часовий пояс: <b>{user.timezone}</b>\n"
+                  f"Щоб змінити, надішліть: /timezone Europe/Warsaw",
+            "en": f"🌍 Your time zone: <b>{user.timezone}</b>\n"
+                  f"To change it, send: /timezone Europe/Warsaw"
+        }, lang))
+        return
+
+    tz = args[1].strip()
+    if not is_valid_timezone(tz):
+        await message.answer(L({
+            "uk": "❌ Невідомий часовий пояс. Приклад: Europe/Kyiv, America/New_York",
+            "en": "❌ Unknown time zone. Example: Europe/Kyiv, America/New_York"
+        }, lang))
+        return
+
+    await set_user_timezone(session, user, tz)
+
+    await message.answer(L({
+        "uk": f"✅ Часовий пояс змінено на <b>{tz}</b>.",
+        "en": f"✅ Time zone set to <b>{tz}</b>."
+    }, lang))
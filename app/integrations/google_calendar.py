@@ -2,13 +2,18 @@ from googleapiclient.discovery import build
 from datetime import datetime
 from app.integrations.google_auth import get_credentials
 from app.models.models import Event
-from app.db import async_session
-import pytz
+from app.config import config
+from app.scheduler.reminder_queue import reminder_queue
+from app.utils.tz import get_zone, utc_now
 
-from app.repositories.event_repo import exists_event
+from app.repositories.event_repo import insert_imported_events
+from app.repositories.tag_repo import get_or_create_category, get_or_create_tags
 
+# Найбільший розмір сторінки events.list у Google Calendar API
+GOOGLE_PAGE_SIZE = 2500
 
-async def export_event(user_id: int, title: str, date, time, description=""):
+
+async def export_event(user_id: int, title: str, date, time, description="", tz: str | None = None):
     """
     Експортує одну подію до Google Calendar для вказаного користувача.
 
@@ -18,6 +23,7 @@ async def export_event(user_id: int, title: str, date, time, description=""):
         date (date): Дата події.
         time (time): Час події.
         description (str, optional): Опис події.
+        tz (str | None): Часовий пояс користувача (за замовчуванням — з конфігурації).
 
     Returns:
         str: Посилання на створену подію в Google Calendar.
@@ -27,26 +33,30 @@ async def export_event(user_id: int, title: str, date, time, description=""):
 
     start = datetime.combine(date, time).isoformat()
     end = datetime.combine(date, time).isoformat()
+    zone_name = get_zone(tz).key
 
     event = {
         "summary": title,
         "description": description,
-        "start": {"dateTime": start, "timeZone": "Europe/Kyiv"},
-        "end": {"dateTime": end, "timeZone": "Europe/Kyiv"},
+        "start": {"dateTime": start, "timeZone": zone_name},
+        "end": {"dateTime": end, "timeZone": zone_name},
     }
 
     created = service.events().insert(calendarId="primary", body=event).execute()
     return created.get("htmlLink")
 
 
-async def import_events_from_google(user):
+async def import_events_from_google(session, user):
     """
     Імпортує найближчі події з Google Calendar користувача в локальну базу.
 
-    Перевіряє події на унікальність (за user_id, title і date),
-    додає лише нові події.
+    Події Google читаються посторінково (до 2500 за запит). Дублікати
+    відсікаються в БД за ID події Google (`uq_events_user_google_event_id`),
+    тож усі події вставляються кількома масовими запитами, а повторний або
+    паралельний імпорт не створює копій.
 
     Args:
+        session: SQLAlchemy сесія.
         user: Об'єкт користувача з атрибутами .id та .telegram_id
 
     Returns:
@@ -55,46 +65,56 @@ async def import_events_from_google(user):
     creds = get_credentials(user.telegram_id)
     service = build("calendar", "v3", credentials=creds)
 
-    now = datetime.utcnow().isoformat() + "Z"  # Поточний час у форматі RFC3339
-    events_result = service.events().list(
-        calendarId="primary",
-        timeMin=now,
-        maxResults=50,
-        singleEvents=True,
-        orderBy="startTime"
-    ).execute()
-
-    items = events_result.get("items", [])
-    imported_count = 0
-
-    async with async_session() as session:
-        for item in items:
-            summary = item.get("summary", "").lower()
-            event_type = item.get("eventType", "")
-
-            if item.get("status") == "cancelled" or "birthday" in summary or event_type == "birthday":
-                continue
-
-            title = item.get("summary", item.get("title", ""))
-            description = item.get("description", "")
-            start = item["start"].get("dateTime") or item["start"].get("date")
-            date_obj = datetime.fromisoformat(start).astimezone(pytz.timezone("Europe/Kyiv"))
-
-            if await exists_event(session, user.id, title, date_obj.date(), date_obj.time()):
-                continue
-
-            new_event = Event(
-                user_id=user.id,
-                title=title,
-                date=date_obj.date(),
-                time=date_obj.time(),
-                description=description,
-                category="Імпорт",
-                tag="google"
-            )
-            session.add(new_event)
-            imported_count += 1
-
-        await session.commit()
-
-    return imported_count
+    now = utc_now().isoformat()  # Поточний час у форматі RFC3339
+    items = []
+    page_token = None
+    while True:
+        events_result = service.events().list(
+            calendarId="primary",
+            timeMin=now,
+            maxResults=GOOGLE_PAGE_SIZE,
+            singleEvents=True,
+            orderBy="startTime",
+            pageToken=page_token,
+        ).execute()
+        items += events_result.get("items", [])
+        page_token = events_result.get("nextPageToken")
+        if not page_token:
+            break
+
+    category = await get_or_create_category(session, user.id, "Імпорт")
+    tags = await get_or_create_tags(session, user.id, ["google"])
+
+    candidates = []
+    for item in items:
+        summary = item.get("summary", "").lower()
+        event_type = item.get("eventType", "")
+
+        if item.get("status") == "cancelled" or "birthday" in summary or event_type == "birthday":
+            continue
+
+        title = item.get("summary", item.get("title", ""))
+        description = item.get("description", "")
+        start = item["start"].get("dateTime") or item["start"].get("date")
+        date_obj = datetime.fromisoformat(start).astimezone(get_zone(user.timezone))
+
+        new_event = Event(
+            user_id=user.id,
+            title=title,
+            date=date_obj.date(),
+            time=date_obj.time(),
+            description=description,
+            category_id=category.id,
+            google_event_id=item["id"],
+        )
+        # Подія не додається в сесію: лише розраховуються starts_at і нагадування
+        new_event.sync_reminders(user.timezone, config.scheduler.notification_times)
+        candidates.append(new_event)
+
+    imported, reminders = await insert_imported_events(session, candidates, [tag.id for tag in tags])
+    await session.commit()
+
+    for reminder_id, fire_at, event_id in reminders:
+        reminder_queue.schedule(reminder_id, fire_at, event_id)
+
+    return imported
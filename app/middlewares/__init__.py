@@ -0,0 +1,5 @@
+from .db_session import DbSessionMiddleware
+from .i18n import I18nMiddleware
+from .reachability import ReachabilityMiddleware
+
+__all__ = ["DbSessionMiddleware", "I18nMiddleware", "ReachabilityMiddleware"]
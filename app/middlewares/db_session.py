@@ -0,0 +1,66 @@
+import logging
+from contextvars import ContextVar
+from typing import Any, Awaitable, Callable
+
+from aiogram import BaseMiddleware
+from aiogram.types import TelegramObject
+from sqlalchemy import event
+
+from app.config import config
+from app.db import async_session, engine
+from app.repositories.user_repo import get_cached_user
+from app.scheduler.metrics import scheduler_metrics
+
+# Лічильник SQL-запитів поточного оновлення (None — поза обробкою оновлення, напр. у планувальнику)
+_update_queries: ContextVar[list[int] | None] = ContextVar("update_queries", default=None)
+
+
+@event.listens_for(engine.sync_engine, "before_cursor_execute")
+def _count_query(conn, cursor, statement, parameters, context, executemany):
+    counter = _update_queries.get()
+    if counter is not None:
+        counter[0] += 1
+
+
+class DbSessionMiddleware(BaseMiddleware):
+    """
+    Відкриває одну сесію БД на оновлення і один раз визначає користувача.
+
+    Обробники отримують аргументи `session` (AsyncSession) та `user`
+    (User або None, якщо користувач ще не зареєстрований) замість того,
+    щоб відкривати власні сесії й повторно шукати користувача.
+    Користувач береться з кешу процесу (`user_cache`), тож зазвичай
+    жодного запиту для цього не потрібно.
+
+    Рахує SQL-запити, виконані під час обробки оновлення: кількість
+    потрапляє в гістограму `update_queries`, а перевищення
+    `config.bot.update_query_warn` пишеться в лог.
+
+    Реєструється як outer-middleware на `dp.update` першою з власних.
+    """
+
+    async def __call__(
+        self,
+        handler: Callable[[TelegramObject, dict[str, Any]], Awaitable[Any]],
+        event: TelegramObject,
+        data: dict[str, Any],
+    ) -> Any:
+        from_user = data.get("event_from_user")
+        counter = [0]
+        token = _update_queries.set(counter)
+        try:
+            async with async_session() as session:
+                data["session"] = session
+                data["user"] = (
+                    await get_cached_user(session, from_user.id)
+                    if from_user is not None and not from_user.is_bot else None
+                )
+                return await handler(event, data)
+        finally:
+            _update_queries.reset(token)
+            scheduler_metrics.update_queries.observe(counter[0])
+            if counter[0] > config.bot.update_query_warn:
+                logging.warning(
+                    f"[DB] {counter[0]} queries for one {getattr(event, 'event_type', type(event).__name__)} "
+                    f"update from {from_user.id if from_user else '-'}"
+                )
@@ -0,0 +1,32 @@
+from typing import Any, Awaitable, Callable
+
+from aiogram import BaseMiddleware
+from aiogram.types import TelegramObject
+
+from app.utils.i18n import reset_current_lang, resolve_lang, set_current_lang
+
+
+class I18nMiddleware(BaseMiddleware):
+    """
+    Визначає мову інтерфейсу один раз на оновлення.
+
+    Мова береться з користувача, якого вже завантажила `DbSessionMiddleware`
+    (з кешу процесу), тож окремого запиту до БД немає. Обробники отримують
+    її як аргумент `lang`, а `L()` без явної мови використовує її автоматично.
+
+    Реєструється як outer-middleware на `dp.update` після `DbSessionMiddleware`.
+    """
+
+    async def __call__(
+        self,
+        handler: Callable[[TelegramObject, dict[str, Any]], Awaitable[Any]],
+        event: TelegramObject,
+        data: dict[str, Any],
+    ) -> Any:
+        lang = resolve_lang(data.get("user"), data.get("event_from_user"))
+        data["lang"] = lang
+        token = set_current_lang(lang)
+        try:
+            return await handler(event, data)
+        finally:
+            reset_current_lang(token)
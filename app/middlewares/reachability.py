@@ -0,0 +1,49 @@
+import logging
+from typing import Any, Awaitable, Callable
+
+from aiogram import BaseMiddleware
+from aiogram.types import TelegramObject, Update
+
+from app.repositories.user_repo import mark_user_reachable, mark_users_unreachable
+from app.utils.tz import utc_now
+
+
+class ReachabilityMiddleware(BaseMiddleware):
+    """
+    Відстежує, чи можна надсилати користувачу нагадування.
+
+    Будь-яке оновлення від користувача знову робить його досяжним
+    (після розблокування бота або повернення в чат). Оновлення
+    `my_chat_member` зі статусом 'kicked' означає, що бот заблоковано, —
+    користувач позначається недосяжним одразу, не чекаючи помилки надсилання.
+
+    Реєструється як outer-middleware на `dp.update` після `DbSessionMiddleware`
+    і використовує її сесію та вже завантаженого користувача, тож для
+    досяжних користувачів запитів до БД не виконує.
+    """
+
+    async def __call__(
+        self,
+        handler: Callable[[TelegramObject, dict[str, Any]], Awaitable[Any]],
+        event: TelegramObject,
+        data: dict[str, Any],
+    ) -> Any:
+        from_user = data.get("event_from_user")
+        session = data.get("session")
+        if from_user is not None and not from_user.is_bot and session is not None:
+            try:
+                await self._sync(event, session, data.get("user"), from_user.id)
+            except Exception as e:
+                await session.rollback()
+                logging.warning(f"[Reachability] Failed to update user {from_user.id}: {e}")
+        return await handler(event, data)
+
+    @staticmethod
+    async def _sync(event: TelegramObject, session, user, telegram_id: int):
+        member = event.my_chat_member if isinstance(event, Update) else None
+        if member is not None and member.new_chat_member.status == "kicked":
+            await mark_users_unreachable(session, [telegram_id], utc_now())
+            await session.commit()
+            logging.info(f"[Reachability] User {telegram_id} blocked the bot")
+        elif user is not None and await mark_user_reachable(session, user):
+            logging.info(f"[Reachability] User {telegram_id} is reachable again")
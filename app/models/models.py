@@ -1,10 +1,16 @@
-from datetime import datetime, time as dt_time, date
+from datetime import datetime, time as dt_time, date, timedelta
 from typing import Optional
 
-from sqlalchemy import String, Text, Integer, ForeignKey, DateTime, Boolean, Date, Time, Enum
+from sqlalchemy import (
+    DDL, String, Text, Integer, ForeignKey, Boolean, Date, Time, Enum, Index, UniqueConstraint, JSON,
+    Table, Column, event, text,
+)
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from app.db import Base
+from app.config import config
+from app.db import Base, UtcDateTime
+from app.utils.recurrence import RECURRING_REPEATS, first_remind_at
+from app.utils.tz import utc_now, to_utc
 
 
 class User(Base):
@@ -18,6 +24,10 @@ class User(Base):
         first_name (str | None): Ім'я користувача.
         last_name (str | None): Прізвище користувача.
         language (str): Обрана мова ('uk' або 'en').
+        timezone (str): Часовий пояс IANA (наприклад, 'Europe/Kyiv').
+        is_reachable (bool): Чи можна надсилати користувачу повідомлення
+            (False, якщо бот заблокований або акаунт видалено).
+        blocked_at (datetime | None): Коли користувач став недосяжним (UTC).
         created_at (datetime): Дата реєстрації.
         events (list[Event]): Список подій користувача.
     """
@@ -29,6 +39,9 @@ class User(Base):
     first_name: Mapped[Optional[str]] = mapped_column(String(64), nullable=True)
     last_name: Mapped[Optional[str]] = mapped_column(String(64), nullable=True)
     language: Mapped[str] = mapped_column(default="uk")
+    timezone: Mapped[str] = mapped_column(String(64), default=lambda: config.scheduler.timezone)
+    is_reachable: Mapped[bool] = mapped_column(default=True)
+    blocked_at: Mapped[Optional[datetime]] = mapped_column(UtcDateTime, nullable=True)
 
     created_at: Mapped[datetime] = mapped_column(default=datetime.utcnow)
 
@@ -44,18 +57,49 @@ class Event(Base):
         user_id (int): Зовнішній ключ до таблиці users.
         title (str): Назва події.
         description (str | None): Опис події.
-        date (date): Дата події.
+        date (date): Дата події (місцева для користувача).
         time (time | None): Час події (може бути відсутній).
+        starts_at (datetime): Момент початку в UTC; обчислюється з `date`, `time`
+            і часового поясу користувача під час запису (подія без часу — опівночі).
         created_at (datetime): Дата створення події.
-        category (str | None): Категорія події.
-        tag (str | None): Теги події.
+        category_id (int | None): Зовнішній ключ до таблиці categories.
         is_done (bool): Статус виконання.
-        remind_before (int): За скільки хвилин надсилати нагадування.
         repeat (str | None): Тип повторення ('none', 'daily', 'weekly', 'monthly', 'yearly').
-        notified (bool): Чи було вже надіслано нагадування.
+            Для повторюваних подій `date` — дата першого входження серії,
+            а інші входження розгортаються віртуально.
+        repeat_until (date | None): Остання дата серії.
+        repeat_exceptions (list[str] | None): Пропущені дати серії (ISO).
+        google_event_id (str | None): ID події в Google Calendar, якщо її імпортовано.
         user (User): Об'єкт користувача (власник події).
+        reminders (list[EventReminder]): Нагадування події, по одному на кожен відступ.
+        category_ref (Category | None): Категорія (завантажується разом з подією).
+        tags (list[Tag]): Теги події (завантажуються одним додатковим запитом).
+        category (str | None): Назва категорії для відображення.
+        tag (str | None): Теги через кому для відображення.
     """
     __tablename__ = "events"
+    __table_args__ = (
+        Index("ix_events_user_starts_at", "user_id", "starts_at"),
+        Index("ix_events_user_date_time", "user_id", "date", "time"),
+        Index("ix_events_user_repeat_date", "user_id", "repeat", "date"),
+        # Імпорт з Google: повторний імпорт тієї самої події відсікається обмеженням
+        UniqueConstraint("user_id", "google_event_id", name="uq_events_user_google_event_id"),
+        Index(
+            "ix_events_pending_starts_at",
+            "starts_at",
+            postgresql_where=text("is_done = false AND time IS NOT NULL"),
+            sqlite_where=text("is_done = 0 AND time IS NOT NULL"),
+        ),
+        # /done: невиконані події користувача за день; включені колонки дають index-only scan
+        Index(
+            "ix_events_user_open_starts_at",
+            "user_id",
+            "starts_at",
+            postgresql_include=["id", "title", "date", "time", "repeat", "category_id", "is_done"],
+            postgresql_where=text("is_done = false"),
+            sqlite_where=text("is_done = 0"),
+        ),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True)
     user_id: Mapped[int] = mapped_column(ForeignKey("users.id", ondelete="CASCADE"))
@@ -65,19 +109,287 @@ class Event(Base):
 
     date: Mapped[date]
     time: Mapped[Optional[dt_time]] = mapped_column(nullable=True)
+    starts_at: Mapped[datetime] = mapped_column(UtcDateTime)
     created_at: Mapped[datetime] = mapped_column(default=datetime.utcnow)
 
-    category: Mapped[Optional[str]] = mapped_column(String(64), nullable=True)
-    tag: Mapped[Optional[str]] = mapped_column(String(64), nullable=True)
+    category_id: Mapped[Optional[int]] = mapped_column(
+        ForeignKey("categories.id", ondelete="SET NULL"), nullable=True, index=True
+    )
 
     is_done: Mapped[bool] = mapped_column(default=False)
-    remind_before: Mapped[int] = mapped_column(default=10)
 
     repeat: Mapped[Optional[str]] = mapped_column(
         Enum("none", "daily", "weekly", "monthly", "yearly", name="repeat_enum"),
         default="none"
     )
-
-    notified: Mapped[bool] = mapped_column(default=False)
+    repeat_until: Mapped[Optional[date]] = mapped_column(nullable=True)
+    repeat_exceptions: Mapped[Optional[list[str]]] = mapped_column(JSON, nullable=True)
+    google_event_id: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
 
     user: Mapped["User"] = relationship(back_populates="events")
+    reminders: Mapped[list["EventReminder"]] = relationship(
+        back_populates="event",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+        order_by="EventReminder.offset",
+    )
+    category_ref: Mapped[Optional["Category"]] = relationship(lazy="joined")
+    tags: Mapped[list["Tag"]] = relationship(secondary="event_tags", lazy="selectin", order_by="Tag.name")
+
+    @property
+    def category(self) -> str | None:
+        """Назва категорії для відображення."""
+        return self.category_ref.name if self.category_ref else None
+
+    @property
+    def tag(self) -> str | None:
+        """Теги через кому для відображення."""
+        return ", ".join(t.name for t in self.tags) or None
+
+    @property
+    def is_recurring(self) -> bool:
+        """Чи є подія серією, що повторюється."""
+        return self.repeat in RECURRING_REPEATS
+
+    @property
+    def remind_offsets(self) -> list[int]:
+        """Відступи нагадувань у хвилинах (потребує завантажених `reminders`)."""
+        return [r.offset for r in self.reminders]
+
+    def sync_reminders(self, tz: str | None, offsets: list[int] | None = None, now: datetime | None = None):
+        """
+        Перебудовує нагадування після зміни дати, часу, відступів, правила повторення
+        або часового поясу користувача.
+
+        Спершу оновлює `starts_at`, тож перетворення часу виконується один раз
+        під час запису, а не під час кожного проходу планувальника. Відступи, яких більше немає, видаляються, нові — додаються, а `fire_at`
+        усіх нагадувань перераховується. Для серії обирається найближче входження,
+        нагадування про яке ще не минуло. Нагадування, чий `fire_at` не змінився,
+        зберігають `sent_at`, тож уже надіслані не повторюються. Якщо кілька нових
+        або перенесених нагадувань звичайної події вже минули, надсилається лише
+        найпізніше з них (і лише поки подія не почалась і пізніше нагадування
+        ще не надсилалось), решта позначаються як пропущені.
+
+        Args:
+            tz (str | None): Часовий пояс користувача.
+            offsets (list[int] | None): Нові відступи у хвилинах; None — залишити поточні.
+            now (datetime | None): Поточний час (aware).
+        """
+        now = now or utc_now()
+        self.starts_at = to_utc(self.date, self.time, tz)
+        if offsets is None:
+            offsets = self.remind_offsets
+        offsets = sorted({o for o in offsets if o > 0}) if self.time else []
+
+        existing = {r.offset: r for r in self.reminders}
+        self.reminders = [existing.get(o) or EventReminder(offset=o) for o in offsets]
+        if not offsets:
+            return
+
+        start = self.starts_at
+        missed = []
+        last_sent = None
+        for reminder in self.reminders:
+            if self.is_recurring:
+                fire_at = first_remind_at(self, reminder.offset, now, tz)
+                if fire_at is None:
+                    # Серія закінчилась — нагадування закривається
+                    reminder.fire_at = reminder.fire_at or start - timedelta(minutes=reminder.offset)
+                    reminder.sent_at = reminder.sent_at or now
+                    continue
+            else:
+                fire_at = start - timedelta(minutes=reminder.offset)
+
+            if fire_at == reminder.fire_at:
+                # Нагадування не змінилось: надіслане лишається надісланим
+                if reminder.sent_at is not None and (last_sent is None or fire_at > last_sent):
+                    last_sent = fire_at
+                continue
+
+            reminder.fire_at = fire_at
+            reminder.sent_at = None
+            if not self.is_recurring and fire_at < now:
+                missed.append(reminder)
+
+        # Відступи відсортовані за зростанням, тож перше пропущене — найпізніше
+        keep = None
+        if missed and start > now and (last_sent is None or missed[0].fire_at > last_sent):
+            keep = missed[0]
+        for reminder in missed:
+            if reminder is not keep:
+                reminder.sent_at = now
+
+
+# Повнотекстовий пошук (див. міграцію 4dd41e27086b): згенерована колонка PostgreSQL
+# і FTS5-таблиця SQLite не відображені в моделі, тож `create_all` додає їх окремо
+SEARCH_VECTOR = (
+    "setweight(to_tsvector('english', coalesce(title, '')), 'A') || "
+    "setweight(to_tsvector('simple', coalesce(title, '')), 'A') || "
+    "setweight(to_tsvector('english', coalesce(description, '')), 'B') || "
+    "setweight(to_tsvector('simple', coalesce(description, '')), 'B')"
+)
+
+POSTGRES_SEARCH_DDL = [
+    f"ALTER TABLE events ADD COLUMN search_vector tsvector GENERATED ALWAYS AS ({SEARCH_VECTOR}) STORED",
+    "CREATE INDEX ix_events_search_vector ON events USING gin (search_vector)",
+]
+
+# Зовнішня FTS5-таблиця над events, синхронізується тригерами
+SQLITE_SEARCH_DDL = [
+    "CREATE VIRTUAL TABLE IF NOT EXISTS events_fts "
+    "USING fts5(title, description, content='events', content_rowid='id')",
+    "CREATE TRIGGER events_fts_ai AFTER INSERT ON events BEGIN "
+    "INSERT INTO events_fts(rowid, title, description) VALUES (new.id, new.title, new.description); END",
+    "CREATE TRIGGER events_fts_ad AFTER DELETE ON events BEGIN "
+    "INSERT INTO events_fts(events_fts, rowid, title, description) "
+    "VALUES ('delete', old.id, old.title, old.description); END",
+    "CREATE TRIGGER events_fts_au AFTER UPDATE OF title, description ON events BEGIN "
+    "INSERT INTO events_fts(events_fts, rowid, title, description) "
+    "VALUES ('delete', old.id, old.title, old.description); "
+    "INSERT INTO events_fts(rowid, title, description) VALUES (new.id, new.title, new.description); END",
+]
+
+for _statement in POSTGRES_SEARCH_DDL:
+    event.listen(Event.__table__, "after_create", DDL(_statement).execute_if(dialect="postgresql"))
+for _statement in SQLITE_SEARCH_DDL:
+    event.listen(Event.__table__, "after_create", DDL(_statement).execute_if(dialect="sqlite"))
+# Тригери зникають разом з events, а віртуальна таблиця — ні
+event.listen(Event.__table__, "after_drop", DDL("DROP TABLE IF EXISTS events_fts").execute_if(dialect="sqlite"))
+
+
+class Category(Base):
+    """
+    Категорія подій користувача (довідник, одна назва — один рядок).
+
+    Атрибути:
+        id (int): Унікальний ID категорії.
+        user_id (int): Зовнішній ключ до таблиці users.
+        name (str): Назва в нижньому регістрі.
+    """
+    __tablename__ = "categories"
+    __table_args__ = (
+        UniqueConstraint("user_id", "name", name="uq_categories_user_name"),
+    )
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    user_id: Mapped[int] = mapped_column(ForeignKey("users.id", ondelete="CASCADE"))
+    name: Mapped[str] = mapped_column(String(64))
+
+
+class Tag(Base):
+    """
+    Тег подій користувача; з подіями пов'язаний через таблицю `event_tags`.
+
+    Атрибути:
+        id (int): Унікальний ID тегу.
+        user_id (int): Зовнішній ключ до таблиці users.
+        name (str): Назва в нижньому регістрі, без '#'.
+    """
+    __tablename__ = "tags"
+    __table_args__ = (
+        UniqueConstraint("user_id", "name", name="uq_tags_user_name"),
+    )
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    user_id: Mapped[int] = mapped_column(ForeignKey("users.id", ondelete="CASCADE"))
+    name: Mapped[str] = mapped_column(String(64))
+
+
+# Зв'язок подій і тегів: первинний ключ обслуговує подія -> теги, індекс — тег -> події
+event_tags = Table(
+    "event_tags",
+    Base.metadata,
+    Column("event_id", ForeignKey("events.id", ondelete="CASCADE"), primary_key=True),
+    Column("tag_id", ForeignKey("tags.id", ondelete="CASCADE"), primary_key=True),
+    Index("ix_event_tags_tag_id_event_id", "tag_id", "event_id"),
+)
+
+
+class EventReminder(Base):
+    """
+    Нагадування про подію за `offset` хвилин до її початку.
+
+    Для звичайної події після надсилання заповнюється `sent_at`;
+    для серії `fire_at` переноситься на наступне входження, а `sent_at`
+    заповнюється лише коли серія закінчилась. Очікувані нагадування
+    (`sent_at IS NULL`) обираються планувальником за частковим індексом по `fire_at`.
+
+    Атрибути:
+        id (int): Унікальний ID нагадування.
+        event_id (int): Зовнішній ключ до таблиці events.
+        offset (int): За скільки хвилин до події надіслати нагадування.
+        fire_at (datetime): Момент наступного надсилання (UTC).
+        sent_at (datetime | None): Час надсилання (або пропуску) нагадування (UTC).
+        event (Event): Подія, до якої належить нагадування.
+    """
+    __tablename__ = "event_reminders"
+    __table_args__ = (
+        UniqueConstraint("event_id", "offset", name="uq_event_reminders_event_offset"),
+        Index(
+            "ix_event_reminders_pending",
+            "fire_at",
+            postgresql_where=text("sent_at IS NULL"),
+            sqlite_where=text("sent_at IS NULL"),
+        ),
+    )
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    event_id: Mapped[int] = mapped_column(ForeignKey("events.id", ondelete="CASCADE"))
+
+    offset: Mapped[int]
+    fire_at: Mapped[datetime] = mapped_column(UtcDateTime)
+    sent_at: Mapped[Optional[datetime]] = mapped_column(UtcDateTime, nullable=True)
+
+    event: Mapped["Event"] = relationship(back_populates="reminders")
+
+
+class ReminderOutbox(Base):
+    """
+    Черга доставки нагадувань (transactional outbox).
+
+    Запис створюється планувальником у тій самій транзакції, що й позначка
+    `EventReminder.sent_at`, а потім доставляється воркером з повторами та
+    експоненційною затримкою.
+
+    Атрибути:
+        id (int): Унікальний ID запису.
+        event_id (int): Зовнішній ключ до таблиці events.
+        reminder_id (int | None): Зовнішній ключ до таблиці event_reminders.
+        fire_at (datetime): Запланований час нагадування (UTC).
+        attempts (int): Кількість виконаних спроб доставки.
+        next_attempt_at (datetime): Час наступної спроби (UTC).
+        last_error (str | None): Текст останньої помилки.
+        status (str): Статус доставки ('pending', 'sent', 'failed').
+        created_at (datetime): Дата створення запису.
+        sent_at (datetime | None): Час успішної доставки (UTC).
+    """
+    __tablename__ = "reminder_outbox"
+    __table_args__ = (
+        UniqueConstraint("reminder_id", "fire_at", name="uq_reminder_outbox_reminder_fire_at"),
+        Index(
+            "ix_reminder_outbox_pending",
+            "next_attempt_at",
+            postgresql_where=text("status = 'pending'"),
+            sqlite_where=text("status = 'pending'"),
+        ),
+        Index("ix_reminder_outbox_event_id", "event_id"),
+    )
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    event_id: Mapped[int] = mapped_column(ForeignKey("events.id", ondelete="CASCADE"))
+    reminder_id: Mapped[Optional[int]] = mapped_column(
+        ForeignKey("event_reminders.id", ondelete="CASCADE"), nullable=True
+    )
+
+    fire_at: Mapped[datetime] = mapped_column(UtcDateTime)
+    attempts: Mapped[int] = mapped_column(default=0)
+    next_attempt_at: Mapped[datetime] = mapped_column(UtcDateTime)
+    last_error: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+
+    status: Mapped[str] = mapped_column(
+        Enum("pending", "sent", "failed", name="outbox_status_enum"),
+        default="pending"
+    )
+
+    created_at: Mapped[datetime] = mapped_column(default=datetime.utcnow)
+    sent_at: Mapped[Optional[datetime]] = mapped_column(UtcDateTime, nullable=True)
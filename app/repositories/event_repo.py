@@ -1,11 +1,105 @@
-from sqlalchemy import select, and_
+from sqlalchemy import (
+    select, update, delete, and_, or_, true, tuple_, func, cast, literal, literal_column, table, column,
+    insert as sa_insert,
+)
+from sqlalchemy.dialects.postgresql import REGCONFIG, insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import selectinload
 from datetime import date, timedelta, time, datetime
-from app.models.models import Event
+from app.config import config
+from app.models.models import Category, Event, EventReminder, Tag, event_tags
+from app.repositories.tag_repo import normalize_name
+from app.scheduler.reminder_queue import reminder_queue
+from app.utils.recurrence import RECURRING_REPEATS, Occurrence, expand_event
+from app.utils.tz import day_range_utc, get_zone, local_now, to_utc, utc_now
+
+# Курсор сторінки: (starts_at, id) останнього показаного запису
+Cursor = tuple[datetime, int]
+
+# Конфігурація повнотекстового пошуку PostgreSQL за мовою користувача
+# (української конфігурації в PostgreSQL немає — 'simple' без стемінгу)
+SEARCH_CONFIGS = {"en": "english"}
+DEFAULT_SEARCH_CONFIG = "simple"
+
+# Згенерована колонка (PostgreSQL) і FTS5-таблиця (SQLite) не відображені в моделі,
+# бо існують лише в одному з діалектів
+_search_vector = literal_column("events.search_vector")
+_events_fts = table("events_fts", column("rowid"))
+
+
+def _is_recurring():
+    """SQL-умова: подія є серією."""
+    return Event.repeat.in_(RECURRING_REPEATS)
+
+
+def _is_single():
+    """SQL-умова: подія не повторюється."""
+    return or_(Event.repeat.is_(None), Event.repeat.notin_(RECURRING_REPEATS))
+
+
+def _series_active_between(start: date, end: date):
+    """SQL-умова: серія має входження, що можуть потрапити у вікно [start, end]."""
+    return and_(
+        _is_recurring(),
+        Event.date <= end,
+        or_(Event.repeat_until.is_(None), Event.repeat_until >= start),
+    )
+
+
+def _after(cursor: Cursor | None):
+    """
+    SQL-умова keyset-пагінації: рядки, що йдуть після курсора в порядку (starts_at, id).
+
+    Окрема умова `starts_at >= ...` дозволяє почати діапазонне сканування
+    індексу `(user_id, starts_at)` одразу з позиції курсора.
+    """
+    if cursor is None:
+        return true()
+    starts_at, event_id = cursor
+    return and_(
+        Event.starts_at >= starts_at,
+        tuple_(Event.starts_at, Event.id) > tuple_(starts_at, event_id),
+    )
+
+
+def _page(items: list, limit: int, key) -> tuple[list, Cursor | None]:
+    """Відрізає сторінку з `limit + 1` записів і повертає курсор, якщо є наступна."""
+    if len(items) <= limit:
+        return items, None
+    items = items[:limit]
+    return items, key(items[-1])
+
+
+def _event_key(event) -> Cursor:
+    return event.starts_at, event.id
+
+
+def _label_filters(user_id: int, category: str | None, tag: str | None) -> list:
+    """
+    SQL-умови фільтра за категорією та тегом (точний збіг нормалізованої назви).
+
+    Назва шукається за унікальним індексом `(user_id, name)` довідника, а події
+    тегу — за індексом `event_tags (tag_id, event_id)`, без сканування рядків.
+    """
+    filters = []
+    if category:
+        filters.append(Event.category_id == (
+            select(Category.id)
+            .where(Category.user_id == user_id, Category.name == normalize_name(category))
+            .scalar_subquery()
+        ))
+    if tag:
+        filters.append(Event.id.in_(
+            select(event_tags.c.event_id)
+            .join(Tag, Tag.id == event_tags.c.tag_id)
+            .where(Tag.user_id == user_id, Tag.name == normalize_name(tag))
+        ))
+    return filters
 
 
 async def get_event_by_id(session, event_id: int):
     """
-    Отримує подію за її унікальним ID.
+    Отримує подію за її унікальним ID разом з нагадуваннями.
 
     Args:
         session: Активна сесія SQLAlchemy.
@@ -14,11 +108,13 @@ async def get_event_by_id(session, event_id: int):
     Returns:
         Event | None: Подія або None, якщо не знайдено.
     """
-    result = await session.execute(select(Event).where(Event.id == event_id))
+    result = await session.execute(
+        select(Event).where(Event.id == event_id).options(selectinload(Event.reminders))
+    )
     return result.scalar_one_or_none()
 
 
-async def get_events_by_user(session, user_id: int, ordered: bool = False):
+async def get_events_by_user(session, user_id: int, ordered: bool = False, with_reminders: bool = False):
     """
     Отримує всі події користувача.
 
@@ -26,6 +122,7 @@ async def get_events_by_user(session, user_id: int, ordered: bool = False):
         session: Активна сесія SQLAlchemy.
         user_id (int): ID користувача.
         ordered (bool): Чи сортувати події за датою і часом.
+        with_reminders (bool): Чи завантажувати нагадування подій (одним додатковим запитом).
 
     Returns:
         List[Event]: Список подій користувача.
@@ -33,41 +130,115 @@ async def get_events_by_user(session, user_id: int, ordered: bool = False):
     stmt = select(Event).where(Event.user_id == user_id)
     if ordered:
         stmt = stmt.order_by(Event.date, Event.time)
+    if with_reminders:
+        stmt = stmt.options(selectinload(Event.reminders))
 
     result = await session.execute(stmt)
     return result.scalars().all()
 
-async def get_upcoming_events_by_user(session, user_id: int, days_ahead: int = 90):
+
+async def get_events_by_user_page(session, user_id: int, after: Cursor | None = None, limit: int = 10):
+    """
+    Отримує сторінку подій користувача в порядку (starts_at, id).
+
+    Keyset-пагінація: наступна сторінка починається одразу після курсора,
+    тож пам'ять і час запиту залежать від розміру сторінки, а не від історії.
+
+    Args:
+        session: Активна сесія SQLAlchemy.
+        user_id (int): ID користувача.
+        after (Cursor | None): Курсор попередньої сторінки; None — перша сторінка.
+        limit (int): Розмір сторінки.
+
+    Returns:
+        Tuple[List[Event], Cursor | None]: Події сторінки та курсор наступної (None, якщо її немає).
+    """
+    stmt = (
+        select(Event)
+        .where(Event.user_id == user_id, _after(after))
+        .order_by(Event.starts_at, Event.id)
+        .limit(limit + 1)
+    )
+    result = await session.execute(stmt)
+    return _page(result.scalars().all(), limit, _event_key)
+
+
+async def get_upcoming_events_by_user(session, user_id: int, days_ahead: int = 90, tz: str | None = None):
     """
     Отримує майбутні події користувача на вказану кількість днів наперед.
 
+    Звичайні події обираються за `starts_at` (індекс `(user_id, starts_at)`).
+    Серії, що ще тривають, повертаються одним рядком (незалежно від дати першого входження).
+
     Args:
         session: Активна сесія SQLAlchemy.
         user_id (int): ID користувача.
         days_ahead (int): Кількість днів наперед для фільтрації.
+        tz (str | None): Часовий пояс користувача.
 
     Returns:
         List[Event]: Список майбутніх подій.
     """
-    today = date.today()
+    today = local_now(tz).date()
     limit_day = today + timedelta(days=days_ahead)
+    range_start, range_end = day_range_utc(today, limit_day, tz)
 
     stmt = select(Event).where(
         and_(
             Event.user_id == user_id,
-            Event.date >= today,
-            Event.date <= limit_day
+            or_(
+                and_(Event.starts_at >= range_start, Event.starts_at < range_end),
+                _series_active_between(today, limit_day),
+            )
         )
-    ).order_by(Event.date, Event.time)
+    ).order_by(Event.starts_at)
 
     result = await session.execute(stmt)
     return result.scalars().all()
 
 
-async def get_events_in_range(session, user_id: int, start: date, end: date, category=None, tag=None):
+async def get_upcoming_events_page(session, user_id: int, days_ahead: int = 90, tz: str | None = None,
+                                   after: Cursor | None = None, limit: int = 10):
+    """
+    Отримує сторінку майбутніх подій користувача (як `get_upcoming_events_by_user`).
+
+    Args:
+        session: Активна сесія SQLAlchemy.
+        user_id (int): ID користувача.
+        days_ahead (int): Кількість днів наперед для фільтрації.
+        tz (str | None): Часовий пояс користувача.
+        after (Cursor | None): Курсор попередньої сторінки; None — перша сторінка.
+        limit (int): Розмір сторінки.
+
+    Returns:
+        Tuple[List[Event], Cursor | None]: Події сторінки та курсор наступної (None, якщо її немає).
+    """
+    today = local_now(tz).date()
+    limit_day = today + timedelta(days=days_ahead)
+    range_start, range_end = day_range_utc(today, limit_day, tz)
+
+    stmt = select(Event).where(
+        Event.user_id == user_id,
+        or_(
+            and_(Event.starts_at >= range_start, Event.starts_at < range_end),
+            _series_active_between(today, limit_day),
+        ),
+        _after(after),
+    ).order_by(Event.starts_at, Event.id).limit(limit + 1)
+
+    result = await session.execute(stmt)
+    return _page(result.scalars().all(), limit, _event_key)
+
+
+async def get_events_in_range(session, user_id: int, start: date, end: date, category=None, tag=None,
+                              tz: str | None = None):
     """
     Отримує події у вказаному діапазоні дат з фільтрами за категорією і тегом.
 
+    Межі дат задаються в місцевому часі користувача і перетворюються на інтервал
+    `starts_at` в UTC. Повторювані події розгортаються у віртуальні входження
+    (`Occurrence`) лише в межах запитаного вікна.
+
     Args:
         session: Активна сесія SQLAlchemy.
         user_id (int): ID користувача.
@@ -75,52 +246,222 @@ async def get_events_in_range(session, user_id: int, start: date, end: date, cat
         end (date): Кінцева дата.
         category (str | None): Категорія для фільтрації.
         tag (str | None): Тег для фільтрації.
+        tz (str | None): Часовий пояс користувача.
 
     Returns:
-        List[Event]: Відфільтровані події.
+        List[Event | Occurrence]: Відфільтровані події та входження, впорядковані за датою і часом.
     """
+    range_start, range_end = day_range_utc(start, end, tz)
     filters = [
         Event.user_id == user_id,
-        Event.date >= start,
-        Event.date <= end
+        or_(
+            and_(Event.starts_at >= range_start, Event.starts_at < range_end),
+            _series_active_between(start, end),
+        )
     ]
-    if category:
-        filters.append(Event.category.ilike(f"%{category}%"))
-    if tag:
-        filters.append(Event.tag.ilike(f"%{tag}%"))
+    filters += _label_filters(user_id, category, tag)
 
     result = await session.execute(
-        select(Event).where(and_(*filters)).order_by(Event.date, Event.time)
+        select(Event).where(and_(*filters)).order_by(Event.starts_at)
     )
-    return result.scalars().all()
+    now = local_now(tz)
+    occurrences = [o for e in result.scalars().all() for o in expand_event(e, start, end, now)]
+    occurrences.sort(key=lambda o: (o.date, o.time or time.min))
+    return occurrences
 
 
-async def get_today_user_events(session, user_id: int, date: date, only_past: bool = True):
+async def get_first_event_date(session, user_id: int) -> date | None:
     """
-    Отримує події користувача на конкретну дату. За замовчуванням лише ті, що вже пройшли.
+    Повертає дату найранішої події користувача (для серії — дату першого входження).
+
+    Дає нижню межу для періоду "весь час" замість `date.min`; читається
+    з індексу `(user_id, date, time)`.
 
     Args:
         session: Активна сесія SQLAlchemy.
         user_id (int): ID користувача.
-        date (date): Дата, на яку фільтрувати події.
-        only_past (bool): Якщо True — лише ті, що були раніше поточного часу.
 
     Returns:
-        List[Event]: Список подій.
+        date | None: Дата або None, якщо подій немає.
     """
-    stmt = select(Event).where(
-        Event.user_id == user_id,
-        Event.date == date,
-        Event.is_done == False
+    result = await session.execute(select(func.min(Event.date)).where(Event.user_id == user_id))
+    return result.scalar()
+
+
+async def get_events_in_range_page(session, user_id: int, start: date, end: date, category=None, tag=None,
+                                   tz: str | None = None, after: Cursor | None = None, limit: int = 10):
+    """
+    Отримує сторінку подій і входжень серій у діапазоні дат (як `get_events_in_range`).
+
+    Звичайні події читаються keyset-запитом не більше `limit + 1` рядків.
+    Серії (їх у користувача небагато) розгортаються лише від дати курсора,
+    і з кожної береться не більше `limit + 1` входжень, тож обсяг роботи
+    обмежений розміром сторінки. Ключ входження — його власний момент
+    початку в UTC та ID серії.
+
+    Args:
+        session: Активна сесія SQLAlchemy.
+        user_id (int): ID користувача.
+        start (date): Початкова дата.
+        end (date): Кінцева дата.
+        category (str | None): Категорія для фільтрації.
+        tag (str | None): Тег для фільтрації.
+        tz (str | None): Часовий пояс користувача.
+        after (Cursor | None): Курсор попередньої сторінки; None — перша сторінка.
+        limit (int): Розмір сторінки.
+
+    Returns:
+        Tuple[List[Event | Occurrence], Cursor | None]: Записи сторінки та курсор наступної.
+    """
+    range_start, range_end = day_range_utc(start, end, tz)
+    filters = [Event.user_id == user_id]
+    filters += _label_filters(user_id, category, tag)
+
+    singles = await session.execute(
+        select(Event).where(
+            *filters,
+            _is_single(),
+            Event.starts_at >= range_start,
+            Event.starts_at < range_end,
+            _after(after),
+        ).order_by(Event.starts_at, Event.id).limit(limit + 1)
     )
-    result = await session.execute(stmt)
+    items = list(singles.scalars().all())
+
+    def key(item) -> Cursor:
+        if isinstance(item, Occurrence):
+            return to_utc(item.date, item.time, tz), item.id
+        return item.starts_at, item.id
+
+    series = await session.execute(select(Event).where(*filters, _series_active_between(start, end)))
+    expand_from = max(start, after[0].astimezone(get_zone(tz)).date()) if after else start
+    now = local_now(tz)
+    for event in series.scalars().all():
+        occurrences = [o for o in expand_event(event, expand_from, end, now) if not after or key(o) > after]
+        items += occurrences[:limit + 1]
+
+    items.sort(key=key)
+    return _page(items, limit, key)
+
+
+async def search_events(session, user_id: int, query: str, lang: str = "uk", offset: int = 0, limit: int = 10):
+    """
+    Шукає події користувача за назвою та описом, найрелевантніші першими.
+
+    PostgreSQL: згенерована колонка `search_vector` з GIN-індексом, запит
+    розбирається `websearch_to_tsquery` у конфігурації мови користувача,
+    ранг — `ts_rank_cd` (збіг у назві важить більше, ніж в описі).
+    SQLite: FTS5-таблиця `events_fts`, ранг — `bm25`.
+
+    Ранжування потребує всіх збігів, тож сторінки задаються зсувом; курсор
+    за рангом не зменшив би роботу.
+
+    Args:
+        session: Активна сесія SQLAlchemy.
+        user_id (int): ID користувача.
+        query (str): Пошуковий запит.
+        lang (str): Мова користувача ('uk' або 'en').
+        offset (int): Кількість уже показаних результатів.
+        limit (int): Розмір сторінки.
+
+    Returns:
+        Tuple[List[Event], int | None]: Події сторінки та зсув наступної (None, якщо її немає).
+    """
+    if config.db.use_postgres:
+        tsquery = func.websearch_to_tsquery(
+            cast(literal(SEARCH_CONFIGS.get(lang, DEFAULT_SEARCH_CONFIG)), REGCONFIG), query
+        )
+        stmt = (
+            select(Event)
+            .where(Event.user_id == user_id, _search_vector.op("@@")(tsquery))
+            .order_by(func.ts_rank_cd(_search_vector, tsquery).desc(), Event.id.desc())
+        )
+    else:
+        stmt = (
+            select(Event)
+            .join(_events_fts, _events_fts.c.rowid == Event.id)
+            .where(Event.user_id == user_id, literal_column("events_fts").op("MATCH")(_fts5_query(query)))
+            .order_by(func.bm25(literal_column("events_fts")), Event.id.desc())
+        )
+
+    result = await session.execute(stmt.offset(offset).limit(limit + 1))
     events = result.scalars().all()
+    if len(events) <= limit:
+        return events, None
+    return events[:limit], offset + limit
+
+
+def _fts5_query(query: str) -> str:
+    """Перетворює запит користувача на FTS5: кожне слово — окремий термін у лапках (AND)."""
+    words = [word.replace('"', '""') for word in query.split()]
+    return " ".join(f'"{word}"' for word in words) or '""'
 
+
+def _today_filters(user_id: int, date: date, only_past: bool, tz: str | None) -> list:
+    """
+    SQL-умови для невиконаних одиничних подій користувача за місцеву дату.
+
+    Усі умови лягають на частковий індекс `ix_events_user_open_starts_at`:
+    `user_id` і діапазон `starts_at` — ключ, решта — включені колонки.
+    """
+    range_start, range_end = day_range_utc(date, date, tz)
+    filters = [
+        Event.user_id == user_id,
+        Event.starts_at >= range_start,
+        Event.starts_at < range_end,
+        Event.is_done == False,
+        _is_single(),
+    ]
     if only_past:
-        now_time = datetime.now().time()
-        return [e for e in events if e.time and e.time <= now_time]
+        filters += [Event.time.isnot(None), Event.starts_at <= utc_now()]
+    return filters
+
+
+async def get_today_user_events(session, user_id: int, date: date, only_past: bool = True,
+                                tz: str | None = None):
+    """
+    Отримує події користувача на конкретну дату. За замовчуванням лише ті, що вже пройшли.
+
+    Повторювані події не враховуються: їхні входження завершуються автоматично.
+
+    Args:
+        session: Активна сесія SQLAlchemy.
+        user_id (int): ID користувача.
+        date (date): Місцева дата, на яку фільтрувати події.
+        only_past (bool): Якщо True — лише події з часом, що вже почалися.
+        tz (str | None): Часовий пояс користувача.
+
+    Returns:
+        List[Event]: Список подій.
+    """
+    result = await session.execute(
+        select(Event).where(*_today_filters(user_id, date, only_past, tz)).order_by(Event.starts_at)
+    )
+    return result.scalars().all()
+
+
+async def get_passed_today_events(session, user_id: int, date: date, tz: str | None = None) -> list:
+    """
+    Отримує невиконані події за місцеву дату, час яких уже настав (для /done).
+
+    На відміну від `get_today_user_events` повертає лише колонки, потрібні
+    для відображення, без завантаження об'єктів `Event` і їхніх зв'язків.
 
-    return events
+    Args:
+        session: Активна сесія SQLAlchemy.
+        user_id (int): ID користувача.
+        date (date): Місцева дата.
+        tz (str | None): Часовий пояс користувача.
+
+    Returns:
+        List[Row]: Події (id, title, date, time, is_done, category, tag), впорядковані за часом.
+    """
+    result = await session.execute(
+        select(*_display_columns())
+        .where(*_today_filters(user_id, date, True, tz))
+        .order_by(Event.starts_at, Event.id)
+    )
+    return result.all()
 
 
 async def exists_event(session, user_id: int, title: str, date: date, time: time) -> bool:
@@ -147,28 +488,233 @@ async def exists_event(session, user_id: int, title: str, date: date, time: time
     return result.scalar_one_or_none() is not None
 
 
-async def mark_event_as_done(session, event_id: int, user_id: int) -> bool:
+async def insert_imported_events(session, events: list[Event], tag_ids: list[int] = ()):
     """
-    Позначає подію як виконану, якщо вона належить вказаному користувачу.
+    Масово вставляє імпортовані події, пропускаючи вже імпортовані раніше.
+
+    Події, імпортовані до появи `google_event_id` (колонка в них порожня),
+    розпізнаються за назвою, датою й часом і отримують ID події Google
+    замість повторної вставки (див. `_adopt_legacy_imports`).
+    Решту дублікатів відсікає унікальне обмеження `(user_id, google_event_id)`:
+    один багаторядковий `INSERT ... ON CONFLICT DO NOTHING RETURNING`
+    повертає лише справді вставлені події, тож паралельні імпорти не
+    створюють дублікатів, а кількість імпортованих точна. Нагадування
+    (вже розраховані `sync_reminders`) і теги вставляються ще двома
+    запитами. Зміни не фіксуються — це робить викликач.
 
     Args:
         session: Активна сесія SQLAlchemy.
-        event_id (int): ID події.
+        events (list[Event]): Нові (не додані в сесію) події з `google_event_id`.
+        tag_ids (list[int]): Теги, що призначаються кожній вставленій події.
+
+    Returns:
+        Tuple[int, List[Tuple[int, datetime, int]]]: Кількість вставлених подій та
+        (id, fire_at, event_id) їхніх очікуваних нагадувань для планувальника.
+    """
+    events = await _adopt_legacy_imports(session, events)
+    if not events:
+        return 0, []
+
+    created_at = datetime.utcnow()
+    rows = [
+        {
+            "user_id": e.user_id, "title": e.title, "description": e.description,
+            "date": e.date, "time": e.time, "starts_at": e.starts_at,
+            "category_id": e.category_id, "google_event_id": e.google_event_id,
+            "is_done": False, "repeat": e.repeat or "none", "created_at": created_at,
+        }
+        for e in events
+    ]
+    insert = pg_insert if config.db.use_postgres else sqlite_insert
+    result = await session.execute(
+        insert(Event)
+        .on_conflict_do_nothing(index_elements=["user_id", "google_event_id"])
+        .returning(Event.id, Event.google_event_id),
+        rows,
+    )
+    inserted = {google_id: event_id for event_id, google_id in result.all()}
+    if not inserted:
+        return 0, []
+
+    by_google_id = {e.google_event_id: e for e in events}
+    reminder_rows = [
+        {"event_id": event_id, "offset": r.offset, "fire_at": r.fire_at, "sent_at": r.sent_at}
+        for google_id, event_id in inserted.items()
+        for r in by_google_id[google_id].reminders
+    ]
+    pending = []
+    if reminder_rows:
+        result = await session.execute(
+            sa_insert(EventReminder).returning(
+                EventReminder.id, EventReminder.fire_at, EventReminder.event_id, EventReminder.sent_at
+            ),
+            reminder_rows,
+        )
+        pending = [
+            (reminder_id, fire_at, event_id)
+            for reminder_id, fire_at, event_id, sent_at in result.all() if sent_at is None
+        ]
+
+    if tag_ids:
+        await session.execute(
+            sa_insert(event_tags),
+            [{"event_id": event_id, "tag_id": tag_id} for event_id in inserted.values() for tag_id in tag_ids],
+        )
+    return len(inserted), pending
+
+
+async def _adopt_legacy_imports(session, events: list[Event]) -> list[Event]:
+    """
+    Прив'язує до Google події, імпортовані раніше без `google_event_id`.
+
+    NULL не конфліктує в унікальному обмеженні, тож такі події знаходяться
+    за (назва, дата, час) одним запитом, отримують ID події Google одним
+    масовим UPDATE і більше не вставляються; наступні імпорти відсікає вже
+    обмеження.
+
+    Returns:
+        list[Event]: Події, яких у користувача ще немає.
+    """
+    if not events:
+        return events
+    result = await session.execute(
+        select(Event.id, Event.title, Event.date, Event.time, Event.google_event_id).where(
+            Event.user_id == events[0].user_id,
+            or_(
+                and_(
+                    Event.google_event_id.is_(None),
+                    Event.title.in_({e.title for e in events}),
+                    Event.date.in_({e.date for e in events}),
+                ),
+                Event.google_event_id.in_([e.google_event_id for e in events]),
+            ),
+        )
+    )
+    legacy = {}
+    imported = set()
+    for event_id, title, day, at, google_id in result.all():
+        if google_id is None:
+            legacy.setdefault((title, day, at), []).append(event_id)
+        else:
+            imported.add(google_id)
+    if not legacy:
+        return events
+
+    adopted, remaining = [], []
+    for e in events:
+        ids = legacy.get((e.title, e.date, e.time))
+        # Подію з цим ID уже імпортовано — її відсіче обмеження, стару копію не чіпаємо
+        if ids and e.google_event_id not in imported:
+            adopted.append({"id": ids.pop(), "google_event_id": e.google_event_id})
+        else:
+            remaining.append(e)
+    if adopted:
+        await session.execute(update(Event), adopted)
+    return remaining
+
+
+def _display_columns():
+    """
+    Колонки, потрібні для відображення події в повідомленні (як у `simple_format_event`).
+
+    Категорія й теги читаються скалярними підзапитами, тож їх можна
+    повернути з `UPDATE/DELETE ... RETURNING` без окремого SELECT.
+    """
+    # SQLite рендерить RETURNING (разом з підзапитами) без імен таблиць, і `id` у підзапиті
+    # тегів означав би tags.id; колонки зовнішньої події тому названі явно
+    category = (
+        select(Category.name).where(Category.id == literal_column("events.category_id"))
+        .scalar_subquery()
+    )
+    tags = (
+        select(func.aggregate_strings(Tag.name, ", "))
+        .select_from(event_tags.join(Tag, Tag.id == event_tags.c.tag_id))
+        .where(event_tags.c.event_id == literal_column("events.id"))
+        .scalar_subquery()
+    )
+    return (
+        Event.id, Event.title, Event.date, Event.time, Event.is_done,
+        category.label("category"), tags.label("tag"),
+    )
+
+
+async def mark_events_done(session, event_ids: list[int], user_id: int) -> list:
+    """
+    Позначає події виконаними одним запитом `UPDATE ... RETURNING`.
+
+    Умова `user_id` одночасно перевіряє власника: чужі або неіснуючі ID
+    просто не потрапляють у результат. Нагадування завершених подій
+    прибираються з черги планувальника.
+
+    Args:
+        session: Активна сесія SQLAlchemy.
+        event_ids (list[int]): ID подій.
         user_id (int): ID користувача.
 
     Returns:
-        bool: True, якщо оновлення виконано, False — якщо подія не знайдена або не належить користувачу.
+        List[Row]: Оновлені події з колонками для відображення
+        (id, title, date, time, is_done, category, tag).
     """
-    stmt = select(Event).where(Event.id == event_id)
-    result = await session.execute(stmt)
-    event = result.scalar_one_or_none()
+    if not event_ids:
+        return []
+    result = await session.execute(
+        update(Event)
+        .where(Event.id.in_(event_ids), Event.user_id == user_id)
+        .values(is_done=True)
+        .returning(*_display_columns())
+        .execution_options(synchronize_session=False)
+    )
+    rows = result.all()
+    await session.commit()
+    reminder_queue.cancel_events(row.id for row in rows)
+    return rows
+
 
-    if not event or event.user_id != user_id:
-        return False
+async def mark_passed_today_done(session, user_id: int, date: date, tz: str | None = None) -> list:
+    """
+    Позначає виконаними всі події за місцеву дату, час яких уже настав.
 
-    event.is_done = True
+    Той самий відбір, що й у `get_passed_today_events`, але одним запитом
+    `UPDATE ... RETURNING` без попереднього читання. Нагадування завершених
+    подій прибираються з черги планувальника.
+
+    Args:
+        session: Активна сесія SQLAlchemy.
+        user_id (int): ID користувача.
+        date (date): Місцева дата.
+        tz (str | None): Часовий пояс користувача.
+
+    Returns:
+        List[Row]: Оновлені події з колонками для відображення, впорядковані за датою і часом.
+    """
+    result = await session.execute(
+        update(Event)
+        .where(*_today_filters(user_id, date, True, tz))
+        .values(is_done=True)
+        .returning(*_display_columns())
+        .execution_options(synchronize_session=False)
+    )
+    rows = result.all()
     await session.commit()
-    return True
+    reminder_queue.cancel_events(row.id for row in rows)
+    return sorted(rows, key=lambda row: (row.date, row.time, row.id))
+
+
+async def mark_event_as_done(session, event_id: int, user_id: int):
+    """
+    Позначає подію як виконану, якщо вона належить вказаному користувачу.
+
+    Args:
+        session: Активна сесія SQLAlchemy.
+        event_id (int): ID події.
+        user_id (int): ID користувача.
+
+    Returns:
+        Row | None: Подія з колонками для відображення або None, якщо вона
+        не знайдена чи не належить користувачу.
+    """
+    rows = await mark_events_done(session, [event_id], user_id)
+    return rows[0] if rows else None
 
 
 async def save_event(session, event: Event):
@@ -182,13 +728,42 @@ async def save_event(session, event: Event):
     await session.commit()
 
 
-async def delete_event(session, event: Event):
+async def delete_events(session, event_ids: list[int], user_id: int) -> list:
     """
-    Видаляє подію з бази даних.
+    Видаляє події користувача одним запитом `DELETE ... RETURNING`.
+
+    Нагадування, теги та записи outbox видаляються каскадно в БД,
+    а нагадування — ще й з черги планувальника.
+    Чужі або неіснуючі ID не потрапляють у результат.
 
     Args:
         session: Активна сесія SQLAlchemy.
-        event (Event): Подія для видалення.
+        event_ids (list[int]): ID подій.
+        user_id (int): ID користувача.
+
+    Returns:
+        List[Row]: Видалені події (id, title).
     """
-    await session.delete(event)
+    if not event_ids:
+        return []
+    result = await session.execute(
+        delete(Event)
+        .where(Event.id.in_(event_ids), Event.user_id == user_id)
+        .returning(Event.id, Event.title)
+        .execution_options(synchronize_session=False)
+    )
+    rows = result.all()
     await session.commit()
+    reminder_queue.cancel_events(row.id for row in rows)
+    return rows
+
+
+async def delete_user_event(session, event_id: int, user_id: int):
+    """
+    Видаляє подію, якщо вона належить вказаному користувачу.
+
+    Returns:
+        Row | None: Видалена подія (id, title) або None.
+    """
+    rows = await delete_events(session, [event_id], user_id)
+    return rows[0] if rows else None
@@ -0,0 +1,85 @@
+from datetime import datetime, timedelta
+from sqlalchemy import select, func
+from app.models.models import Event, EventReminder, User, ReminderOutbox
+
+
+async def claim_outbox_batch(session, now: datetime, limit: int, lease_seconds: int):
+    """
+    Захоплює партію записів outbox для доставки поточним процесом.
+
+    Рядки блокуються через `SELECT ... FOR UPDATE SKIP LOCKED`, тож кілька
+    воркерів ділять чергу без дублікатів. Захоплення оформлюється як оренда:
+    `next_attempt_at` переноситься на `now + lease_seconds`, тому після
+    фіксації транзакції інші воркери не бачать ці записи, а якщо процес
+    впаде — записи знову стануть доступними після завершення оренди.
+
+    Args:
+        session: Активна сесія SQLAlchemy.
+        now (datetime): Поточний час.
+        limit (int): Максимальний розмір партії.
+        lease_seconds (int): Тривалість оренди в секундах.
+
+    Returns:
+        List[Row]: Рядки (ReminderOutbox, title, time, offset, telegram_id, language, timezone, is_reachable);
+        `offset` — відступ нагадування у хвилинах (None для записів без нагадування).
+    """
+    stmt = (
+        select(
+            ReminderOutbox, Event.title, Event.time, EventReminder.offset,
+            User.telegram_id, User.language, User.timezone, User.is_reachable,
+        )
+        .join(Event, Event.id == ReminderOutbox.event_id)
+        .outerjoin(EventReminder, EventReminder.id == ReminderOutbox.reminder_id)
+        .join(User, User.id == Event.user_id)
+        .where(
+            ReminderOutbox.status == "pending",
+            ReminderOutbox.next_attempt_at <= now,
+        )
+        .order_by(ReminderOutbox.next_attempt_at)
+        .limit(limit)
+        .with_for_update(of=ReminderOutbox, skip_locked=True)
+    )
+    result = await session.execute(stmt)
+    rows = result.all()
+
+    lease_until = now + timedelta(seconds=lease_seconds)
+    for entry, *_ in rows:
+        entry.next_attempt_at = lease_until
+    await session.commit()
+    return rows
+
+
+async def count_due_outbox(session, now: datetime) -> int:
+    """
+    Рахує записи outbox у статусі 'pending', час спроби яких уже настав.
+
+    Args:
+        session: Активна сесія SQLAlchemy.
+        now (datetime): Поточний час.
+
+    Returns:
+        int: Кількість записів.
+    """
+    result = await session.execute(
+        select(func.count()).select_from(ReminderOutbox).where(
+            ReminderOutbox.status == "pending",
+            ReminderOutbox.next_attempt_at <= now,
+        )
+    )
+    return result.scalar()
+
+
+async def get_next_outbox_attempt(session) -> datetime | None:
+    """
+    Повертає час найближчої спроби доставки серед записів у статусі 'pending'.
+
+    Args:
+        session: Активна сесія SQLAlchemy.
+
+    Returns:
+        datetime | None: Час спроби або None, якщо черга порожня.
+    """
+    result = await session.execute(
+        select(func.min(ReminderOutbox.next_attempt_at)).where(ReminderOutbox.status == "pending")
+    )
+    return result.scalar()
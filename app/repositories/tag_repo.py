@@ -0,0 +1,92 @@
+from sqlalchemy import select
+from app.models.models import Category, Event, Tag
+
+# Довжина колонки name у categories і tags
+NAME_LENGTH = 64
+
+
+def normalize_name(name: str) -> str:
+    """
+    Нормалізує назву тегу чи категорії: без пробілів по краях і '#', у нижньому регістрі.
+    """
+    return name.strip().lstrip("#").strip().lower()[:NAME_LENGTH]
+
+
+def parse_tags(text: str | None) -> list[str]:
+    """
+    Розбирає рядок тегів через кому в список унікальних нормалізованих назв.
+
+    Args:
+        text (str | None): Рядок від користувача ('#Робота, дім'); `-` або None — без тегів.
+
+    Returns:
+        list[str]: Назви тегів у порядку введення.
+    """
+    if not text or text.strip() == "-":
+        return []
+    names = (normalize_name(part) for part in text.split(","))
+    return list(dict.fromkeys(name for name in names if name))
+
+
+async def get_or_create_category(session, user_id: int, name: str | None) -> Category | None:
+    """
+    Повертає категорію користувача за назвою, створюючи її за потреби.
+
+    Args:
+        session: Активна сесія SQLAlchemy.
+        user_id (int): ID користувача.
+        name (str | None): Назва категорії; порожня або `-` — без категорії.
+
+    Returns:
+        Category | None: Категорія або None.
+    """
+    name = normalize_name(name or "")
+    if not name or name == "-":
+        return None
+    result = await session.execute(
+        select(Category).where(Category.user_id == user_id, Category.name == name)
+    )
+    category = result.scalar_one_or_none()
+    if category is None:
+        category = Category(user_id=user_id, name=name)
+        session.add(category)
+        await session.flush()
+    return category
+
+
+async def get_or_create_tags(session, user_id: int, names: list[str]) -> list[Tag]:
+    """
+    Повертає теги користувача за нормалізованими назвами, створюючи відсутні.
+
+    Args:
+        session: Активна сесія SQLAlchemy.
+        user_id (int): ID користувача.
+        names (list[str]): Нормалізовані назви (див. `parse_tags`).
+
+    Returns:
+        list[Tag]: Теги в порядку `names`.
+    """
+    if not names:
+        return []
+    result = await session.execute(select(Tag).where(Tag.user_id == user_id, Tag.name.in_(names)))
+    existing = {tag.name: tag for tag in result.scalars().all()}
+    missing = [Tag(user_id=user_id, name=name) for name in names if name not in existing]
+    if missing:
+        session.add_all(missing)
+        await session.flush()
+        existing.update((tag.name, tag) for tag in missing)
+    return [existing[name] for name in names]
+
+
+async def set_event_category(session, event: Event, name: str | None) -> None:
+    """
+    Призначає події категорію за назвою (`-` або None — прибрати категорію).
+    """
+    event.category_ref = await get_or_create_category(session, event.user_id, name)
+
+
+async def set_event_tags(session, event: Event, text: str | None) -> None:
+    """
+    Замінює теги події на розібрані з рядка через кому (`-` або None — без тегів).
+    """
+    event.tags = await get_or_create_tags(session, event.user_id, parse_tags(text))
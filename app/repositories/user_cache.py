@@ -0,0 +1,172 @@
+import asyncio
+import time
+from collections import OrderedDict
+
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session, make_transient_to_detached, object_session
+
+from app.config import config
+from app.models.models import User
+from app.scheduler.metrics import scheduler_metrics
+
+# Ключ Session.info: Telegram ID користувачів, змінених у поточній транзакції
+_PENDING_KEY = "user_cache_invalidate"
+
+# Результат завантаження, що завершилось помилкою: кожен очікувач читає БД сам
+_LOAD_FAILED = object()
+
+
+def _detached_copy(user: User) -> User | None:
+    """
+    Створює від'єднану копію користувача з усіма колонками.
+
+    Копія ніколи не додається в сесію: `session.merge(copy, load=False)`
+    створює з неї окремий екземпляр для кожної сесії без запиту до БД.
+    Якщо якась колонка не завантажена, повертає None — така копія
+    спричинила б неявний запит при зверненні до атрибута.
+    """
+    keys = [attr.key for attr in inspect(User).column_attrs]
+    if inspect(user).unloaded.intersection(keys):
+        return None
+    copy = User(**{key: getattr(user, key) for key in keys})
+    make_transient_to_detached(copy)
+    return copy
+
+
+class UserCache:
+    """
+    Кеш користувачів за Telegram ID у пам'яті процесу (LRU з TTL).
+
+    - Не більше `max_size` записів; найдавніше використані витісняються першими.
+    - Запис живе `ttl` секунд, тож зміни з інших процесів стають видимими не пізніше.
+    - Одночасні промахи за одним ключем виконують лише один запит до БД,
+      решта корутин чекає на його результат (single-flight).
+    - Будь-яка зміна користувача через ORM, а також `mark_users_unreachable`,
+      видаляє запис одразу та ще раз після коміту.
+
+    Незареєстровані користувачі не кешуються: після /start запис з'являється
+    через `get_or_create_user`.
+    """
+
+    def __init__(self, max_size: int, ttl: float):
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries: OrderedDict[int, tuple[float, User]] = OrderedDict()
+        self._inflight: dict[int, asyncio.Future] = {}
+        # Зростає з кожною інвалідацією: результат завантаження, що почалося раніше, не зберігається
+        self._epoch = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _lookup(self, telegram_id: int) -> User | None:
+        entry = self._entries.get(telegram_id)
+        if entry is None:
+            return None
+        expires_at, user = entry
+        if expires_at <= time.monotonic():
+            del self._entries[telegram_id]
+            return None
+        self._entries.move_to_end(telegram_id)
+        return user
+
+    def _store(self, telegram_id: int, user: User | None):
+        if user is None:
+            return
+        self._entries[telegram_id] = (time.monotonic() + self.ttl, user)
+        self._entries.move_to_end(telegram_id)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def put(self, user: User):
+        """
+        Зберігає (або оновлює) користувача в кеші.
+        """
+        self._store(user.telegram_id, _detached_copy(user))
+
+    def invalidate(self, *telegram_ids: int):
+        """
+        Видаляє користувачів з кешу.
+        """
+        self._epoch += 1
+        for telegram_id in telegram_ids:
+            self._entries.pop(telegram_id, None)
+
+    def invalidate_on_commit(self, session, telegram_ids):
+        """
+        Видаляє користувачів з кешу зараз і повторно після коміту сесії.
+
+        Повторне видалення прибирає значення, яке інша корутина могла
+        прочитати з БД до коміту змін.
+        """
+        self.invalidate(*telegram_ids)
+        info = getattr(session, "sync_session", session).info
+        info.setdefault(_PENDING_KEY, set()).update(telegram_ids)
+
+    def clear(self):
+        """Очищає кеш повністю."""
+        self._epoch += 1
+        self._entries.clear()
+
+    async def get(self, session, telegram_id: int, loader) -> User | None:
+        """
+        Повертає користувача, прив'язаного до `session`, з кешу або з БД.
+
+        Args:
+            session: Активна сесія SQLAlchemy.
+            telegram_id (int): Telegram ID користувача.
+            loader: Корутина `(session, telegram_id) -> User | None`, що читає БД.
+
+        Returns:
+            User | None: Користувач або None, якщо він не зареєстрований.
+        """
+        cached = self._lookup(telegram_id)
+        if cached is not None:
+            scheduler_metrics.user_cache_hits.inc()
+            return await session.merge(cached, load=False)
+
+        scheduler_metrics.user_cache_misses.inc()
+        future = self._inflight.get(telegram_id)
+        if future is not None:
+            # shield: скасування очікувача не скасовує спільне завантаження
+            cached = await asyncio.shield(future)
+            if cached is _LOAD_FAILED:
+                return await loader(session, telegram_id)
+            return await session.merge(cached, load=False) if cached is not None else None
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[telegram_id] = future
+        epoch = self._epoch
+        result = _LOAD_FAILED
+        try:
+            user = await loader(session, telegram_id)
+            result = _detached_copy(user) if user is not None else None
+            if user is not None and result is None:
+                result = _LOAD_FAILED
+            elif self._epoch == epoch:
+                self._store(telegram_id, result)
+            return user
+        finally:
+            del self._inflight[telegram_id]
+            future.set_result(result)
+
+
+# Спільний кеш процесу
+user_cache = UserCache(config.bot.user_cache_size, config.bot.user_cache_ttl)
+
+
+@event.listens_for(User, "after_update")
+@event.listens_for(User, "after_delete")
+def _invalidate_changed_user(mapper, connection, target: User):
+    session = object_session(target)
+    if session is not None:
+        user_cache.invalidate_on_commit(session, [target.telegram_id])
+    else:
+        user_cache.invalidate(target.telegram_id)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_committed_users(session: Session):
+    telegram_ids = session.info.pop(_PENDING_KEY, None)
+    if telegram_ids:
+        user_cache.invalidate(*telegram_ids)
@@ -1,5 +1,7 @@
-from sqlalchemy import select
+from datetime import datetime
+from sqlalchemy import select, update
 from app.models.models import User
+from app.repositories.user_cache import user_cache
 
 async def get_user_by_telegram_id(session, telegram_id: int):
     """
@@ -16,6 +18,23 @@ async def get_user_by_telegram_id(session, telegram_id: int):
     return result.scalar_one_or_none()
 
 
+async def get_cached_user(session, telegram_id: int):
+    """
+    Отримує користувача за Telegram ID через кеш процесу (`user_cache`).
+
+    Повернений об'єкт прив'язаний до `session`: його можна змінювати й
+    фіксувати як звичайний результат запиту, кеш при цьому інвалідується.
+
+    Args:
+        session: Активна сесія SQLAlchemy.
+        telegram_id (int): Унікальний Telegram ID.
+
+    Returns:
+        User | None: Користувач або None, якщо не знайдено.
+    """
+    return await user_cache.get(session, telegram_id, get_user_by_telegram_id)
+
+
 async def get_or_create_user(session, telegram_id: int, username: str, first_name: str, last_name: str):
     """
     Отримує користувача за Telegram ID або створює нового, якщо його ще немає.
@@ -37,8 +56,54 @@ async def get_or_create_user(session, telegram_id: int, username: str, first_nam
             username=username,
             first_name=first_name,
             last_name=last_name,
+            blocked_at=None,
         )
         session.add(user)
         await session.commit()
+        user_cache.put(user)
         return user, True
     return user, False
+
+
+async def mark_users_unreachable(session, telegram_ids: list[int], now: datetime) -> None:
+    """
+    Позначає користувачів недосяжними (бот заблокований, чат не знайдено тощо).
+
+    Нагадування таких користувачів більше не надсилаються, доки вони знову
+    не напишуть боту. Зміни не фіксуються — це робить викликач.
+
+    Args:
+        session: Активна сесія SQLAlchemy.
+        telegram_ids (list[int]): Telegram ID користувачів.
+        now (datetime): Момент виявлення (UTC).
+    """
+    await session.execute(
+        update(User)
+        .where(User.telegram_id.in_(telegram_ids), User.is_reachable == True)
+        .values(is_reachable=False, blocked_at=now)
+        .execution_options(synchronize_session=False)
+    )
+    # Масовий UPDATE оминає події ORM, тож кеш інвалідується явно
+    user_cache.invalidate_on_commit(session, telegram_ids)
+
+
+async def mark_user_reachable(session, user) -> bool:
+    """
+    Знову вмикає надсилання користувачу, якщо раніше він був недосяжним.
+
+    Стан читається з уже завантаженого об'єкта, тож для досяжних
+    користувачів запит до БД не виконується.
+
+    Args:
+        session: Активна сесія SQLAlchemy.
+        user (User): Користувач.
+
+    Returns:
+        bool: True, якщо користувача було відновлено.
+    """
+    if user.is_reachable:
+        return False
+    user.is_reachable = True
+    user.blocked_at = None
+    await session.commit()
+    return True
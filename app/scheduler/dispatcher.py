@@ -0,0 +1,214 @@
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+
+from aiogram import Bot
+from aiogram.exceptions import TelegramBadRequest, TelegramForbiddenError, TelegramRetryAfter
+
+from app.utils.tz import utc_now
+
+
+# Фрагменти опису TelegramBadRequest, після яких повтор не має сенсу
+PERMANENT_ERROR_MARKERS = ("chat not found", "user is deactivated", "peer_id_invalid")
+
+
+def is_permanent_error(error: Exception) -> bool:
+    """
+    Визначає, чи є помилка надсилання остаточною (користувач недосяжний).
+
+    Остаточні: бот заблокований (`TelegramForbiddenError`), чат не знайдено
+    або акаунт видалено. Решта (мережа, ліміти, збої Telegram) — тимчасові.
+    """
+    if isinstance(error, TelegramForbiddenError):
+        return True
+    if isinstance(error, TelegramBadRequest):
+        message = str(error).lower()
+        return any(marker in message for marker in PERMANENT_ERROR_MARKERS)
+    return False
+
+
+@dataclass
+class DeliveryFailure:
+    """
+    Невдала спроба доставки.
+
+    Атрибути:
+        error (str): Текст помилки.
+        permanent (bool): Чи є помилка остаточною (повторювати не варто).
+    """
+    error: str
+    permanent: bool = False
+
+
+@dataclass
+class OutgoingReminder:
+    """
+    Нагадування, підготовлене до надсилання.
+
+    Атрибути:
+        key (int): Ідентифікатор запису, що повертається після успішного надсилання.
+        chat_id (int): Telegram ID отримувача.
+        text (str): Текст повідомлення.
+        fire_at (datetime): Запланований час нагадування (для підрахунку запізнення).
+    """
+    key: int
+    chat_id: int
+    text: str
+    fire_at: datetime
+
+
+@dataclass
+class DispatchStats:
+    """
+    Підсумок одного проходу розсилки.
+
+    Атрибути:
+        sent (int): Кількість надісланих повідомлень.
+        failed (int): Кількість невдалих спроб.
+        permanent (int): З них остаточних (користувач недосяжний).
+        duration (float): Тривалість розсилки в секундах.
+        max_lateness (float): Найбільше запізнення відносно запланованого часу (сек).
+        avg_lateness (float): Середнє запізнення (сек).
+        lateness (list[float]): Запізнення кожного надісланого нагадування (сек).
+    """
+    sent: int = 0
+    failed: int = 0
+    permanent: int = 0
+    duration: float = 0.0
+    max_lateness: float = 0.0
+    avg_lateness: float = 0.0
+    lateness: list[float] = field(default_factory=list)
+
+    @property
+    def throughput(self) -> float:
+        """Надіслано повідомлень за секунду."""
+        return self.sent / self.duration if self.duration > 0 else 0.0
+
+
+class TokenBucket:
+    """
+    Відро токенів: не більше `rate` операцій за секунду з допустимим сплеском `capacity`.
+    """
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+
+    def _refill(self):
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    @property
+    def idle(self) -> bool:
+        """Чи відро повністю наповнене (давно не використовувалось)."""
+        self._refill()
+        return self._tokens >= self.capacity
+
+    async def acquire(self):
+        """
+        Забирає один токен, за потреби чекаючи на його появу.
+        """
+        while True:
+            self._refill()
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return
+            await asyncio.sleep((1 - self._tokens) / self.rate)
+
+
+class ReminderDispatcher:
+    """
+    Конкурентна розсилка нагадувань з обмеженням швидкості.
+
+    - Не більше `concurrency` одночасних запитів до Telegram.
+    - Глобальне обмеження `global_rate` повідомлень/сек та `per_chat_rate` для кожного чату.
+    - `TelegramRetryAfter` призупиняє лише відповідний чат на вказаний час.
+    - Остаточні помилки (бот заблокований, чат не знайдено) не повторюються
+      і позначаються в `DeliveryFailure.permanent`.
+    """
+
+    def __init__(self, bot: Bot, concurrency: int, global_rate: float, per_chat_rate: float,
+                 max_attempts: int = 3):
+        self.bot = bot
+        self.per_chat_rate = per_chat_rate
+        self.max_attempts = max_attempts
+        self._semaphore = asyncio.Semaphore(concurrency)
+        self._global_bucket = TokenBucket(global_rate, global_rate)
+        self._chat_buckets: dict[int, TokenBucket] = {}
+        self._paused_until: dict[int, float] = {}
+
+    def _chat_bucket(self, chat_id: int) -> TokenBucket:
+        bucket = self._chat_buckets.get(chat_id)
+        if bucket is None:
+            bucket = self._chat_buckets[chat_id] = TokenBucket(self.per_chat_rate, 1)
+        return bucket
+
+    def _prune(self):
+        """Прибирає стан чатів, які вже не обмежені."""
+        now = time.monotonic()
+        self._paused_until = {c: t for c, t in self._paused_until.items() if t > now}
+        self._chat_buckets = {c: b for c, b in self._chat_buckets.items() if not b.idle}
+
+    async def _send(self, reminder: OutgoingReminder) -> tuple[datetime | None, DeliveryFailure | None]:
+        failure = None
+        for _ in range(self.max_attempts):
+            pause = self._paused_until.get(reminder.chat_id, 0) - time.monotonic()
+            if pause > 0:
+                await asyncio.sleep(pause)
+
+            async with self._semaphore:
+                # Токени беруться вже із зайнятим слотом, безпосередньо перед запитом:
+                # інакше корутини з токенами, що чекали на слот, стартували б разом понад global_rate
+                await self._chat_bucket(reminder.chat_id).acquire()
+                await self._global_bucket.acquire()
+                try:
+                    await self.bot.send_message(reminder.chat_id, reminder.text)
+                    return utc_now(), None
+                except TelegramRetryAfter as e:
+                    self._paused_until[reminder.chat_id] = time.monotonic() + e.retry_after
+                    failure = DeliveryFailure(f"{type(e).__name__}: {e}")
+                except Exception as e:
+                    permanent = is_permanent_error(e)
+                    if not permanent:
+                        logging.warning(f"[Reminder] Error sending to {reminder.chat_id}: {e}")
+                    return None, DeliveryFailure(f"{type(e).__name__}: {e}", permanent)
+        return None, failure
+
+    async def dispatch(
+        self, reminders: list[OutgoingReminder]
+    ) -> tuple[list[int], dict[int, DeliveryFailure], DispatchStats]:
+        """
+        Надсилає нагадування конкурентно з дотриманням лімітів.
+
+        Returns:
+            tuple[list[int], dict[int, DeliveryFailure], DispatchStats]: Ключі успішно
+            надісланих нагадувань, помилки невдалих (ключ -> помилка) та статистика проходу.
+        """
+        self._prune()
+        started = time.monotonic()
+        results = await asyncio.gather(*(self._send(r) for r in reminders))
+
+        sent = []
+        failures = {}
+        for reminder, (sent_at, failure) in zip(reminders, results):
+            if sent_at:
+                sent.append((reminder, sent_at))
+            else:
+                failures[reminder.key] = failure or DeliveryFailure("unknown error")
+
+        lateness = [max((at - r.fire_at).total_seconds(), 0.0) for r, at in sent]
+        stats = DispatchStats(
+            sent=len(sent),
+            failed=len(failures),
+            permanent=sum(f.permanent for f in failures.values()),
+            duration=time.monotonic() - started,
+            max_lateness=max(lateness, default=0.0),
+            avg_lateness=sum(lateness) / len(lateness) if lateness else 0.0,
+            lateness=lateness,
+        )
+        return [r.key for r, _ in sent], failures, stats
@@ -0,0 +1,252 @@
+import bisect
+import logging
+from contextlib import suppress
+
+from aiohttp import web
+
+
+class Counter:
+    """
+    Лічильник, що лише зростає (наприклад, кількість надісланих нагадувань).
+    """
+
+    def __init__(self, name: str, help_text: str):
+        self.name = name
+        self.help_text = help_text
+        self.value = 0.0
+
+    def inc(self, amount: float = 1.0):
+        self.value += amount
+
+    def render(self) -> list[str]:
+        return [
+            f"# HELP {self.name} {self.help_text}",
+            f"# TYPE {self.name} counter",
+            f"{self.name} {self.value:g}",
+        ]
+
+
+class Gauge:
+    """
+    Поточне значення величини (наприклад, розмір черги прострочених нагадувань).
+    """
+
+    def __init__(self, name: str, help_text: str):
+        self.name = name
+        self.help_text = help_text
+        self.value = 0.0
+
+    def set(self, value: float):
+        self.value = value
+
+    def render(self) -> list[str]:
+        return [
+            f"# HELP {self.name} {self.help_text}",
+            f"# TYPE {self.name} gauge",
+            f"{self.name} {self.value:g}",
+        ]
+
+
+class Histogram:
+    """
+    Гістограма з фіксованими межами кошиків у форматі Prometheus.
+
+    Зберігає лише лічильники кошиків, суму та кількість спостережень,
+    тож пам'ять не зростає з кількістю нагадувань. Квантилі оцінюються
+    лінійною інтерполяцією всередині кошика.
+    """
+
+    def __init__(self, name: str, help_text: str, buckets: tuple[float, ...]):
+        self.name = name
+        self.help_text = help_text
+        self.buckets = tuple(sorted(buckets))
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+        self.max = 0.0
+
+    def observe(self, value: float):
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+        self.max = max(self.max, value)
+
+    def quantile(self, q: float) -> float:
+        """
+        Оцінює квантиль `q` (0..1) за кошиками; для хвоста понад останню межу повертає максимум.
+        """
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        lower = 0.0
+        for upper, in_bucket in zip(self.buckets, self.counts):
+            if in_bucket and seen + in_bucket >= rank:
+                return lower + (upper - lower) * (rank - seen) / in_bucket
+            seen += in_bucket
+            lower = upper
+        return self.max
+
+    def render(self) -> list[str]:
+        lines = [
+            f"# HELP {self.name} {self.help_text}",
+            f"# TYPE {self.name} histogram",
+        ]
+        cumulative = 0
+        for upper, in_bucket in zip(self.buckets, self.counts):
+            cumulative += in_bucket
+            lines.append(f'{self.name}_bucket{{le="{upper:g}"}} {cumulative}')
+        lines.append(f'{self.name}_bucket{{le="+Inf"}} {self.count}')
+        lines.append(f"{self.name}_sum {self.sum:g}")
+        lines.append(f"{self.name}_count {self.count}")
+        return lines
+
+
+class SchedulerMetrics:
+    """
+    Метрики планувальника нагадувань поточного процесу.
+
+    Атрибути:
+        reminder_lateness (Histogram): Запізнення надсилання відносно запланованого часу (сек).
+        tick_duration (Histogram): Тривалість одного проходу циклу планувальника (сек).
+        enqueue_rows (Histogram): Кількість нагадувань, обраних з БД за прохід.
+        delivery_rows (Histogram): Кількість записів outbox, захоплених за прохід.
+        due_backlog (Gauge): Прострочені нагадування, що лишилися після проходу.
+        outbox_backlog (Gauge): Записи outbox, час спроби яких настав, але не оброблені.
+        reminders_sent (Counter): Успішно надіслані нагадування.
+        reminders_failed (Counter): Невдалі спроби надсилання.
+        scheduler_errors (Counter): Винятки в циклі планувальника.
+        users_unreachable (Counter): Користувачі, позначені недосяжними після остаточної помилки.
+        update_queries (Histogram): Кількість SQL-запитів на одне оновлення Telegram.
+        user_cache_hits (Counter): Користувачі, знайдені в кеші процесу.
+        user_cache_misses (Counter): Користувачі, яких довелося читати з БД.
+    """
+
+    def __init__(self):
+        self.reminder_lateness = Histogram(
+            "reminder_lateness_seconds",
+            "Delay between intended fire time and actual send time.",
+            (0.5, 1, 2, 5, 10, 30, 60, 120, 300, 600, 1800),
+        )
+        self.tick_duration = Histogram(
+            "scheduler_tick_duration_seconds",
+            "Duration of one scheduler loop iteration.",
+            (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30),
+        )
+        self.enqueue_rows = Histogram(
+            "scheduler_enqueue_rows",
+            "Due reminders selected from the database per tick.",
+            (0, 1, 10, 50, 100, 250, 500, 1000, 5000),
+        )
+        self.delivery_rows = Histogram(
+            "scheduler_delivery_rows",
+            "Outbox rows claimed for delivery per tick.",
+            (0, 1, 10, 50, 100, 250, 500, 1000, 5000),
+        )
+        self.due_backlog = Gauge(
+            "scheduler_due_backlog",
+            "Due reminders left in the database after a tick.",
+        )
+        self.outbox_backlog = Gauge(
+            "scheduler_outbox_backlog",
+            "Outbox rows due for delivery left after a tick.",
+        )
+        self.reminders_sent = Counter("reminders_sent_total", "Reminders delivered to Telegram.")
+        self.reminders_failed = Counter("reminders_failed_total", "Failed reminder delivery attempts.")
+        self.scheduler_errors = Counter("scheduler_errors_total", "Exceptions raised in the scheduler loop.")
+        self.users_unreachable = Counter(
+            "users_unreachable_total", "Users marked unreachable after a permanent delivery error."
+        )
+        self.update_queries = Histogram(
+            "bot_update_db_queries",
+            "SQL statements executed while handling one Telegram update.",
+            (0, 1, 2, 3, 4, 5, 7, 10, 15, 25, 50),
+        )
+        self.user_cache_hits = Counter("user_cache_hits_total", "User lookups served from the in-process cache.")
+        self.user_cache_misses = Counter("user_cache_misses_total", "User lookups that went to the database.")
+
+    def _all(self):
+        return (
+            self.reminder_lateness, self.tick_duration, self.enqueue_rows, self.delivery_rows,
+            self.due_backlog, self.outbox_backlog,
+            self.reminders_sent, self.reminders_failed, self.scheduler_errors, self.users_unreachable,
+            self.update_queries, self.user_cache_hits, self.user_cache_misses,
+        )
+
+    def render(self) -> str:
+        """
+        Повертає всі метрики в текстовому форматі Prometheus.
+        """
+        return "\n".join(line for metric in self._all() for line in metric.render()) + "\n"
+
+    def summary(self) -> str:
+        """
+        Повертає короткий людиночитний звіт для адміністратора.
+        """
+        lateness = self.reminder_lateness
+        tick = self.tick_duration
+        queries = self.update_queries
+        return "\n".join([
+            f"sent={self.reminders_sent.value:g} failed={self.reminders_failed.value:g} "
+            f"errors={self.scheduler_errors.value:g} unreachable={self.users_unreachable.value:g}",
+            f"lateness p50={lateness.quantile(0.5):.1f}s p95={lateness.quantile(0.95):.1f}s "
+            f"p99={lateness.quantile(0.99):.1f}s max={lateness.max:.1f}s",
+            f"tick p50={tick.quantile(0.5) * 1000:.0f}ms p95={tick.quantile(0.95) * 1000:.0f}ms "
+            f"max={tick.max * 1000:.0f}ms (n={tick.count})",
+            f"rows/tick enqueue p95={self.enqueue_rows.quantile(0.95):.0f} "
+            f"delivery p95={self.delivery_rows.quantile(0.95):.0f}",
+            f"backlog due={self.due_backlog.value:g} outbox={self.outbox_backlog.value:g}",
+            f"queries/update p50={queries.quantile(0.5):.1f} p95={queries.quantile(0.95):.1f} "
+            f"max={queries.max:g} (n={queries.count})",
+            f"user cache hits={self.user_cache_hits.value:g} misses={self.user_cache_misses.value:g}",
+        ])
+
+
+# Спільні метрики процесу
+scheduler_metrics = SchedulerMetrics()
+
+_metrics_runner: web.AppRunner | None = None
+
+
+async def _handle_metrics(request: web.Request) -> web.Response:
+    return web.Response(text=scheduler_metrics.render(), content_type="text/plain", charset="utf-8")
+
+
+async def start_metrics_server(host: str, port: int):
+    """
+    Запускає локальний HTTP-ендпоінт `/metrics` у текстовому форматі Prometheus.
+
+    Args:
+        host (str): Адреса прослуховування (за замовчуванням лише localhost).
+        port (int): Порт; 0 — ендпоінт вимкнено.
+
+    Якщо порт не вдається зайняти, пише попередження і не запускає ендпоінт.
+    """
+    global _metrics_runner
+    if not port:
+        return
+    app = web.Application()
+    app.router.add_get("/metrics", _handle_metrics)
+    runner = web.AppRunner(app, access_log=None)
+    await runner.setup()
+    try:
+        await web.TCPSite(runner, host, port).start()
+    except OSError as e:
+        # Порт зайнятий (напр. іншим процесом бота на цьому хості): бот працює далі без метрик
+        logging.warning(f"[Metrics] Cannot serve on {host}:{port}, metrics disabled: {e}")
+        await runner.cleanup()
+        return
+    _metrics_runner = runner
+    logging.info(f"[Metrics] Serving on http://{host}:{port}/metrics")
+
+
+async def stop_metrics_server():
+    """
+    Зупиняє HTTP-ендпоінт метрик, якщо він був запущений.
+    """
+    global _metrics_runner
+    if _metrics_runner is None:
+        return
+    with suppress(Exception):
+        await _metrics_runner.cleanup()
+    _metrics_runner = None
@@ -0,0 +1,167 @@
+import asyncio
+import heapq
+from datetime import datetime
+
+from app.utils.tz import utc_now
+
+
+def reminder_fire_at(event, reminder) -> datetime | None:
+    """
+    Обчислює момент надсилання нагадування події.
+
+    Args:
+        event: Об'єкт події.
+        reminder: Нагадування події (EventReminder).
+
+    Returns:
+        datetime | None: Час нагадування або None, якщо нагадування не потрібне.
+    """
+    if event.is_done or reminder.sent_at is not None:
+        return None
+    return reminder.fire_at
+
+
+class ReminderQueue:
+    """
+    Мін-купа запланованих нагадувань у пам'яті.
+
+    Зберігає лише нагадування в межах горизонту планування (наприклад, 24 години).
+    Скасовані або перенесені записи видаляються ліниво — під час читання вершини купи.
+    Для кожного нагадування запам'ятовується його подія, тож усі нагадування
+    видалених або завершених подій скасовуються за ID подій.
+
+    Атрибути:
+        horizon_end (datetime | None): Межа, до якої купа завантажена з БД.
+    """
+
+    def __init__(self):
+        self._heap: list[tuple[datetime, int]] = []
+        self._entries: dict[int, datetime] = {}
+        self._event_of: dict[int, int] = {}
+        self._by_event: dict[int, set[int]] = {}
+        self._wakeup = asyncio.Event()
+        self.horizon_end: datetime | None = None
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def schedule(self, reminder_id: int, fire_at: datetime, event_id: int | None = None):
+        """
+        Додає або переносить нагадування.
+
+        Якщо новий час раніший за поточну вершину купи — будить цикл планувальника.
+
+        Args:
+            reminder_id (int): ID нагадування.
+            fire_at (datetime): Час нагадування.
+            event_id (int | None): ID події (для `cancel_events`).
+        """
+        if self.horizon_end is not None and fire_at > self.horizon_end:
+            self.cancel(reminder_id)
+            return
+        if event_id is not None and self._event_of.get(reminder_id) != event_id:
+            self._forget_event(reminder_id)
+            self._event_of[reminder_id] = event_id
+            self._by_event.setdefault(event_id, set()).add(reminder_id)
+        if self._entries.get(reminder_id) == fire_at:
+            return
+
+        head = self.next_fire_at()
+        self._entries[reminder_id] = fire_at
+        heapq.heappush(self._heap, (fire_at, reminder_id))
+        if head is None or fire_at < head:
+            self._wakeup.set()
+
+    def schedule_event(self, event):
+        """
+        Синхронізує купу зі станом події: планує, переносить або скасовує її нагадування.
+
+        Нагадування мають бути завантажені (`Event.reminders`). Записи видалених
+        нагадувань лишаються в купі і відкидаються під час вибірки з БД.
+        """
+        for reminder in event.reminders:
+            fire_at = reminder_fire_at(event, reminder)
+            if fire_at is None:
+                self.cancel(reminder.id)
+            else:
+                self.schedule(reminder.id, fire_at, event.id)
+
+    def _forget_event(self, reminder_id: int):
+        event_id = self._event_of.pop(reminder_id, None)
+        if event_id is None:
+            return
+        reminders = self._by_event[event_id]
+        reminders.discard(reminder_id)
+        if not reminders:
+            del self._by_event[event_id]
+
+    def cancel(self, reminder_id: int):
+        """
+        Скасовує нагадування (запис у купі стане неактуальним).
+        """
+        self._entries.pop(reminder_id, None)
+        self._forget_event(reminder_id)
+
+    def cancel_event(self, event):
+        """
+        Скасовує всі нагадування події (наприклад, перед її видаленням).
+        """
+        for reminder in event.reminders:
+            self.cancel(reminder.id)
+
+    def cancel_events(self, event_ids):
+        """
+        Скасовує всі нагадування подій за їхніми ID (після видалення або завершення).
+
+        Не потребує завантажених нагадувань: підходить для масових
+        `UPDATE/DELETE ... RETURNING`, що повертають лише рядки подій.
+        """
+        for event_id in event_ids:
+            for reminder_id in list(self._by_event.get(event_id, ())):
+                self.cancel(reminder_id)
+
+    def next_fire_at(self) -> datetime | None:
+        """
+        Повертає найближчий час нагадування або None, якщо купа порожня.
+        """
+        while self._heap:
+            fire_at, reminder_id = self._heap[0]
+            if self._entries.get(reminder_id) == fire_at:
+                return fire_at
+            heapq.heappop(self._heap)
+        return None
+
+    def pop_due(self, now: datetime) -> list[int]:
+        """
+        Вилучає з купи всі нагадування, час яких уже настав.
+
+        Returns:
+            list[int]: ID нагадувань, які треба надіслати.
+        """
+        due = []
+        while (head := self.next_fire_at()) is not None and head <= now:
+            _, reminder_id = heapq.heappop(self._heap)
+            self.cancel(reminder_id)
+            due.append(reminder_id)
+        return due
+
+    async def wait(self, timeout: float):
+        """
+        Чекає до найближчого нагадування, але не довше за `timeout` секунд.
+
+        Повертається раніше, якщо з'явилося нагадування з ранішим часом.
+        """
+        self._wakeup.clear()
+        head = self.next_fire_at()
+        if head is not None:
+            timeout = min(timeout, (head - utc_now()).total_seconds())
+        if timeout <= 0:
+            return
+        try:
+            await asyncio.wait_for(self._wakeup.wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+
+
+# Спільна черга нагадувань процесу
+reminder_queue = ReminderQueue()
@@ -1,24 +1,116 @@
 import asyncio
 import logging
-from app.scheduler.tasks import process_reminders
+import time
+from contextlib import suppress
+from datetime import datetime, timezone
 
-async def scheduler_loop():
+from aiogram import Bot
+
+from app.config import config
+from app.scheduler.dispatcher import ReminderDispatcher
+from app.scheduler.metrics import scheduler_metrics
+from app.scheduler.reminder_queue import reminder_queue
+from app.scheduler.tasks import (
+    complete_past_events, next_auto_complete_at, load_upcoming_reminders,
+    enqueue_due_reminders, deliver_outbox, next_outbox_attempt
+)
+from app.utils.tz import utc_now
+
+
+_scheduler_task: asyncio.Task | None = None
+
+
+async def scheduler_loop(bot: Bot):
     """
-    Нескінченний цикл, який регулярно викликає обробку нагадувань.
+    Нескінченний цикл планувальника нагадувань.
+
+    Не опитує БД з фіксованим кроком, а спить до найближчої з подій:
+    нагадування на вершині черги, наступної спроби доставки outbox,
+    моменту автозавершення найранішої події або планового довантаження черги —
+    але не довше за `max_sleep` секунд. Якщо створена чи змінена подія має
+    раніше нагадування, черга будить цикл негайно.
 
-    Запускає `process_reminders()` кожні 10 секунд.
-    У разі помилки логгує її, але продовжує роботу.
+    Після пробудження переносить нагадування з `fire_at <= now`
+    у `reminder_outbox`. Записи outbox доставляються, щойно настає час їхньої
+    спроби (зокрема повторних і тих, що лишилися після перезапуску).
+    Раз на `refresh_interval` секунд довантажує чергу в межах горизонту
+    (це підхоплює й події, створені іншими процесами); автозавершення
+    запускається, коли настає його час, але не рідше ніж раз на `auto_complete_interval` секунд.
+    Тривалість кожного проходу та кількість помилок записуються в `scheduler_metrics`.
+    У разі помилки логгує її і робить коротку паузу, але продовжує роботу.
     """
+    dispatcher = ReminderDispatcher(
+        bot,
+        concurrency=config.scheduler.send_concurrency,
+        global_rate=config.scheduler.global_rate,
+        per_chat_rate=config.scheduler.per_chat_rate,
+    )
+    next_refresh = next_complete = 0.0
+    # datetime.min — одразу доставити записи, що лишилися після перезапуску
+    next_delivery: datetime | None = datetime.min.replace(tzinfo=timezone.utc)
+    backlog = False
     while True:
+        tick_started = time.monotonic()
         try:
-            await process_reminders()
+            if time.monotonic() >= next_complete:
+                completed = await complete_past_events()
+                if completed is not None:
+                    logging.info(f"[Scheduler] Auto-completed {completed} past events")
+                delay = config.scheduler.auto_complete_interval
+                next_due = await next_auto_complete_at()
+                if next_due is not None:
+                    # Не частіше ніж раз на секунду, навіть якщо прохід виконав інший процес
+                    delay = min(delay, max((next_due - utc_now()).total_seconds(), 1))
+                next_complete = time.monotonic() + delay
+
+            if time.monotonic() >= next_refresh:
+                count = await load_upcoming_reminders()
+                logging.info(f"[Scheduler] {count} reminders queued within horizon")
+                next_refresh = time.monotonic() + config.scheduler.refresh_interval
+
+            if reminder_queue.pop_due(utc_now()) or backlog:
+                # Повна партія означає, що в БД можуть лишатися прострочені нагадування
+                backlog = await enqueue_due_reminders() >= config.scheduler.reminder_batch_size
+                next_delivery = utc_now()
+
+            if next_delivery is not None and next_delivery <= utc_now():
+                await deliver_outbox(dispatcher)
+                next_delivery = await next_outbox_attempt()
+
+            scheduler_metrics.tick_duration.observe(time.monotonic() - tick_started)
+            if backlog:
+                continue
         except Exception as e:
+            scheduler_metrics.scheduler_errors.inc()
             logging.error(f"[Scheduler] Error: {e}")
-        await asyncio.sleep(10)
+            await asyncio.sleep(5)
 
+        timeout = min(next_refresh, next_complete) - time.monotonic()
+        timeout = min(timeout, config.scheduler.max_sleep)
+        if next_delivery is not None:
+            timeout = min(timeout, (next_delivery - utc_now()).total_seconds())
+        await reminder_queue.wait(max(timeout, 0))
 
-async def start_scheduler():
+
+async def start_scheduler(bot: Bot):
     """
     Запускає фонову задачу `scheduler_loop()` у вигляді окремої async-task.
+
+    Args:
+        bot (Bot): Спільний бот застосунку, через сесію якого надсилаються нагадування.
+    """
+    global _scheduler_task
+    _scheduler_task = asyncio.create_task(scheduler_loop(bot))
+
+
+async def stop_scheduler():
+    """
+    Зупиняє фонову задачу планувальника до закриття HTTP-сесії бота.
     """
-    asyncio.create_task(scheduler_loop())
+    global _scheduler_task
+    if _scheduler_task is None:
+        return
+    _scheduler_task.cancel()
+    with suppress(asyncio.CancelledError):
+        await _scheduler_task
+    _scheduler_task = None
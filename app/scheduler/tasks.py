@@ -1,116 +1,422 @@
+import logging
+from collections import defaultdict
 from datetime import datetime, timedelta
-from sqlalchemy import select, and_
-from aiogram import Bot
+from html import escape
+from sqlalchemy import select, update, func, and_, or_
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import raiseload
 
-from app.db import async_session
-from app.models.models import Event, User
+from app.db import async_session, try_advisory_xact_lock
+from app.models.models import Event, EventReminder, ReminderOutbox, User
 from app.config import config
+from app.repositories.outbox_repo import claim_outbox_batch, count_due_outbox, get_next_outbox_attempt
+from app.repositories.user_repo import mark_users_unreachable
+from app.scheduler.dispatcher import ReminderDispatcher, OutgoingReminder
+from app.scheduler.metrics import scheduler_metrics
+from app.scheduler.reminder_queue import reminder_queue
 from app.utils.i18n import L
+from app.utils.recurrence import RECURRING_REPEATS, first_remind_at
+from app.utils.tz import get_zone, utc_now
 
+# Ключ advisory-lock для одноособової задачі автозавершення
+AUTO_COMPLETE_LOCK_KEY = 71_800_001
 
-async def process_reminders():
+# Через скільки після початку подія вважається завершеною
+AUTO_COMPLETE_DELAY = timedelta(hours=1)
+
+# Планувальнику не потрібні категорія й теги подій — не завантажувати їх разом з нагадуваннями
+_NO_LABELS = (raiseload(Event.category_ref), raiseload(Event.tags))
+
+
+def _auto_complete_candidates():
+    """SQL-умови: незавершені одноразові події з часом (частковий індекс `ix_events_pending_starts_at`)."""
+    return (
+        Event.is_done == False,
+        Event.time.isnot(None),
+        or_(Event.repeat.is_(None), Event.repeat.notin_(RECURRING_REPEATS)),
+    )
+
+
+async def complete_past_events() -> int | None:
     """
-    Обробляє всі фоні задачі:
-    - Автоматично позначає старі події як завершені.
-    - Надсилає нагадування користувачам, якщо настав відповідний час.
-    - Клонує повторювані події, якщо їх немає на наступну дату.
+    Автоматично позначає як завершені події, що минули понад годину тому.
+    Серії не змінюються: їхні входження вважаються завершеними віртуально.
+
+    Виконується одним запитом `UPDATE ... RETURNING` за `starts_at` (UTC) без
+    завантаження подій у пам'ять;
+    нагадування таких подій, якщо лишилися, закриваються під час вибірки.
+    Якщо запущено кілька процесів, задачу виконує лише той, хто отримав
+    advisory-lock PostgreSQL; решта пропускають прохід.
 
-    Ця функція викликається в циклі планувальника (scheduler).
+    Returns:
+        int | None: Кількість завершених подій або None, якщо прохід виконує інший процес.
     """
-    now = datetime.now()
+    cutoff = utc_now() - AUTO_COMPLETE_DELAY
+    stmt = (
+        update(Event)
+        .where(*_auto_complete_candidates(), Event.starts_at < cutoff)
+        .values(is_done=True)
+        .returning(Event.id)
+        .execution_options(synchronize_session=False)
+    )
     async with async_session() as session:
-        bot = Bot(token=config.bot.token)
+        if not await try_advisory_xact_lock(session, AUTO_COMPLETE_LOCK_KEY):
+            return None
+        result = await session.execute(stmt)
+        completed_ids = result.scalars().all()
+        await session.commit()
+
+    return len(completed_ids)
+
 
-        # 🔒 Автозавершення подій, що минули понад години тому
-        complete_stmt = select(Event).where(
+async def next_auto_complete_at() -> datetime | None:
+    """
+    Повертає момент, коли наступна подія стане кандидатом на автозавершення,
+    або None, якщо незавершених подій з часом немає.
+
+    `min(starts_at)` читається з краю часткового індексу, тож запит не сканує таблицю.
+    """
+    async with async_session() as session:
+        result = await session.execute(
+            select(func.min(Event.starts_at)).where(*_auto_complete_candidates())
+        )
+        earliest = result.scalar()
+    return earliest + AUTO_COMPLETE_DELAY if earliest else None
+
+
+async def load_upcoming_reminders() -> int:
+    """
+    Завантажує в чергу нагадування, що мають спрацювати в межах горизонту планування.
+
+    Returns:
+        int: Кількість запланованих нагадувань.
+    """
+    now = utc_now()
+    horizon_end = now + timedelta(hours=config.scheduler.horizon_hours)
+
+    async with async_session() as session:
+        stmt = select(EventReminder.id, EventReminder.fire_at, EventReminder.event_id).where(
             and_(
-                Event.is_done == False,
-                Event.time.isnot(None),
-                Event.date <= now.date()
+                EventReminder.sent_at.is_(None),
+                EventReminder.fire_at <= horizon_end,
             )
         )
-        complete_result = await session.execute(complete_stmt)
-        to_complete = complete_result.scalars().all()
-        for event in to_complete:
-            event_datetime = datetime.combine(event.date, event.time)
-            if event_datetime < now - timedelta(hours=1):
-                event.is_done = True
-
-        # 🔔 Обробка нагадувань
-        stmt = select(Event).where(
-            and_(
-                Event.is_done == False,
-                Event.notified == False,
-                Event.time.isnot(None),
-                Event.remind_before > 0,
+        result = await session.execute(stmt)
+        rows = result.all()
+
+    reminder_queue.horizon_end = horizon_end
+    for reminder_id, fire_at, event_id in rows:
+        reminder_queue.schedule(reminder_id, fire_at, event_id)
+    return len(rows)
+
+
+async def enqueue_due_reminders() -> int:
+    """
+    Переносить нагадування, час яких настав, у чергу доставки `reminder_outbox`.
+
+    Кожен відступ події спрацьовує незалежно. В одній транзакції: створює
+    записи outbox, заповнює `sent_at` нагадувань, а для серій переносить
+    `fire_at` на наступне входження. Обирає не більше `reminder_batch_size`
+    нагадувань за `fire_at <= now` (діапазонне сканування часткового індексу
+    `ix_event_reminders_pending`); нагадування вже завершених подій і
+    недосяжних користувачів закриваються (серії — переносяться) без надсилання,
+    щоб не накопичуватися в індексі. `FOR UPDATE SKIP LOCKED` не дає двом
+    процесам взяти те саме нагадування.
+
+    Для користувачів, у яких уже є прострочене нагадування, разом з ним
+    беруться і ті, що настануть протягом `digest_window` секунд, — вони
+    потрапляють в один дайджест. Тож нагадування ніколи не затримується,
+    а раніше строку надсилається щонайбільше на `digest_window` секунд.
+    Записи outbox вставляються, а `sent_at` заповнюється масовими запитами;
+    дублікати outbox (той самий `reminder_id` і `fire_at`) пропускаються.
+
+    Returns:
+        int: Кількість оброблених нагадувань.
+    """
+    now = utc_now()
+    async with async_session() as session:
+        # Недосяжність читається з рядка користувача, знайденого за первинним ключем, —
+        # нагадування таких користувачів закриваються тут же, тож окремий індекс не потрібен
+        stmt = (
+            select(EventReminder, Event, User.timezone, User.is_reachable)
+            .join(Event, Event.id == EventReminder.event_id)
+            .join(User, User.id == Event.user_id)
+            .where(
+                and_(
+                    EventReminder.sent_at.is_(None),
+                    EventReminder.fire_at <= now,
+                )
             )
+            .order_by(EventReminder.fire_at)
+            .limit(config.scheduler.reminder_batch_size)
+            .with_for_update(of=EventReminder, skip_locked=True)
+            .options(*_NO_LABELS)
         )
         result = await session.execute(stmt)
-        events = result.scalars().all()
-
-        for event in events:
-            event_datetime = datetime.combine(event.date, event.time)
-            notify_at = event_datetime - timedelta(minutes=event.remind_before)
-
-            if notify_at <= now and not event.notified:
-                user_result = await session.execute(select(User).where(User.id == event.user_id))
-                user = user_result.scalar_one_or_none()
-                if user:
-                    try:
-                        # Побудова повідомлення з урахуванням мови
-                        lang = getattr(user, "language", "en")
-                        reminder_text = L({
-                            "uk": f"🔔 Нагадування!\n<b>{event.title}</b>\n🕒 {event.time.strftime('%H:%M')} сьогодні",
-                            "en": f"🔔 Reminder!\n<b>{event.title}</b>\n🕒 {event.time.strftime('%H:%M')} today"
-                        }, lang)
-
-                        await bot.send_message(user.telegram_id, reminder_text)
-                        event.notified = True
-
-                        # 🔁 Клонування повторюваних подій
-                        if event.repeat != "none":
-                            next_date = None
-                            if event.repeat == "daily":
-                                next_date = event.date + timedelta(days=1)
-                            elif event.repeat == "weekly":
-                                next_date = event.date + timedelta(weeks=1)
-                            elif event.repeat == "monthly":
-                                try:
-                                    next_date = event.date.replace(
-                                        month=event.date.month % 12 + 1,
-                                        year=event.date.year + (event.date.month // 12)
-                                    )
-                                except ValueError:
-                                    # Уникнення помилок для дат на кшталт 31-го числа
-                                    next_date = (event.date.replace(day=1) + timedelta(days=32)).replace(day=1)
-                            elif event.repeat == "yearly":
-                                try:
-                                    next_date = event.date.replace(year=event.date.year + 1)
-                                except ValueError:
-                                    next_date = event.date + timedelta(days=365)
-
-                            # Якщо аналогічної події ще немає — створити нову
-                            if next_date:
-                                exists_stmt = select(Event).where(
-                                    Event.user_id == event.user_id,
-                                    Event.title == event.title,
-                                    Event.date == next_date
-                                )
-                                exists_result = await session.execute(exists_stmt)
-                                if not exists_result.scalar_one_or_none():
-                                    clone = Event(
-                                        user_id=event.user_id,
-                                        title=event.title,
-                                        date=next_date,
-                                        time=event.time,
-                                        remind_before=event.remind_before,
-                                        category=event.category,
-                                        tag=event.tag,
-                                        repeat=event.repeat
-                                    )
-                                    session.add(clone)
-
-                        await session.commit()
-
-                    except Exception as e:
-                        print(f"[Reminder] Error sending to {user.telegram_id}: {e}")
+        rows = result.all()
+        due_count = len(rows)
+        scheduler_metrics.enqueue_rows.observe(due_count)
+        if not rows:
+            scheduler_metrics.due_backlog.set(0)
+            return 0
+
+        if config.scheduler.digest_window > 0:
+            rows += await _claim_digest_companions(
+                session, {event.user_id for _, event, _, reachable in rows if reachable}, now
+            )
+
+        outbox_rows = []
+        closed_ids = []
+        advanced = []
+        for reminder, event, tz, reachable in rows:
+            if event.is_done:
+                closed_ids.append(reminder.id)
+                continue
+
+            # Недосяжному користувачу нагадування не надсилається, але серія однаково рухається далі
+            if reachable:
+                outbox_rows.append({
+                    "event_id": event.id, "reminder_id": reminder.id,
+                    "fire_at": reminder.fire_at, "next_attempt_at": now,
+                    "attempts": 0, "status": "pending", "created_at": datetime.utcnow(),
+                })
+
+            next_fire_at = None
+            if event.is_recurring:
+                # 🔁 Серія: нагадування переходить на наступне майбутнє входження,
+                # нові рядки не створюються (пропущені під час простою входження не надсилаються)
+                next_fire_at = first_remind_at(
+                    event, reminder.offset, max(reminder.fire_at + timedelta(minutes=1), now), tz
+                )
+            if next_fire_at is None:
+                closed_ids.append(reminder.id)
+            else:
+                reminder.fire_at = next_fire_at
+                advanced.append(reminder)
+
+        if outbox_rows:
+            # Запис для того самого (reminder_id, fire_at) уже є — нагадування просто закривається,
+            # а не обриває всю партію помилкою унікальності
+            insert = pg_insert if config.db.use_postgres else sqlite_insert
+            await session.execute(
+                insert(ReminderOutbox).on_conflict_do_nothing(index_elements=["reminder_id", "fire_at"]),
+                outbox_rows,
+            )
+        if closed_ids:
+            await session.execute(
+                update(EventReminder)
+                .where(EventReminder.id.in_(closed_ids))
+                .values(sent_at=now)
+                .execution_options(synchronize_session=False)
+            )
+        await session.commit()
+
+        # Неповна партія означає, що прострочених нагадувань не лишилося
+        backlog = 0
+        if due_count >= config.scheduler.reminder_batch_size:
+            backlog = (await session.execute(
+                select(func.count()).select_from(EventReminder).where(
+                    EventReminder.sent_at.is_(None),
+                    EventReminder.fire_at <= now,
+                )
+            )).scalar()
+        scheduler_metrics.due_backlog.set(backlog)
+
+    for reminder in advanced:
+        reminder_queue.schedule(reminder.id, reminder.fire_at, reminder.event_id)
+    return due_count
+
+
+async def _claim_digest_companions(session, user_ids: set[int], now: datetime) -> list:
+    """
+    Захоплює нагадування тих самих користувачів, що настануть протягом `digest_window`.
+
+    Вибірка обмежена вузьким діапазоном `fire_at` (частковий індекс), тож не
+    сканує майбутні нагадування всіх користувачів.
+
+    Returns:
+        list[Row]: Рядки (EventReminder, Event, timezone, is_reachable).
+    """
+    if not user_ids:
+        return []
+    window_end = now + timedelta(seconds=config.scheduler.digest_window)
+    result = await session.execute(
+        select(EventReminder, Event, User.timezone, User.is_reachable)
+        .join(Event, Event.id == EventReminder.event_id)
+        .join(User, User.id == Event.user_id)
+        .where(
+            EventReminder.sent_at.is_(None),
+            EventReminder.fire_at > now,
+            EventReminder.fire_at <= window_end,
+            Event.user_id.in_(user_ids),
+        )
+        .with_for_update(of=EventReminder, skip_locked=True)
+        .options(*_NO_LABELS)
+    )
+    return result.all()
+
+
+def _when_text(event_time, fire_at: datetime, offset: int | None, lang: str, tz: str) -> str:
+    """
+    Форматує час події ('10:00 сьогодні' або '25.10 о 10:00') у часовому поясі користувача.
+    """
+    zone = get_zone(tz)
+    starts_on = (fire_at + timedelta(minutes=offset or 0)).astimezone(zone).date()
+    time_str = event_time.strftime('%H:%M')
+    if starts_on == fire_at.astimezone(zone).date():
+        return L({"uk": f"{time_str} сьогодні", "en": f"{time_str} today"}, lang)
+    day_str = starts_on.strftime('%d.%m')
+    return L({"uk": f"{day_str} о {time_str}", "en": f"{day_str} at {time_str}"}, lang)
+
+
+def _reminder_text(items: list, lang: str, tz: str) -> str:
+    """
+    Будує текст нагадування (HTML); кілька подій об'єднуються в один дайджест.
+    Назви подій екрануються, тож `&` чи `<` у назві не ламають розмітку.
+
+    Args:
+        items (list): Кортежі (entry, title, time, offset) одного користувача.
+        lang (str): Мова користувача.
+        tz (str): Часовий пояс користувача.
+    """
+    if len(items) == 1:
+        entry, title, event_time, offset = items[0]
+        when = _when_text(event_time, entry.fire_at, offset, lang, tz)
+        title = escape(title)
+        return L({
+            "uk": f"🔔 Нагадування!\n<b>{title}</b>\n🕒 {when}",
+            "en": f"🔔 Reminder!\n<b>{title}</b>\n🕒 {when}"
+        }, lang)
+
+    lines = [L({"uk": f"🔔 Нагадування ({len(items)}):", "en": f"🔔 Reminders ({len(items)}):"}, lang)]
+    for entry, title, event_time, offset in sorted(items, key=lambda i: i[0].fire_at + timedelta(minutes=i[3] or 0)):
+        lines.append(f"• <b>{escape(title)}</b> — 🕒 {_when_text(event_time, entry.fire_at, offset, lang, tz)}")
+    return "\n".join(lines)
+
+
+async def deliver_outbox(dispatcher: ReminderDispatcher) -> int:
+    """
+    Доставляє нагадування з `reminder_outbox`, чий час спроби настав.
+
+    Записи захоплюються через `FOR UPDATE SKIP LOCKED` з орендою, тому кілька
+    процесів бота можуть працювати одночасно без повторних надсилань.
+    Записи одного користувача надсилаються одним дайджестом (не більше
+    `digest_max_items` подій у повідомленні). Успішні записи отримують статус
+    'sent' одним масовим запитом. Для невдалих зберігається помилка
+    і призначається наступна спроба з експоненційною затримкою; після
+    `max_delivery_attempts` спроб запис отримує статус 'failed'.
+
+    Помилки поділяються на тимчасові та остаточні (бот заблокований, чат не
+    знайдено, акаунт видалено). Після остаточної користувач позначається
+    недосяжним, а його записи одразу отримують статус 'failed' без повторів.
+
+    Args:
+        dispatcher (ReminderDispatcher): Розсилка з обмеженням швидкості.
+
+    Returns:
+        int: Кількість оброблених записів.
+    """
+    now = utc_now()
+    async with async_session() as session:
+        rows = await claim_outbox_batch(
+            session, now, config.scheduler.reminder_batch_size, config.scheduler.claim_lease
+        )
+        scheduler_metrics.delivery_rows.observe(len(rows))
+        if not rows:
+            scheduler_metrics.outbox_backlog.set(0)
+            return 0
+
+        by_user = defaultdict(list)
+        profiles = {}
+        for entry, title, event_time, offset, telegram_id, lang, tz, reachable in rows:
+            if not reachable:
+                _fail_permanently(entry, "user is unreachable")
+                continue
+            by_user[telegram_id].append((entry, title, event_time, offset))
+            profiles[telegram_id] = (lang, tz)
+
+        groups = []
+        outgoing = []
+        size = config.scheduler.digest_max_items
+        for telegram_id, items in by_user.items():
+            lang, tz = profiles[telegram_id]
+            for i in range(0, len(items), size):
+                chunk = items[i:i + size]
+                fire_at = min(entry.fire_at for entry, *_ in chunk)
+                outgoing.append(OutgoingReminder(len(groups), telegram_id, _reminder_text(chunk, lang, tz), fire_at))
+                groups.append([entry for entry, *_ in chunk])
+
+        sent_ids, failures, stats = await dispatcher.dispatch(outgoing)
+
+        # Надіслані записи фіксуються одразу, до будь-якої іншої обробки:
+        # помилка після надсилання не повинна лишити їх 'pending' і призвести до повторної доставки
+        finished = utc_now()
+        delivered = [entry.id for key in sent_ids for entry in groups[key]]
+        if delivered:
+            await session.execute(
+                update(ReminderOutbox)
+                .where(ReminderOutbox.id.in_(delivered))
+                .values(
+                    status="sent", sent_at=finished, last_error=None,
+                    attempts=ReminderOutbox.attempts + 1,
+                )
+                .execution_options(synchronize_session=False)
+            )
+            await session.commit()
+
+        logging.info(
+            f"[Reminder] sent={stats.sent} failed={stats.failed} permanent={stats.permanent} "
+            f"throughput={stats.throughput:.1f}/s "
+            f"lateness avg={stats.avg_lateness:.1f}s max={stats.max_lateness:.1f}s"
+        )
+        for lateness in stats.lateness:
+            scheduler_metrics.reminder_lateness.observe(lateness)
+        scheduler_metrics.reminders_sent.inc(len(delivered))
+        scheduler_metrics.reminders_failed.inc(sum(len(groups[key]) for key in failures))
+
+        unreachable = {outgoing[key].chat_id for key, failure in failures.items() if failure.permanent}
+        if unreachable:
+            await mark_users_unreachable(session, list(unreachable), finished)
+            scheduler_metrics.users_unreachable.inc(len(unreachable))
+            logging.info(f"[Reminder] {len(unreachable)} user(s) marked unreachable")
+
+        for key, failure in failures.items():
+            for entry in groups[key]:
+                if failure.permanent:
+                    _fail_permanently(entry, failure.error)
+                    continue
+                entry.attempts += 1
+                entry.last_error = failure.error
+                if entry.attempts >= config.scheduler.max_delivery_attempts:
+                    entry.status = "failed"
+                    logging.warning(f"[Reminder] Outbox #{entry.id} failed after {entry.attempts} attempts")
+                else:
+                    delay = config.scheduler.retry_base_delay * 2 ** (entry.attempts - 1)
+                    entry.next_attempt_at = finished + timedelta(seconds=delay)
+
+        await session.commit()
+
+        backlog = 0
+        if len(rows) >= config.scheduler.reminder_batch_size:
+            backlog = await count_due_outbox(session, utc_now())
+        scheduler_metrics.outbox_backlog.set(backlog)
+
+    return len(rows)
+
+
+def _fail_permanently(entry: ReminderOutbox, error: str):
+    """
+    Завершує запис outbox статусом 'failed' без повторних спроб.
+    """
+    entry.attempts += 1
+    entry.last_error = error
+    entry.status = "failed"
+
+
+async def next_outbox_attempt() -> datetime | None:
+    """
+    Повертає час найближчої запланованої спроби доставки або None, якщо черга порожня.
+    """
+    async with async_session() as session:
+        return await get_next_outbox_attempt(session)
@@ -5,58 +5,58 @@ from datetime import datetime, timedelta
 import matplotlib.pyplot as plt
 from aiogram.types import Message, FSInputFile
 
-from app.db import async_session
-from app.repositories.user_repo import get_user_by_telegram_id
-from app.repositories.event_repo import get_events_by_user
+from app.repositories.event_repo import get_events_in_range, get_first_event_date
 from app.utils.i18n import L
+from app.utils.tz import local_now
 
 
-async def build_charts_for_user(message: Message, mode: str):
+async def build_charts_for_user(message: Message, session, user, mode: str):
     """
     Будує діаграми активності, статусу та категорій подій користувача за період.
 
+    Повторювані події розгортаються у входження в межах періоду
+    (для "всього часу" — до 90 днів наперед).
+
     Args:
         message (Message): Повідомлення користувача.
+        session: SQLAlchemy сесія.
+        user (User | None): Користувач (None, якщо ще не зареєстрований).
         mode (str): Період ('month', 'week', 'year', 'all').
 
     Відповідь:
         Надсилає кілька зображень-графіків або повідомлення про відсутність подій.
     """
-    now = datetime.now()
+    if not user:
+        await message.answer(L({
+            "uk": "⚠️ Ви ще не зареєстровані. Напишіть /start.",
+            "en": "⚠️ You are not registered yet. Please send /start."
+        }))
+        return
 
+    # Період рахується в місцевому часі користувача
+    now = local_now(user.timezone)
     if mode == "month":
         date_from = now.replace(day=1).date()
+        date_to = (date_from + timedelta(days=32)).replace(day=1) - timedelta(days=1)
         title = L({"uk": "за місяць", "en": "for the month"})
     elif mode == "week":
         date_from = (now - timedelta(days=now.weekday())).date()
+        date_to = date_from + timedelta(days=6)
         title = L({"uk": "за тиждень", "en": "for the week"})
     elif mode == "year":
         date_from = now.replace(month=1, day=1).date()
+        date_to = date_from.replace(month=12, day=31)
         title = L({"uk": "за рік", "en": "for the year"})
     else:
-        date_from = None
+        # Весь час: від найранішої події користувача, а не від date.min
+        date_from = await get_first_event_date(session, user.id)
+        date_to = now.date() + timedelta(days=90)
         title = L({"uk": "за весь час", "en": "for all time"})
 
-    async with async_session() as session:
-        user = await get_user_by_telegram_id(session, message.from_user.id)
-
-        if not user:
-            await message.answer(L({
-                "uk": "⚠️ Ви ще не зареєстровані. Напишіть /start.",
-                "en": "⚠️ You are not registered yet. Please send /start."
-            }))
-            return
-
-        events = await get_events_by_user(session, user.id)
+    filtered = []
+    if date_from is not None:
+        filtered = await get_events_in_range(session, user.id, date_from, date_to, tz=user.timezone)
 
-    if not events:
-        await message.answer(L({
-            "uk": "ℹ️ Подій поки немає.",
-            "en": "ℹ️ No events yet."
-        }))
-        return
-
-    filtered = [e for e in events if not date_from or e.date >= date_from]
     if not filtered:
         await message.answer(L({
             "uk": f"ℹ️ Подій {title} немає.",
@@ -66,7 +66,7 @@ async def build_charts_for_user(message: Message, mode: str):
 
     user_id = message.from_user.id
     path1 = _build_activity_chart(filtered, title, user_id)
-    path2 = _build_status_chart(filtered, title, user_id)
+    path2 = _build_status_chart(filtered, title, user_id, now)
     path3 = _build_category_chart(filtered, user_id)
 
     await message.answer_photo(FSInputFile(path1), caption=L({
@@ -111,14 +111,15 @@ def _build_activity_chart(events, title, user_id):
     return path
 
 
-def _build_status_chart(events, title, user_id):
+def _build_status_chart(events, title, user_id, now):
     """
     Створює комбіновану діаграму статусів подій:
     - ✅ виконано
     - ⚠️ прострочено
     - 📅 заплановано
+
+    `now` — поточний місцевий час користувача.
     """
-    now = datetime.now()
     status_by_day = defaultdict(lambda: {"done": 0, "expired": 0, "upcoming": 0})
     for e in events:
         key = e.date
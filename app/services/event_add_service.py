@@ -3,9 +3,11 @@ from aiogram.types import Message
 from aiogram.fsm.context import FSMContext
 from sqlalchemy import select
 
-from app.db import async_session
-from app.models.models import User, Event
-from app.utils.i18n import L
+from app.config import config
+from app.models.models import Event
+from app.repositories.tag_repo import set_event_category, set_event_tags
+from app.scheduler.reminder_queue import reminder_queue
+from app.utils.i18n import L, current_lang
 
 
 def validate_date(text: str) -> datetime.date:
@@ -34,7 +36,32 @@ def validate_time(text: str) -> datetime.time:
     return datetime.strptime(text.strip(), "%H:%M").time()
 
 
-async def finish_event_logic(message: Message, state: FSMContext):
+def parse_remind_offsets(text: str) -> list[int]:
+    """
+    Перетворює рядок з хвилинами через кому на список відступів нагадувань.
+
+    `-` означає стандартні відступи з `config.scheduler.notification_times`.
+
+    Args:
+        text (str): Рядок на кшталт '10, 60, 1440'.
+
+    Returns:
+        list[int]: Додатні відступи у хвилинах без повторів, за зростанням.
+
+    Raises:
+        ValueError: Якщо значення не є цілими невід'ємними числами.
+    """
+    text = text.strip()
+    if text == "-":
+        return sorted(set(config.scheduler.notification_times))
+
+    offsets = [int(part) for part in text.split(",") if part.strip()]
+    if not offsets or any(o < 0 for o in offsets):
+        raise ValueError("Invalid reminder offsets")
+    return sorted({o for o in offsets if o > 0})
+
+
+async def finish_event_logic(message: Message, state: FSMContext, session, user):
     """
     Завершує процес додавання події:
     - Перевіряє формат повторення.
@@ -44,68 +71,71 @@ async def finish_event_logic(message: Message, state: FSMContext):
     Args:
         message (Message): Повідомлення користувача.
         state (FSMContext): Контекст FSM.
+        session: SQLAlchemy сесія.
+        user (User | None): Користувач (None, якщо ще не зареєстрований).
 
     Returns:
         Підтвердження збереження та рекомендації (якщо є).
     """
     data = await state.get_data()
-    lang = message.from_user.language_code if message.from_user.language_code in ("uk", "en") else "uk"
-
-    async with async_session() as session:
-        stmt = select(User).where(User.telegram_id == message.from_user.id)
-        result = await session.execute(stmt)
-        user = result.scalar_one_or_none()
-        if not user:
-            await message.answer(L({
-                "uk": "⚠️ Користувача не знайдено. Напишіть /start.",
-                "en": "⚠️ User not found. Please send /start."
-            }))
-            return
-
-        event = Event(
-            user_id=user.id,
-            title=data["title"],
-            date=data["date"],
-            time=data["time"],
-            remind_before=data["remind_before"],
-            category=data.get("category"),
-            tag=data.get("tag"),
-            repeat=data.get("repeat"),
-        )
-        session.add(event)
-        await session.commit()
-
-        stmt_day = select(Event).where(Event.user_id == user.id, Event.date == event.date)
-        day_result = await session.execute(stmt_day)
-        same_day_events = day_result.scalars().all()
-
-        recommendations = []
-
-        if len(same_day_events) >= 5:
+    lang = current_lang()
+
+    if not user:
+        await message.answer(L({
+            "uk": "⚠️ Користувача не знайдено. Напишіть /start.",
+            "en": "⚠️ User not found. Please send /start."
+        }))
+        return
+
+    event = Event(
+        user_id=user.id,
+        title=data["title"],
+        date=data["date"],
+        time=data["time"],
+        description=None,
+        repeat=data.get("repeat"),
+    )
+    await set_event_category(session, event, data.get("category"))
+    await set_event_tags(session, event, data.get("tag"))
+    event.sync_reminders(user.timezone, data["remind_offsets"])
+    session.add(event)
+    await session.commit()
+    reminder_queue.schedule_event(event)
+
+    # Для порад достатньо кількох колонок — без завантаження категорій і тегів
+    stmt_day = select(Event.id, Event.date, Event.time, Event.repeat).where(
+        Event.user_id == user.id, Event.date == event.date
+    )
+    day_result = await session.execute(stmt_day)
+    same_day_events = day_result.all()
+
+    recommendations = []
+
+    if len(same_day_events) >= 5:
+        recommendations.append(L({
+            "uk": "⚠️ У вас вже багато подій на цей день. Можливо, варто щось перенести.",
+            "en": "⚠️ You already have many events on this day. Consider rescheduling some."
+        }))
+
+    for other in same_day_events:
+        if other.id == event.id or not other.time or not event.time:
+            continue
+        delta = abs((datetime.combine(event.date, event.time) - datetime.combine(other.date,
+                                                                                 other.time)).total_seconds()) / 60
+        if 0 < delta < 30:
             recommendations.append(L({
-                "uk": "⚠️ У вас вже багато подій на цей день. Можливо, варто щось перенести.",
-                "en": "⚠️ You already have many events on this day. Consider rescheduling some."
+                "uk": "⏱ Події йдуть майже без перерв.",
+                "en": "⏱ Events are scheduled almost back-to-back."
             }))
+            break
 
-        for other in same_day_events:
-            if other.id == event.id or not other.time or not event.time:
-                continue
-            delta = abs((datetime.combine(event.date, event.time) - datetime.combine(other.date,
-                                                                                     other.time)).total_seconds()) / 60
-            if 0 < delta < 30:
-                recommendations.append(L({
-                    "uk": "⏱ Події йдуть майже без перерв.",
-                    "en": "⏱ Events are scheduled almost back-to-back."
-                }))
-                break
-
-        if event.repeat != "none":
-            existing = [e for e in same_day_events if e.time == event.time and e.repeat == event.repeat]
-            if len(existing) > 1:
-                recommendations.append(L({
-                    "uk": "🔁 Уже є така повторювана подія.",
-                    "en": "🔁 There is already such a recurring event."
-                }))
+    if event.repeat != "none":
+        existing = [e for e in same_day_events if e.time == event.time and e.repeat == event.repeat]
+        if len(existing) > 1:
+            recommendations.append(L({
+                "uk": "🔁 Уже є така повторювана подія.",
+                "en": "🔁 There is already such a recurring event."
+            }))
 
     await state.clear()
     from app.handlers.event_menu import build_main_menu
@@ -121,5 +151,5 @@ async def finish_event_logic(message: Message, state: FSMContext):
         }))
 
     # Експорт в Google Calendar
-    from app.services.event_list_service import export_one_to_google
-    await export_one_to_google(message, event.id)
\ No newline at end of file
+    from app.services.event_list_service import export_event_to_google
+    await export_event_to_google(message, user, event)
\ No newline at end of file
@@ -2,77 +2,97 @@ from datetime import datetime
 from aiogram.types import Message, CallbackQuery, InlineKeyboardMarkup, InlineKeyboardButton
 from aiogram.fsm.context import FSMContext
 
-from app.repositories.user_repo import get_user_by_telegram_id
-from app.repositories.event_repo import get_events_by_user, get_event_by_id, save_event
+from app.config import config
+from app.repositories.event_repo import get_events_by_user_page, get_event_by_id, save_event
+from app.repositories.tag_repo import set_event_category, set_event_tags
+from app.scheduler.reminder_queue import reminder_queue
+from app.services.event_add_service import parse_remind_offsets
+from app.services.event_list_service import more_button
 from app.utils.i18n import L
-from app.db import async_session
+from app.utils.pagination import encode_cursor, decode_cursor
 
 
+# Тексти запитів для кожного поля; мова підставляється під час показу
 edit_prompts = {
-    "title": L({
+    "title": {
         "uk": "✏️ Введіть нову назву події:",
         "en": "✏️ Enter new event title:"
-    }),
-    "date": L({
+    },
+    "date": {
         "uk": "📅 Введіть нову дату (ДД.ММ.РРРР):",
         "en": "📅 Enter new date (DD.MM.YYYY):"
-    }),
-    "time": L({
+    },
+    "time": {
         "uk": "⏰ Введіть новий час (ГГ:ХХ):",
         "en": "⏰ Enter new time (HH:MM):"
-    }),
-    "remind": L({
-        "uk": "🔔 За скільки хвилин до події надіслати нагадування?",
-        "en": "🔔 How many minutes before the event to send a reminder?"
-    }),
-    "category": L({
+    },
+    "remind": {
+        "uk": "🔔 За скільки хвилин до події надіслати нагадування? "
+              "Можна кілька через кому або `-` для стандартних:",
+        "en": "🔔 How many minutes before the event to send reminders? "
+              "Several comma separated or `-` for defaults:"
+    },
+    "category": {
         "uk": "🏷 Введіть нову категорію, або `-` для очищення:",
         "en": "🏷 Enter new category or `-` to clear:"
-    }),
-    "tag": L({
+    },
+    "tag": {
         "uk": "🔖 Введіть нові теги (через кому), або `-` для очищення:",
         "en": "🔖 Enter new tags (comma separated) or `-` to clear:"
-    }),
-    "repeat": L({
+    },
+    "repeat": {
         "uk": "🔁 Напишіть тип повторення: none / daily / weekly / monthly / yearly",
         "en": "🔁 Enter repeat type: none / daily / weekly / monthly / yearly"
-    }),
+    },
+    "until": {
+        "uk": "🏁 До якої дати повторювати (ДД.ММ.РРРР), або `-` без обмеження:",
+        "en": "🏁 Repeat until date (DD.MM.YYYY) or `-` for no end:"
+    },
+    "skip": {
+        "uk": "⏭ Яку дату пропустити в серії (ДД.ММ.РРРР)?",
+        "en": "⏭ Which date to skip in the series (DD.MM.YYYY)?"
+    },
 }
 
 
-async def list_events_to_edit(message: Message, state: FSMContext):
+async def list_events_to_edit(message: Message, state: FSMContext, session, user, cursor_text: str = ""):
     """
-    Виводить список подій користувача з кнопками для редагування.
+    Виводить сторінку подій користувача з кнопками для редагування.
 
+    Події впорядковані за часом початку; наступна сторінка відкривається
+    кнопкою "Показати ще" (`edit_page:<cursor>`).
     Якщо користувача або подій немає — показує відповідне повідомлення.
     """
-    async with async_session() as session:
-        user = await get_user_by_telegram_id(session, message.from_user.id)
-        if not user:
-            await message.answer(L({
-                "uk": "⚠️ Спочатку зареєструйтесь через /start.",
-                "en": "⚠️ Please register first via /start."
-            }))
-            return
-
-        events = await get_events_by_user(session, user.id)
-        if not events:
-            await message.answer(L({
-                "uk": "📭 У вас ще немає подій.",
-                "en": "📭 You have no events yet."
-            }))
-            return
-
-        for event in events:
-            date_str = event.date.strftime("%d.%m.%Y")
-            time_str = event.time.strftime("%H:%M") if event.time else L({"uk": "без часу", "en": "no time"})
-            text = f"<b>{event.title}</b>\n📅 {date_str} о {time_str}"
-
-            buttons = [
-                InlineKeyboardButton(text=L({"uk": "✏️ Редагувати", "en": "✏️ Edit"}),
-                                     callback_data=f"edit_event:{event.id}")
-            ]
-            await message.answer(text, reply_markup=InlineKeyboardMarkup(inline_keyboard=[buttons]))
+    if not user:
+        await message.answer(L({
+            "uk": "⚠️ Спочатку зареєструйтесь через /start.",
+            "en": "⚠️ Please register first via /start."
+        }))
+        return
+
+    events, next_cursor = await get_events_by_user_page(
+        session, user.id, after=decode_cursor(cursor_text), limit=config.bot.page_size
+    )
+    if not events:
+        await message.answer(L({
+            "uk": "📭 У вас ще немає подій.",
+            "en": "📭 You have no events yet."
+        }))
+        return
+
+    for event in events:
+        date_str = event.date.strftime("%d.%m.%Y")
+        time_str = event.time.strftime("%H:%M") if event.time else L({"uk": "без часу", "en": "no time"})
+        text = f"<b>{event.title}</b>\n📅 {date_str} {L({'uk': 'о', 'en': 'at'})} {time_str}"
+
+        buttons = [
+            InlineKeyboardButton(text=L({"uk": "✏️ Редагувати", "en": "✏️ Edit"}),
+                                 callback_data=f"edit_event:{event.id}")
+        ]
+        await message.answer(text, reply_markup=InlineKeyboardMarkup(inline_keyboard=[buttons]))
+
+    if next_cursor:
+        await message.answer("…", reply_markup=more_button(f"edit_page:{encode_cursor(next_cursor)}", user.language))
 
 
 async def send_edit_prompt(callback: CallbackQuery, state: FSMContext):
@@ -82,16 +102,11 @@ async def send_edit_prompt(callback: CallbackQuery, state: FSMContext):
     field = callback.data.split(":")[1]
     await state.update_data(field=field)
 
-    lang = getattr(callback.from_user, "language_code", "en")
-    prompt_text = edit_prompts[field]
-    if callable(prompt_text):
-        prompt_text = prompt_text(lang)
-
-    await callback.message.answer(prompt_text)
+    await callback.message.answer(L(edit_prompts[field]))
     await callback.answer()
 
 
-async def apply_edit(message: Message, state: FSMContext):
+async def apply_edit(message: Message, state: FSMContext, session, user):
     """
     Застосовує редагування обраного поля події.
 
@@ -102,51 +117,61 @@ async def apply_edit(message: Message, state: FSMContext):
     field = data.get("field")
     value = message.text.strip()
 
-    async with async_session() as session:
-        event = await get_event_by_id(session, event_id)
-        if not event:
-            await message.answer(L({"uk": "⚠️ Подія не знайдена.", "en": "⚠️ Event not found."}))
-            await state.clear()
-            return
-
-        try:
-            if field == "title":
-                event.title = value
-            elif field == "date":
-                event.date = datetime.strptime(value, "%d.%m.%Y").date()
-            elif field == "time":
-                event.time = datetime.strptime(value, "%H:%M").time()
-            elif field == "remind":
-                event.remind_before = int(value)
-            elif field == "category":
-                event.category = None if value == "-" else value
-            elif field == "tag":
-                event.tag = None if value == "-" else value
-            elif field == "repeat":
-                if value.lower() not in ("none", "daily", "weekly", "monthly", "yearly"):
-                    await message.answer(L({
-                        "uk": "❌ Невірне значення повтору.",
-                        "en": "❌ Invalid repeat value."
-                    }))
-                    return
-                event.repeat = value.lower()
-            else:
+    event = await get_event_by_id(session, event_id)
+    if not event or not user or event.user_id != user.id:
+        await message.answer(L({"uk": "⚠️ Подія не знайдена.", "en": "⚠️ Event not found."}))
+        await state.clear()
+        return
+
+    try:
+        if field == "title":
+            event.title = value
+        elif field == "date":
+            event.date = datetime.strptime(value, "%d.%m.%Y").date()
+        elif field == "time":
+            event.time = datetime.strptime(value, "%H:%M").time()
+        elif field == "remind":
+            event.sync_reminders(user.timezone, parse_remind_offsets(value))
+        elif field == "category":
+            await set_event_category(session, event, value)
+        elif field == "tag":
+            await set_event_tags(session, event, value)
+        elif field == "repeat":
+            if value.lower() not in ("none", "daily", "weekly", "monthly", "yearly"):
                 await message.answer(L({
-                    "uk": "⚠️ Невідома дія.",
-                    "en": "⚠️ Unknown action."
+                    "uk": "❌ Невірне значення повтору.",
+                    "en": "❌ Invalid repeat value."
                 }))
-                await state.clear()
                 return
-
-            await save_event(session, event)
+            event.repeat = value.lower()
+        elif field == "until":
+            event.repeat_until = None if value == "-" else datetime.strptime(value, "%d.%m.%Y").date()
+        elif field == "skip":
+            skipped = datetime.strptime(value, "%d.%m.%Y").date().isoformat()
+            # Новий список, щоб SQLAlchemy помітив зміну JSON-поля
+            event.repeat_exceptions = sorted(set(event.repeat_exceptions or []) | {skipped})
+        else:
             await message.answer(L({
-                "uk": "✅ Подію оновлено.",
-                "en": "✅ Event updated."
-            }))
-        except Exception:
-            await message.answer(L({
-                "uk": "❌ Невірний формат. Спробуйте ще раз.",
-                "en": "❌ Invalid format. Please try again."
+                "uk": "⚠️ Невідома дія.",
+                "en": "⚠️ Unknown action."
             }))
+            await state.clear()
+            return
+
+        # Зміна дати, часу чи правила повторення перераховує нагадування
+        if field in ("date", "time", "repeat", "until", "skip"):
+            event.sync_reminders(user.timezone)
+
+        await save_event(session, event)
+        reminder_queue.schedule_event(event)
+        await message.answer(L({
+            "uk": "✅ Подію оновлено.",
+            "en": "✅ Event updated."
+        }))
+    except Exception:
+        await message.answer(L({
+            "uk": "❌ Невірний формат. Спробуйте ще раз.",
+            "en": "❌ Invalid format. Please try again."
+        }))
 
     await state.clear()
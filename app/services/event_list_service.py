@@ -1,9 +1,14 @@
+from datetime import date, timedelta
+from html import escape
+
+from aiogram.fsm.context import FSMContext
 from aiogram.types import Message, CallbackQuery, InlineKeyboardMarkup, InlineKeyboardButton
-from app.repositories.user_repo import get_user_by_telegram_id
-from app.repositories.event_repo import get_event_by_id, get_events_in_range, get_events_by_user
+from app.config import config
+from app.repositories.event_repo import get_event_by_id, get_events_in_range_page, search_events
 from app.integrations.google_calendar import export_event, import_events_from_google
 from app.utils.i18n import L
-from app.db import async_session
+from app.utils.pagination import encode_cursor, decode_cursor
+from app.utils.tz import local_today
 
 
 def format_event(event) -> str:
@@ -12,7 +17,7 @@ def format_event(event) -> str:
     """
     date = event.date.strftime("%d.%m.%Y")
     time = event.time.strftime("%H:%M") if event.time else L({"uk": "без часу", "en": "no time"})
-    lines = [f"<b>{event.title}</b>", f"📅 {date} о {time}"]
+    lines = [f"<b>{event.title}</b>", f"📅 {date} {L({'uk': 'о', 'en': 'at'})} {time}"]
     if event.category:
         lines.append(f"📂 {L({'uk': 'Категорія', 'en': 'Category'})}: {event.category}")
     if event.tag:
@@ -20,9 +25,45 @@ def format_event(event) -> str:
     return "\n".join(lines)
 
 
-async def list_events(message: Message, start, end, title: str, parse_args: bool = True):
+def period_range(period: str, today: date) -> tuple[date, date]:
+    """
+    Повертає межі періоду списку подій відносно місцевої дати користувача.
+
+    Args:
+        period (str): 'today', 'week' (7 днів від сьогодні), 'month' (календарний місяць)
+            або 'upcoming' (90 днів наперед).
+        today (date): Поточна місцева дата.
+
+    Returns:
+        tuple[date, date]: Перший і останній день періоду.
+    """
+    if period == "today":
+        return today, today
+    if period == "week":
+        return today, today + timedelta(days=6)
+    if period == "month":
+        start = today.replace(day=1)
+        return start, (start + timedelta(days=32)).replace(day=1) - timedelta(days=1)
+    return today, today + timedelta(days=90)
+
+
+def more_button(callback_data: str, lang: str) -> InlineKeyboardMarkup:
     """
-    Виводить список подій за вказаний період (і фільтром за категорією або тегом).
+    Клавіатура з кнопкою переходу до наступної сторінки списку.
+    """
+    return InlineKeyboardMarkup(inline_keyboard=[[
+        InlineKeyboardButton(text=L({"uk": "⬇️ Показати ще", "en": "⬇️ Show more"}, lang), callback_data=callback_data)
+    ]])
+
+
+async def list_events(message: Message, session, user, period: str, title: str, parse_args: bool = True,
+                      state: FSMContext | None = None):
+    """
+    Виводить першу сторінку подій за вказаний період (і фільтром за категорією або тегом).
+
+    Межі періоду рахуються від сьогоднішньої дати в часовому поясі користувача.
+    Наступні сторінки відкриваються кнопкою "Показати ще" (`list_page:`);
+    фільтр зберігається у FSM-даних, бо не вміщується в callback_data.
     """
     category = tag = None
 
@@ -36,93 +77,205 @@ async def list_events(message: Message, start, end, title: str, parse_args: bool
             else:
                 category = filter_text
 
-    async with async_session() as session:
-        user = await get_user_by_telegram_id(session, message.from_user.id)
-        if not user:
-            await message.answer(L({
-                "uk": "⚠️ Ви ще не зареєстровані. Напишіть /start.",
-                "en": "⚠️ You are not registered yet. Please send /start."
-            }))
-            return
+    filtered = bool(category or tag)
+    if filtered and state is not None:
+        await state.update_data(list_filter=[category, tag])
 
-        events = await get_events_in_range(session, user.id, start, end, category, tag)
-        if not events:
-            await message.answer(L({
-                "uk": "📭 Подій не знайдено.",
-                "en": "📭 No events found."
-            }, user.language))
+    await _send_events_page(message, session, user, period, category, tag, filtered, None, title)
+
+
+async def list_events_more(callback: CallbackQuery, state: FSMContext, session, user):
+    """
+    Показує наступну сторінку списку подій за callback `list_page:<period>:<filtered>:<cursor>`.
+    """
+    _, period, filtered, cursor_text = callback.data.split(":", 3)
+    cursor = decode_cursor(cursor_text)
+    category = tag = None
+    if filtered == "1":
+        saved = (await state.get_data()).get("list_filter")
+        if not saved or cursor is None:
+            await callback.answer(L({
+                "uk": "⚠️ Список застарів, повторіть команду.",
+                "en": "⚠️ This list has expired, please repeat the command."
+            }), show_alert=True)
             return
+        category, tag = saved
 
-        await message.answer(title)
-        for event in events:
-            await message.answer(format_event(event))
+    await callback.message.edit_reply_markup(reply_markup=None)
+    await _send_events_page(callback.message, session, user, period, category, tag,
+                            filtered == "1", cursor)
+    await callback.answer()
 
 
-async def export_one_to_google(message: Message, event_id: int):
+async def _send_events_page(message: Message, session, user, period: str, category, tag,
+                            filtered: bool, cursor, title: str | None = None):
     """
-        Експортує одну подію в Google Calendar по callback-запиту.
+    Надсилає одну сторінку подій і, якщо є продовження, кнопку "Показати ще".
     """
-    async with async_session() as session:
-        event = await get_event_by_id(session, event_id)
-        if not event:
-            await message.answer(L({
-                "uk": "⚠️ Подія не знайдена.",
-                "en": "⚠️ Event not found."
-            }))
-            return
+    if not user:
+        await message.answer(L({
+            "uk": "⚠️ Ви ще не зареєстровані. Напишіть /start.",
+            "en": "⚠️ You are not registered yet. Please send /start."
+        }))
+        return
 
-        user = await get_user_by_telegram_id(session, message.from_user.id)
-        if not user:
-            await message.answer(L({
-                "uk": "⚠️ Користувача не знайдено.",
-                "en": "⚠️ User not found."
-            }))
-            return
+    start, end = period_range(period, local_today(user.timezone))
+    events, next_cursor = await get_events_in_range_page(
+        session, user.id, start, end, category, tag, tz=user.timezone,
+        after=cursor, limit=config.bot.page_size
+    )
 
-        try:
-            link = await export_event(
-                user_id=user.telegram_id,
-                title=event.title,
-                date=event.date,
-                time=event.time,
-                description=event.description or ""
-            )
-            await message.answer(
-                L({
-                    "uk": "☁️ Подію також додано до Google Calendar!",
-                    "en": "☁️ Event also exported to Google Calendar!"
-                }),
-                reply_markup=InlineKeyboardMarkup(inline_keyboard=[[InlineKeyboardButton(text="✅ Google", url=link)]])
+    if not events:
+        await message.answer(L({
+            "uk": "📭 Подій не знайдено.",
+            "en": "📭 No events found."
+        }, user.language))
+        return
+
+    if title:
+        await message.answer(title)
+    for event in events:
+        await message.answer(format_event(event))
+    if next_cursor:
+        await message.answer(
+            "…",
+            reply_markup=more_button(
+                f"list_page:{period}:{int(filtered)}:{encode_cursor(next_cursor)}", user.language
             )
-        except Exception as e:
-            print(f"[Export Error] {e}")
-            await message.answer(L({
-                "uk": "⚠️ Помилка при експорті!",
-                "en": "⚠️ Export failed!"
-            }))
+        )
+
+
+async def find_events(message: Message, state: FSMContext, session, user):
+    """
+    Виконує пошук `/find <запит>` і виводить першу сторінку результатів.
+
+    Запит зберігається у FSM-даних для кнопки "Показати ще" (`find_page:<offset>`).
+    """
+    args = message.text.strip().split(maxsplit=1)
+    if len(args) < 2 or not args[1].strip():
+        await message.answer(L({
+            "uk": "🔎 Напишіть, що шукати: /find зустріч з лікарем",
+            "en": "🔎 Tell me what to look for: /find doctor appointment"
+        }))
+        return
+
+    query = args[1].strip()
+    await state.update_data(find_query=query)
+    await _send_search_page(message, session, user, query, 0)
+
+
+async def find_events_more(callback: CallbackQuery, state: FSMContext, session, user):
+    """
+    Показує наступну сторінку результатів пошуку.
+    """
+    query = (await state.get_data()).get("find_query")
+    if not query:
+        await callback.answer(L({
+            "uk": "⚠️ Пошук застарів, повторіть команду.",
+            "en": "⚠️ This search has expired, please repeat the command."
+        }), show_alert=True)
+        return
+
+    await callback.message.edit_reply_markup(reply_markup=None)
+    await _send_search_page(callback.message, session, user, query, int(callback.data.split(":")[1]))
+    await callback.answer()
+
+
+async def _send_search_page(message: Message, session, user, query: str, offset: int):
+    """
+    Надсилає одну сторінку результатів пошуку і, якщо є продовження, кнопку "Показати ще".
+    """
+    if not user:
+        await message.answer(L({
+            "uk": "⚠️ Ви ще не зареєстровані. Напишіть /start.",
+            "en": "⚠️ You are not registered yet. Please send /start."
+        }))
+        return
 
-async def import_from_google_calendar(message: Message):
+    events, next_offset = await search_events(
+        session, user.id, query, user.language, offset=offset, limit=config.bot.page_size
+    )
+
+    if not events:
+        await message.answer(L({
+            "uk": "📭 Нічого не знайдено.",
+            "en": "📭 Nothing found."
+        }, user.language))
+        return
+
+    if not offset:
+        await message.answer(L({
+            "uk": f"🔎 <b>Результати пошуку:</b> {escape(query)}",
+            "en": f"🔎 <b>Search results:</b> {escape(query)}"
+        }, user.language))
+    for event in events:
+        await message.answer(format_event(event))
+    if next_offset:
+        await message.answer("…", reply_markup=more_button(f"find_page:{next_offset}", user.language))
+
+
+async def export_one_to_google(message: Message, session, user, event_id: int):
+    """
+        Експортує одну подію користувача в Google Calendar по callback-запиту.
+    """
+    event = await get_event_by_id(session, event_id)
+    if not event or not user or event.user_id != user.id:
+        await message.answer(L({
+            "uk": "⚠️ Подія не знайдена.",
+            "en": "⚠️ Event not found."
+        }))
+        return
+
+    await export_event_to_google(message, user, event)
+
+
+async def export_event_to_google(message: Message, user, event):
+    """
+        Експортує вже завантажену подію в Google Calendar і надсилає посилання на неї.
+    """
+    try:
+        link = await export_event(
+            user_id=user.telegram_id,
+            title=event.title,
+            date=event.date,
+            time=event.time,
+            description=event.description or "",
+            tz=user.timezone
+        )
+        await message.answer(
+            L({
+                "uk": "☁️ Подію також додано до Google Calendar!",
+                "en": "☁️ Event also exported to Google Calendar!"
+            }),
+            reply_markup=InlineKeyboardMarkup(inline_keyboard=[[InlineKeyboardButton(text="✅ Google", url=link)]])
+        )
+    except Exception as e:
+        print(f"[Export Error] {e}")
+        await message.answer(L({
+            "uk": "⚠️ Помилка при експорті!",
+            "en": "⚠️ Export failed!"
+        }))
+
+async def import_from_google_calendar(message: Message, session, user):
     """
         Імпортує події з Google Calendar для користувача.
     """
-    async with async_session() as session:
-        user = await get_user_by_telegram_id(session, message.from_user.id)
-        if not user:
-            await message.answer(L({
-                "uk": "⚠️ Спочатку зареєструйтесь через /start.",
-                "en": "⚠️ Please register first via /start."
-            }))
-            return
+    if not user:
+        await message.answer(L({
+            "uk": "⚠️ Спочатку зареєструйтесь через /start.",
+            "en": "⚠️ Please register first via /start."
+        }))
+        return
 
-        try:
-            count = await import_events_from_google(user)
-            await message.answer(L({
-                "uk": f"✅ Імпортовано {count} подій з Google Календаря.",
-                "en": f"✅ Imported {count} events from Google Calendar."
-            }, user.language))
-        except Exception as e:
-            print(f"[Import Error] {e}")
-            await message.answer(L({
-                "uk": "❌ Помилка при імпорті з Google.",
-                "en": "❌ Failed to import from Google."
-            }, user.language))
+    try:
+        count = await import_events_from_google(session, user)
+        await message.answer(L({
+            "uk": f"✅ Імпортовано {count} подій з Google Календаря.",
+            "en": f"✅ Imported {count} events from Google Calendar."
+        }, user.language))
+    except Exception as e:
+        print(f"[Import Error] {e}")
+        await message.answer(L({
+            "uk": "❌ Помилка при імпорті з Google.",
+            "en": "❌ Failed to import from Google."
+        }, user.language))
@@ -3,7 +3,6 @@ import io
 import json
 
 from aiogram.types import BufferedInputFile
-from app.repositories.user_repo import get_user_by_telegram_id
 from app.repositories.event_repo import get_events_by_user
 from app.utils.i18n import L
 from openpyxl import Workbook
@@ -14,16 +13,15 @@ from reportlab.pdfbase.ttfonts import TTFont
 from reportlab.lib.colors import HexColor
 
 
-async def generate_csv_export(session, telegram_id: int) -> BufferedInputFile | None:
+async def generate_csv_export(session, user) -> BufferedInputFile | None:
     """
     Генерує CSV-файл з подіями користувача.
     """
-    user = await get_user_by_telegram_id(session, telegram_id)
     if not user:
         return None
 
     lang = user.language
-    events = await get_events_by_user(session, user.id, ordered=True)
+    events = await get_events_by_user(session, user.id, ordered=True, with_reminders=True)
     if not events:
         return False
 
@@ -46,7 +44,7 @@ async def generate_csv_export(session, telegram_id: int) -> BufferedInputFile |
             e.time.strftime("%H:%M") if e.time else "",
             e.category or "",
             e.tag or "",
-            e.remind_before,
+            ", ".join(map(str, e.remind_offsets)),
             e.repeat,
             L({"uk": "✅", "en": "✅"}, lang) if e.is_done else L({"uk": "❌", "en": "❌"}, lang)
         ])
@@ -55,11 +53,10 @@ async def generate_csv_export(session, telegram_id: int) -> BufferedInputFile |
     return BufferedInputFile(byte_file.read(), filename="events.csv")
 
 
-async def generate_txt_export(session, telegram_id: int) -> BufferedInputFile | None:
+async def generate_txt_export(session, user) -> BufferedInputFile | None:
     """
     Генерує текстовий файл з подіями користувача (plain text).
     """
-    user = await get_user_by_telegram_id(session, telegram_id)
     if not user:
         return None
     events = await get_events_by_user(session, user.id, ordered=True)
@@ -82,14 +79,13 @@ async def generate_txt_export(session, telegram_id: int) -> BufferedInputFile |
     return BufferedInputFile(byte_file.read(), filename="events.txt")
 
 
-async def generate_json_export(session, telegram_id: int) -> BufferedInputFile | None:
+async def generate_json_export(session, user) -> BufferedInputFile | None:
     """
     Генерує JSON-файл з подіями користувача.
     """
-    user = await get_user_by_telegram_id(session, telegram_id)
     if not user:
         return None
-    events = await get_events_by_user(session, user.id, ordered=True)
+    events = await get_events_by_user(session, user.id, ordered=True, with_reminders=True)
     if not events:
         return False
 
@@ -100,7 +96,7 @@ async def generate_json_export(session, telegram_id: int) -> BufferedInputFile |
             "time": e.time.strftime("%H:%M") if e.time else None,
             "category": e.category,
             "tag": e.tag,
-            "remind_before": e.remind_before,
+            "remind_offsets": e.remind_offsets,
             "repeat": e.repeat,
             "done": e.is_done
         } for e in events
@@ -110,14 +106,13 @@ async def generate_json_export(session, telegram_id: int) -> BufferedInputFile |
     return BufferedInputFile(byte_file.read(), filename="events.json")
 
 
-async def generate_excel_export(session, telegram_id: int) -> BufferedInputFile | None:
+async def generate_excel_export(session, user) -> BufferedInputFile | None:
     """
     Генерує Excel-файл (XLSX) з подіями користувача.
     """
-    user = await get_user_by_telegram_id(session, telegram_id)
     if not user:
         return None
-    events = await get_events_by_user(session, user.id, ordered=True)
+    events = await get_events_by_user(session, user.id, ordered=True, with_reminders=True)
     if not events:
         return False
 
@@ -145,7 +140,7 @@ async def generate_excel_export(session, telegram_id: int) -> BufferedInputFile
             e.time.strftime("%H:%M") if e.time else "",
             e.category or "",
             e.tag or "",
-            e.remind_before,
+            ", ".join(map(str, e.remind_offsets)),
             e.repeat,
             "✅" if e.is_done else "❌"
         ])
@@ -156,11 +151,10 @@ async def generate_excel_export(session, telegram_id: int) -> BufferedInputFile
     return BufferedInputFile(file_stream.read(), filename="events.xlsx")
 
 
-async def generate_pdf_export(session, telegram_id: int) -> BufferedInputFile | None:
+async def generate_pdf_export(session, user) -> BufferedInputFile | None:
     """
     Генерує PDF-файл з подіями користувача (список).
     """
-    user = await get_user_by_telegram_id(session, telegram_id)
     if not user:
         return None
     events = await get_events_by_user(session, user.id, ordered=True)
@@ -209,7 +203,7 @@ async def generate_pdf_export(session, telegram_id: int) -> BufferedInputFile |
 
         c.drawString(50, block_y, f"{L({'uk': 'Повтор', 'en': 'Repeat'}, lang)}: {e.repeat}")
         block_y -= 13
-        c.drawString(50, block_y, f"{L({'uk': 'Готово', 'en': 'Done'}, lang)}: {'Так' if e.is_done else 'Ні'}")
+        c.drawString(50, block_y, f"{L({'uk': 'Готово', 'en': 'Done'}, lang)}: {L({'uk': 'Так', 'en': 'Yes'}, lang) if e.is_done else L({'uk': 'Ні', 'en': 'No'}, lang)}")
 
         y -= 100
 
@@ -1,49 +1,56 @@
 from datetime import datetime, timedelta
-from app.repositories.user_repo import get_user_by_telegram_id
-from app.repositories.event_repo import get_events_by_user
+from app.repositories.event_repo import get_events_in_range, get_first_event_date
 from app.utils.i18n import L
+from app.utils.tz import local_now
 
 
-async def get_stats_report(session, telegram_id: int, mode: str) -> str:
+async def get_stats_report(session, user, mode: str) -> str:
     """
     Створює текстовий статистичний звіт для користувача за вибраний період.
 
+    Повторювані події враховуються як окремі входження в межах періоду
+    (для "всього часу" — до 90 днів наперед).
+
     Args:
         session: SQLAlchemy сесія.
-        telegram_id (int): Telegram ID користувача.
+        user (User | None): Користувач (None, якщо ще не зареєстрований).
         mode (str): Період: "week", "month", "year" або інше (весь час).
 
     Returns:
         Tuple[user, str]: Користувач та згенерований текстовий звіт або повідомлення про відсутність подій.
     """
-    now = datetime.now()
+    if not user:
+        return None, L({
+            "uk": "⚠️ Ви ще не зареєстровані. Напишіть /start.",
+            "en": "⚠️ You are not registered yet. Please send /start."
+        })
 
+    # Період рахується в місцевому часі користувача
+    now = local_now(user.timezone)
     if mode == "month":
         date_from = now.replace(day=1).date()
+        date_to = (date_from + timedelta(days=32)).replace(day=1) - timedelta(days=1)
     elif mode == "week":
         date_from = (now - timedelta(days=now.weekday())).date()
+        date_to = date_from + timedelta(days=6)
     elif mode == "year":
         date_from = now.replace(month=1, day=1).date()
+        date_to = date_from.replace(month=12, day=31)
     else:
-        date_from = None
-
-    user = await get_user_by_telegram_id(session, telegram_id)
-    if not user:
-        return None, L({
-            "uk": "⚠️ Ви ще не зареєстровані. Напишіть /start.",
-            "en": "⚠️ You are not registered yet. Please send /start."
-        })
+        # Весь час: від найранішої події користувача, а не від date.min
+        date_from = await get_first_event_date(session, user.id)
+        date_to = now.date() + timedelta(days=90)
 
     lang = user.language
-    events = await get_events_by_user(session, user.id, ordered=False)
-    if not events:
+    filtered = []
+    if date_from is not None:
+        filtered = await get_events_in_range(session, user.id, date_from, date_to, tz=user.timezone)
+    if not filtered:
         return None, L({
             "uk": "ℹ️ У вас ще немає подій.",
             "en": "ℹ️ You have no events yet."
         }, lang)
 
-    filtered = [e for e in events if not date_from or e.date >= date_from]
-
     total = len(filtered)
     done = sum(e.is_done for e in filtered)
     upcoming = sum(
@@ -54,10 +61,13 @@ async def get_stats_report(session, telegram_id: int, mode: str) -> str:
 
     categories = {}
     repeats = {}
+    series = set()
     for e in filtered:
         if e.category:
             categories[e.category] = categories.get(e.category, 0) + 1
-        if e.repeat and e.repeat != "none":
+        # Кожна серія рахується один раз, а не за кількістю входжень
+        if e.repeat and e.repeat != "none" and e.id not in series:
+            series.add(e.id)
             repeats[e.repeat] = repeats.get(e.repeat, 0) + 1
 
     top_category = max(categories.items(), key=lambda x: x[1])[0] if categories else "-"
@@ -1,5 +1,7 @@
 from sqlalchemy.exc import SQLAlchemyError
 from app.repositories.user_repo import get_or_create_user
+from app.repositories.event_repo import get_events_by_user
+from app.scheduler.reminder_queue import reminder_queue
 
 async def handle_user_start(session, telegram_id, username, first_name, last_name):
     """
@@ -21,3 +23,28 @@ async def handle_user_start(session, telegram_id, username, first_name, last_nam
         return user, is_new
     except SQLAlchemyError as e:
         raise e
+
+
+async def set_user_timezone(session, user, tz: str) -> int:
+    """
+    Змінює часовий пояс користувача і перераховує `starts_at` та нагадування його подій.
+
+    Дата і час подій залишаються тими самими за місцевим годинником користувача.
+
+    Args:
+        session: SQLAlchemy сесія.
+        user (User): Користувач.
+        tz (str): Назва часового поясу IANA (уже перевірена).
+
+    Returns:
+        int: Кількість перерахованих подій.
+    """
+    user.timezone = tz
+    events = await get_events_by_user(session, user.id, with_reminders=True)
+    for event in events:
+        event.sync_reminders(tz)
+    await session.commit()
+
+    for event in events:
+        reminder_queue.schedule_event(event)
+    return len(events)
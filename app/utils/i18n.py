@@ -1,6 +1,6 @@
-from aiogram.types import Message
-from app.db import async_session
-from app.models.models import User
+from contextvars import ContextVar, Token
+
+from aiogram.types import User as TelegramUser
 
 DEFAULT_LANG = "uk"
 
@@ -9,23 +9,45 @@ LANGS = {
     "en": "🇺🇦 Українська"
 }
 
+# Мова поточного оновлення; встановлюється I18nMiddleware, поза оновленнями — мова за замовчуванням
+_current_lang: ContextVar[str] = ContextVar("current_lang", default=DEFAULT_LANG)
+
 def get_switch_lang(current_lang: str) -> str:
     return "en" if current_lang == "uk" else "uk"
 
 def get_lang_button(current_lang: str) -> str:
     return LANGS.get(current_lang, "🇬🇧 English")
 
-async def get_current_lang(message: Message) -> str:
-    from_user = message.from_user
-    if not from_user:
-        return DEFAULT_LANG
+def resolve_lang(user, from_user: TelegramUser | None = None) -> str:
+    """
+    Визначає мову інтерфейсу без запитів до БД.
+
+    Пріоритет: мова, збережена в профілі користувача (`User.language`),
+    потім мова клієнта Telegram, інакше `DEFAULT_LANG`.
 
-    async with async_session() as session:
-        user = await session.get(User, from_user.id)
-        if user and user.language in LANGS:
-            return user.language
+    Args:
+        user (User | None): Користувач з БД (None, якщо ще не зареєстрований).
+        from_user (TelegramUser | None): Відправник оновлення.
 
+    Returns:
+        str: Код мови з `LANGS`.
+    """
+    if user is not None and user.language in LANGS:
+        return user.language
+    if from_user is not None and from_user.language_code in LANGS:
+        return from_user.language_code
     return DEFAULT_LANG
 
-def L(texts: dict, lang: str = DEFAULT_LANG) -> str:
+def set_current_lang(lang: str) -> Token:
+    """Встановлює мову для `L()` до кінця обробки поточного оновлення."""
+    return _current_lang.set(lang)
+
+def reset_current_lang(token: Token):
+    _current_lang.reset(token)
+
+def current_lang() -> str:
+    return _current_lang.get()
+
+def L(texts: dict, lang: str | None = None) -> str:
+    lang = lang or _current_lang.get()
     return texts.get(lang) or texts.get(DEFAULT_LANG) or next(iter(texts.values()))
@@ -0,0 +1,25 @@
+from datetime import datetime, timezone
+
+
+def encode_cursor(cursor: tuple[datetime, int] | None) -> str:
+    """
+    Кодує курсор сторінки (starts_at, id) для callback_data кнопки "Ще".
+
+    Формат `<unix-секунди>.<id>` займає ~16 байтів із 64 дозволених Telegram.
+    Порожній рядок означає першу сторінку.
+    """
+    if cursor is None:
+        return ""
+    starts_at, event_id = cursor
+    return f"{int(starts_at.timestamp())}.{event_id}"
+
+
+def decode_cursor(text: str) -> tuple[datetime, int] | None:
+    """
+    Розбирає курсор, закодований `encode_cursor`; для некоректного рядка повертає None.
+    """
+    try:
+        seconds, event_id = text.split(".")
+        return datetime.fromtimestamp(int(seconds), tz=timezone.utc), int(event_id)
+    except ValueError:
+        return None
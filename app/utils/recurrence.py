@@ -0,0 +1,168 @@
+import calendar
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from functools import lru_cache
+
+from app.utils.tz import to_utc
+
+# Типи повторення, для яких подія є серією
+RECURRING_REPEATS = ("daily", "weekly", "monthly", "yearly")
+
+
+def _add_months(anchor: date, months: int) -> date:
+    """
+    Зсуває дату на вказану кількість місяців, обрізаючи день до кінця місяця (31.01 -> 28.02).
+    """
+    month_index = anchor.month - 1 + months
+    year = anchor.year + month_index // 12
+    month = month_index % 12 + 1
+    return date(year, month, min(anchor.day, calendar.monthrange(year, month)[1]))
+
+
+def nth_occurrence(anchor: date, repeat: str, n: int) -> date:
+    """
+    Повертає дату n-го входження серії (0 — сама опорна дата).
+    """
+    if repeat == "daily":
+        return anchor + timedelta(days=n)
+    if repeat == "weekly":
+        return anchor + timedelta(weeks=n)
+    if repeat == "monthly":
+        return _add_months(anchor, n)
+    if repeat == "yearly":
+        return _add_months(anchor, 12 * n)
+    raise ValueError(f"Unknown repeat type: {repeat}")
+
+
+def _first_index_on_or_after(anchor: date, repeat: str, day: date) -> int:
+    """
+    Обчислює номер першого входження, що припадає на `day` або пізніше, без перебору від початку серії.
+    """
+    if day <= anchor:
+        return 0
+    if repeat == "daily":
+        return (day - anchor).days
+    if repeat == "weekly":
+        return -(-(day - anchor).days // 7)
+    if repeat == "monthly":
+        n = (day.year - anchor.year) * 12 + day.month - anchor.month
+    else:
+        n = day.year - anchor.year
+    n = max(n, 0)
+    while nth_occurrence(anchor, repeat, n) < day:
+        n += 1
+    return n
+
+
+@lru_cache(maxsize=4096)
+def occurrence_dates(anchor: date, repeat: str, until: date | None, exceptions: frozenset,
+                     start: date, end: date) -> tuple[date, ...]:
+    """
+    Розгортає серію в дати входжень у межах [start, end].
+
+    Результат кешується для кожної комбінації правила серії та вікна,
+    тож повторні запити того самого періоду не перераховуються, а зміна
+    правила автоматично дає новий ключ кешу.
+
+    Args:
+        anchor (date): Дата першого входження.
+        repeat (str): Тип повторення.
+        until (date | None): Остання допустима дата серії.
+        exceptions (frozenset[date]): Пропущені дати.
+        start (date): Початок вікна.
+        end (date): Кінець вікна.
+
+    Returns:
+        tuple[date, ...]: Дати входжень у порядку зростання.
+    """
+    last = min(end, until) if until else end
+    result = []
+    n = _first_index_on_or_after(anchor, repeat, start)
+    while (day := nth_occurrence(anchor, repeat, n)) <= last:
+        if day not in exceptions:
+            result.append(day)
+        n += 1
+    return tuple(result)
+
+
+def series_exceptions(event) -> frozenset:
+    """
+    Повертає множину пропущених дат серії.
+    """
+    return frozenset(date.fromisoformat(d) for d in (event.repeat_exceptions or []))
+
+
+@dataclass(frozen=True)
+class Occurrence:
+    """
+    Віртуальне входження повторюваної події.
+
+    Має ті самі атрибути, що й подія-серія (id, title, time, category, ...),
+    але власні дату та статус виконання.
+
+    Атрибути:
+        event (Event): Подія-серія, що зберігає правило повторення.
+        date (date): Дата входження.
+        is_done (bool): Чи вважається входження завершеним.
+    """
+    event: object
+    date: date
+    is_done: bool
+
+    def __getattr__(self, name):
+        return getattr(self.event, name)
+
+
+def _occurrence_done(event, day: date, now: datetime) -> bool:
+    # Як і автозавершення: подія з часом завершена, якщо минула понад годину тому
+    if event.is_done:
+        return True
+    return event.time is not None and datetime.combine(day, event.time) < now - timedelta(hours=1)
+
+
+def expand_event(event, start: date, end: date, now: datetime | None = None) -> list:
+    """
+    Повертає входження події у вікні [start, end].
+
+    Для звичайної події — саму подію (якщо вона у вікні), для серії — віртуальні входження.
+    """
+    if event.repeat not in RECURRING_REPEATS:
+        return [event] if start <= event.date <= end else []
+
+    now = now or datetime.now()
+    dates = occurrence_dates(
+        event.date, event.repeat, event.repeat_until, series_exceptions(event), start, end
+    )
+    return [Occurrence(event, day, _occurrence_done(event, day, now)) for day in dates]
+
+
+def first_remind_at(event, offset: int, not_before: datetime, tz: str | None = None) -> datetime | None:
+    """
+    Знаходить перший момент нагадування серії, що не раніше `not_before`.
+
+    Входження повторюються в місцевому часі користувача (о тій самій годині
+    й після переходу на літній час), а результат повертається в UTC.
+
+    Args:
+        event: Подія-серія.
+        offset (int): За скільки хвилин до входження надсилається нагадування.
+        not_before (datetime): Найраніший допустимий момент нагадування (aware).
+        tz (str | None): Часовий пояс користувача.
+
+    Returns:
+        datetime | None: Момент нагадування в UTC або None, якщо серія вже закінчилась.
+    """
+    remind = timedelta(minutes=offset)
+    threshold = not_before + remind
+    exceptions = series_exceptions(event)
+
+    # Індекс оцінюється за UTC-датою; можливий зсув на день компенсує перевірка нижче
+    n = max(_first_index_on_or_after(event.date, event.repeat, threshold.date()) - 1, 0)
+    while True:
+        day = nth_occurrence(event.date, event.repeat, n)
+        if event.repeat_until and day > event.repeat_until:
+            return None
+        start = to_utc(day, event.time, tz)
+        if day not in exceptions and start >= threshold:
+            return start - remind
+        n += 1
@@ -0,0 +1,76 @@
+from datetime import date, datetime, time, timedelta, timezone
+from functools import lru_cache
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+from app.config import config
+
+
+def utc_now() -> datetime:
+    """
+    Повертає поточний момент в UTC (aware datetime).
+    """
+    return datetime.now(timezone.utc)
+
+
+@lru_cache(maxsize=None)
+def get_zone(name: str | None = None) -> ZoneInfo:
+    """
+    Повертає часовий пояс за назвою IANA (за замовчуванням — `config.scheduler.timezone`).
+    """
+    return ZoneInfo(name or config.scheduler.timezone)
+
+
+def is_valid_timezone(name: str) -> bool:
+    """
+    Перевіряє, чи є рядок відомою назвою часового поясу IANA (наприклад, 'Europe/Kyiv').
+    """
+    try:
+        get_zone(name)
+    except (ZoneInfoNotFoundError, ValueError):
+        return False
+    return True
+
+
+def to_utc(day: date, at: time | None, tz: str | None = None) -> datetime:
+    """
+    Перетворює місцеві дату і час користувача на момент в UTC.
+
+    Подія без часу вважається такою, що починається опівночі.
+
+    Args:
+        day (date): Місцева дата.
+        at (time | None): Місцевий час.
+        tz (str | None): Часовий пояс користувача.
+
+    Returns:
+        datetime: Aware datetime в UTC.
+    """
+    return datetime.combine(day, at or time.min, tzinfo=get_zone(tz)).astimezone(timezone.utc)
+
+
+def local_now(tz: str | None = None) -> datetime:
+    """
+    Повертає поточний місцевий час користувача (naive, як і дати та час подій).
+    """
+    return utc_now().astimezone(get_zone(tz)).replace(tzinfo=None)
+
+
+def local_today(tz: str | None = None) -> date:
+    """
+    Повертає поточну місцеву дату користувача.
+    """
+    return local_now(tz).date()
+
+
+def day_range_utc(start: date, end: date, tz: str | None = None) -> tuple[datetime, datetime]:
+    """
+    Перетворює місцевий діапазон днів [start, end] на напіввідкритий інтервал в UTC.
+
+    `date.min` і `date.max` означають відсутність межі.
+
+    Returns:
+        tuple[datetime, datetime]: Початок (включно) і кінець (не включно) в UTC.
+    """
+    lower = datetime.min.replace(tzinfo=timezone.utc) if start == date.min else to_utc(start, None, tz)
+    upper = datetime.max.replace(tzinfo=timezone.utc) if end == date.max else to_utc(end + timedelta(days=1), None, tz)
+    return lower, upper
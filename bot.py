@@ -3,11 +3,14 @@ import logging
 
 from aiogram import Bot, Dispatcher
 from aiogram.client.default import DefaultBotProperties
+from aiogram.client.session.aiohttp import AiohttpSession
 from aiogram.enums import ParseMode
 from aiogram.fsm.storage.memory import MemoryStorage
 
 from app.config import config
-from app.scheduler.scheduler import start_scheduler
+from app.middlewares import DbSessionMiddleware, I18nMiddleware, ReachabilityMiddleware
+from app.scheduler.metrics import start_metrics_server, stop_metrics_server
+from app.scheduler.scheduler import start_scheduler, stop_scheduler
 from app.utils.i18n import L
 
 from app.handlers import (
@@ -22,6 +25,9 @@ from app.handlers import (
     event_chart,
     event_export,
     event_done,
+    event_find,
+    event_timezone,
+    event_metrics,
     event_fallback,
 )
 
@@ -37,6 +43,9 @@ routers = [
     event_chart.router,
     event_export.router,
     event_done.router,
+    event_find.router,
+    event_timezone.router,
+    event_metrics.router,
     event_fallback.router,
 ]
 
@@ -56,18 +65,31 @@ async def main():
         format="%(asctime)s [%(levelname)s] %(name)s: %(message)s"
     )
 
+    # Одна HTTP-сесія з keep-alive на весь процес: і для polling, і для нагадувань
     bot = Bot(
         token=config.bot.token,
+        session=AiohttpSession(limit=config.bot.connection_limit),
         default=DefaultBotProperties(parse_mode=ParseMode.HTML)
     )
     dp = Dispatcher(storage=MemoryStorage())
+    # Порядок важливий: наступні middleware використовують сесію та користувача з DbSessionMiddleware
+    dp.update.outer_middleware(DbSessionMiddleware())
+    dp.update.outer_middleware(I18nMiddleware())
+    dp.update.outer_middleware(ReachabilityMiddleware())
 
     for router in routers:
         dp.include_router(router)
 
-    await start_scheduler()
+    # Планувальник зупиняється раніше, ніж polling закриє сесію бота
+    dp.shutdown.register(stop_scheduler)
+    dp.shutdown.register(stop_metrics_server)
+
+    await start_metrics_server(config.scheduler.metrics_host, config.scheduler.metrics_port)
+    await start_scheduler(bot)
     await on_startup(bot)
-    await dp.start_polling(bot, skip_updates=config.bot.skip_updates)
+    # my_chat_member потрібен ReachabilityMiddleware, хоча окремого обробника не має
+    allowed_updates = sorted(set(dp.resolve_used_update_types()) | {"my_chat_member"})
+    await dp.start_polling(bot, skip_updates=config.bot.skip_updates, allowed_updates=allowed_updates)
 
 
 if __name__ == "__main__":
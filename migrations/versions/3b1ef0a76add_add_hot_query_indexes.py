@@ -0,0 +1,42 @@
+"""Add composite indexes for hot event and outbox queries
+
+Revision ID: 3b1ef0a76add
+Revises: 545a3b61e268
+Create Date: 2026-10-18 18:31:09.846120
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3b1ef0a76add'
+down_revision: Union[str, None] = '545a3b61e268'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (назва, таблиця, колонки)
+INDEXES = [
+    # get_events_by_user(ordered=True) та exists_event: фільтр і сортування за (user_id, date, time)
+    ('ix_events_user_date_time', 'events', ['user_id', 'date', 'time']),
+    # Гілка серій у get_events_in_range / get_upcoming_events_by_user: user_id = ? AND repeat IN (...)
+    ('ix_events_user_repeat_date', 'events', ['user_id', 'repeat', 'date']),
+    # Каскадне видалення подій: після e4633c55bda1 event_id outbox лишився без індексу
+    ('ix_reminder_outbox_event_id', 'reminder_outbox', ['event_id']),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # CREATE INDEX CONCURRENTLY не блокує запис у таблиці, але не може виконуватись у транзакції
+    with op.get_context().autocommit_block():
+        for name, table, columns in INDEXES:
+            op.create_index(name, table, columns, unique=False, postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        for name, table, _ in reversed(INDEXES):
+            op.drop_index(name, table_name=table, postgresql_concurrently=True)
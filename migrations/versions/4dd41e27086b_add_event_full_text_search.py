@@ -0,0 +1,68 @@
+"""Add full-text search over event titles and descriptions
+
+Revision ID: 4dd41e27086b
+Revises: 9a3892e04cdb
+Create Date: 2026-10-18 19:37:15.204967
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4dd41e27086b'
+down_revision: Union[str, None] = '9a3892e04cdb'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Лексеми 'english' (стемінг для en) і 'simple' (для uk) в одному векторі;
+# назва має вагу A, опис — B
+SEARCH_VECTOR = (
+    "setweight(to_tsvector('english', coalesce(title, '')), 'A') || "
+    "setweight(to_tsvector('simple', coalesce(title, '')), 'A') || "
+    "setweight(to_tsvector('english', coalesce(description, '')), 'B') || "
+    "setweight(to_tsvector('simple', coalesce(description, '')), 'B')"
+)
+
+# SQLite: зовнішня FTS5-таблиця над events, синхронізується тригерами
+SQLITE_UPGRADE = [
+    "CREATE VIRTUAL TABLE events_fts USING fts5(title, description, content='events', content_rowid='id')",
+    "CREATE TRIGGER events_fts_ai AFTER INSERT ON events BEGIN "
+    "INSERT INTO events_fts(rowid, title, description) VALUES (new.id, new.title, new.description); END",
+    "CREATE TRIGGER events_fts_ad AFTER DELETE ON events BEGIN "
+    "INSERT INTO events_fts(events_fts, rowid, title, description) "
+    "VALUES ('delete', old.id, old.title, old.description); END",
+    "CREATE TRIGGER events_fts_au AFTER UPDATE OF title, description ON events BEGIN "
+    "INSERT INTO events_fts(events_fts, rowid, title, description) "
+    "VALUES ('delete', old.id, old.title, old.description); "
+    "INSERT INTO events_fts(rowid, title, description) VALUES (new.id, new.title, new.description); END",
+    "INSERT INTO events_fts(events_fts) VALUES ('rebuild')",
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    if op.get_bind().dialect.name == 'sqlite':
+        for statement in SQLITE_UPGRADE:
+            op.execute(statement)
+        return
+
+    op.add_column('events', sa.Column(
+        'search_vector', postgresql.TSVECTOR(), sa.Computed(SEARCH_VECTOR, persisted=True), nullable=True
+    ))
+    op.create_index('ix_events_search_vector', 'events', ['search_vector'], unique=False, postgresql_using='gin')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name == 'sqlite':
+        for trigger in ('events_fts_au', 'events_fts_ad', 'events_fts_ai'):
+            op.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+        op.execute("DROP TABLE IF EXISTS events_fts")
+        return
+
+    op.drop_index('ix_events_search_vector', table_name='events')
+    op.drop_column('events', 'search_vector')
@@ -0,0 +1,158 @@
+"""Store recurrence rule on events instead of cloned rows
+
+Revision ID: 4f2fb661eb72
+Revises: ed4319245d06
+Create Date: 2026-10-18 15:21:40.106583
+
+"""
+import calendar
+import logging
+from collections import defaultdict
+from datetime import date, datetime, timedelta
+from typing import Sequence, Union
+from zoneinfo import ZoneInfo
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4f2fb661eb72'
+down_revision: Union[str, None] = 'ed4319245d06'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# На цій ревізії дати й час зберігаються в місцевому часі сервера
+SERVER_TIMEZONE = 'Europe/Kyiv'
+
+# Поля, які користувач міг змінити в окремому клоні; is_done і notified — стан, а не зміна
+EDITABLE_FIELDS = ('description', 'category', 'tag', 'remind_before')
+
+logger = logging.getLogger('alembic.runtime.migration')
+
+
+def _legacy_next_date(current, repeat):
+    """Крок, яким планувальник раніше створював клон наступного входження."""
+    if repeat == "daily":
+        return current + timedelta(days=1)
+    if repeat == "weekly":
+        return current + timedelta(weeks=1)
+    if repeat == "monthly":
+        try:
+            return current.replace(month=current.month % 12 + 1, year=current.year + (current.month // 12))
+        except ValueError:
+            return (current.replace(day=1) + timedelta(days=32)).replace(day=1)
+    try:
+        return current.replace(year=current.year + 1)
+    except ValueError:
+        return current + timedelta(days=365)
+
+
+def _nth_occurrence(anchor, repeat, n):
+    """Дата n-го входження серії; день місяця обрізається до кінця місяця (31.01 -> 28.02)."""
+    if repeat == "daily":
+        return anchor + timedelta(days=n)
+    if repeat == "weekly":
+        return anchor + timedelta(weeks=n)
+    months = n if repeat == "monthly" else 12 * n
+    month_index = anchor.month - 1 + months
+    year = anchor.year + month_index // 12
+    month = month_index % 12 + 1
+    return date(year, month, min(anchor.day, calendar.monthrange(year, month)[1]))
+
+
+def _first_remind_at(row, now):
+    """
+    Перший момент нагадування серії, не раніше `now` (місцевий naive час сервера).
+
+    Розрахунок зафіксовано на цій ревізії, щоб міграція не залежала від коду застосунку.
+    """
+    remind = timedelta(minutes=row.remind_before)
+    threshold = now + remind
+    days = (threshold.date() - row.date).days
+    if row.repeat == "daily":
+        n = days
+    elif row.repeat == "weekly":
+        n = days // 7
+    elif row.repeat == "monthly":
+        n = (threshold.year - row.date.year) * 12 + threshold.month - row.date.month
+    else:
+        n = threshold.year - row.date.year
+    n = max(n - 1, 0)
+    while True:
+        start = datetime.combine(_nth_occurrence(row.date, row.repeat, n), row.time)
+        if start >= threshold:
+            return start - remind
+        n += 1
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('events', sa.Column('repeat_until', sa.Date(), nullable=True))
+    op.add_column('events', sa.Column('repeat_exceptions', sa.JSON(), nullable=True))
+
+    bind = op.get_bind()
+    rows = bind.execute(sa.text(
+        "SELECT id, user_id, title, description, category, tag, date, time, repeat, remind_before FROM events "
+        "WHERE repeat IN ('daily', 'weekly', 'monthly', 'yearly') ORDER BY date, id"
+    ).columns(date=sa.Date(), time=sa.Time())).all()
+
+    # Ланцюжки клонів (та сама назва, час і тип повтору, дата = крок від попередньої)
+    # згортаються в одну серію — найранішу подію ланцюжка.
+    # Клон, який користувач змінив (опис, категорія, теги, нагадування), не видаляється:
+    # він лишається окремою одноразовою подією, а його дата стає винятком серії.
+    chains = defaultdict(list)
+    for row in rows:
+        chains[(row.user_id, row.title, row.time, row.repeat)].append(row)
+
+    anchors, clones, edited = [], [], []
+    exceptions = defaultdict(list)
+    for chain in chains.values():
+        tails = {}
+        for row in chain:
+            anchor = tails.pop(row.date, None)
+            if anchor is None:
+                anchor = row
+                anchors.append(row)
+            elif any(getattr(row, field) != getattr(anchor, field) for field in EDITABLE_FIELDS):
+                edited.append(row.id)
+                exceptions[anchor.id].append(row.date.isoformat())
+            else:
+                clones.append(row.id)
+            tails[_legacy_next_date(row.date, row.repeat)] = anchor
+
+    if clones:
+        bind.execute(sa.text("DELETE FROM events WHERE id IN :ids").bindparams(
+            sa.bindparam("ids", expanding=True)), {"ids": clones})
+    if edited:
+        bind.execute(sa.text("UPDATE events SET repeat = 'none' WHERE id IN :ids").bindparams(
+            sa.bindparam("ids", expanding=True)), {"ids": edited})
+    logger.info(
+        f"Collapsed {len(clones)} cloned occurrence(s) into {len(anchors)} series; "
+        f"kept {len(edited)} edited occurrence(s) as one-off events: {edited}"
+    )
+
+    now = datetime.now(ZoneInfo(SERVER_TIMEZONE)).replace(tzinfo=None)
+    for row in anchors:
+        remind_at = None
+        if row.time is not None and (row.remind_before or 0) > 0:
+            remind_at = _first_remind_at(row, now)
+        bind.execute(
+            sa.text(
+                "UPDATE events SET is_done = false, notified = :notified, remind_at = :remind_at, "
+                "repeat_exceptions = :repeat_exceptions WHERE id = :id"
+            ).bindparams(
+                sa.bindparam("remind_at", type_=sa.DateTime()),
+                sa.bindparam("repeat_exceptions", type_=sa.JSON()),
+            ),
+            {
+                "id": row.id, "notified": remind_at is None and row.time is not None, "remind_at": remind_at,
+                "repeat_exceptions": exceptions.get(row.id),
+            },
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('events', 'repeat_exceptions')
+    op.drop_column('events', 'repeat_until')
@@ -0,0 +1,30 @@
+"""Add user reachability flag
+
+Revision ID: 545a3b61e268
+Revises: 99c7576ccede
+Create Date: 2026-10-18 18:02:47.519304
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '545a3b61e268'
+down_revision: Union[str, None] = '99c7576ccede'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('users', sa.Column('is_reachable', sa.Boolean(), server_default=sa.true(), nullable=False))
+    op.add_column('users', sa.Column('blocked_at', sa.DateTime(timezone=True), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('users', 'blocked_at')
+    op.drop_column('users', 'is_reachable')
@@ -0,0 +1,33 @@
+"""Add partial index for auto-completion of past events
+
+Revision ID: 7fab38d513c1
+Revises: 9712b63c0059
+Create Date: 2026-10-18 11:40:27.902114
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7fab38d513c1'
+down_revision: Union[str, None] = '9712b63c0059'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        'ix_events_pending_date_time', 'events', ['date', 'time'],
+        unique=False,
+        postgresql_where=sa.text('is_done = false AND time IS NOT NULL'),
+        sqlite_where=sa.text('is_done = 0 AND time IS NOT NULL'),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_events_pending_date_time', table_name='events')
@@ -0,0 +1,40 @@
+"""Add covering index for open events of a user
+
+Revision ID: 86454fd002ef
+Revises: a5e2fdf0adab
+Create Date: 2026-10-18 20:12:37.418206
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '86454fd002ef'
+down_revision: Union[str, None] = 'a5e2fdf0adab'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # CREATE INDEX CONCURRENTLY не блокує запис у таблиці, але не може виконуватись у транзакції
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_events_user_open_starts_at',
+            'events',
+            ['user_id', 'starts_at'],
+            unique=False,
+            postgresql_include=['id', 'title', 'date', 'time', 'repeat', 'category_id', 'is_done'],
+            postgresql_where=sa.text('is_done = false'),
+            sqlite_where=sa.text('is_done = 0'),
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_events_user_open_starts_at', table_name='events', postgresql_concurrently=True)
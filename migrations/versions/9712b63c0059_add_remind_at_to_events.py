@@ -0,0 +1,43 @@
+"""Add remind_at column to events
+
+Revision ID: 9712b63c0059
+Revises: 4929e60b3f9e
+Create Date: 2026-10-18 10:12:04.518233
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9712b63c0059'
+down_revision: Union[str, None] = '4929e60b3f9e'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('events', sa.Column('remind_at', sa.DateTime(), nullable=True))
+    if op.get_bind().dialect.name == 'postgresql':
+        remind_at = "(date + time) - make_interval(mins => remind_before)"
+    else:
+        remind_at = "datetime(date || ' ' || time, '-' || remind_before || ' minutes')"
+    op.execute(
+        f"UPDATE events SET remind_at = {remind_at} "
+        "WHERE time IS NOT NULL AND remind_before > 0"
+    )
+    op.create_index(
+        'ix_events_remind_at_pending', 'events', ['remind_at'],
+        unique=False,
+        postgresql_where=sa.text('notified = false AND is_done = false'),
+        sqlite_where=sa.text('notified = 0 AND is_done = 0'),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_events_remind_at_pending', table_name='events')
+    op.drop_column('events', 'remind_at')
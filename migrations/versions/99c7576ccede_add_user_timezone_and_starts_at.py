@@ -0,0 +1,141 @@
+"""Add user timezone and UTC starts_at to events
+
+Revision ID: 99c7576ccede
+Revises: e4633c55bda1
+Create Date: 2026-10-18 17:11:26.402915
+
+"""
+from datetime import datetime, time, timezone
+from typing import Sequence, Union
+from zoneinfo import ZoneInfo
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '99c7576ccede'
+down_revision: Union[str, None] = 'e4633c55bda1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Часовий пояс, у якому досі зберігались усі naive дати
+LEGACY_TIMEZONE = 'Europe/Kyiv'
+
+# Колонки з моментами часу, що переходять на timestamptz (UTC)
+UTC_COLUMNS = [
+    ('event_reminders', 'fire_at', False),
+    ('event_reminders', 'sent_at', True),
+    ('reminder_outbox', 'fire_at', False),
+    ('reminder_outbox', 'next_attempt_at', False),
+    ('reminder_outbox', 'sent_at', True),
+]
+
+
+def _sqlite_backfill() -> None:
+    """
+    SQLite не має `AT TIME ZONE` і `UPDATE ... FROM`: `starts_at` рахується в Python,
+    а наявні naive моменти переводяться з LEGACY_TIMEZONE в UTC (зберігаються як naive UTC).
+    """
+    bind = op.get_bind()
+    events = sa.table(
+        'events', sa.column('id', sa.Integer), sa.column('user_id', sa.Integer),
+        sa.column('date', sa.Date), sa.column('time', sa.Time), sa.column('starts_at', sa.DateTime),
+    )
+    users = sa.table('users', sa.column('id', sa.Integer), sa.column('timezone', sa.String))
+    rows = bind.execute(
+        sa.select(events.c.id, events.c.date, events.c.time, users.c.timezone)
+        .join(users, users.c.id == events.c.user_id)
+    ).all()
+    if rows:
+        bind.execute(
+            events.update().where(events.c.id == sa.bindparam('event_id')).values(starts_at=sa.bindparam('value')),
+            [
+                {
+                    'event_id': row.id,
+                    'value': datetime.combine(row.date, row.time or time.min, tzinfo=ZoneInfo(row.timezone))
+                    .astimezone(timezone.utc).replace(tzinfo=None),
+                }
+                for row in rows
+            ],
+        )
+
+    legacy = ZoneInfo(LEGACY_TIMEZONE)
+    for table_name, column, _ in UTC_COLUMNS:
+        table = sa.table(table_name, sa.column('id', sa.Integer), sa.column(column, sa.DateTime))
+        rows = bind.execute(sa.select(table.c.id, table.c[column]).where(table.c[column].isnot(None))).all()
+        if rows:
+            bind.execute(
+                table.update().where(table.c.id == sa.bindparam('row_id')).values({column: sa.bindparam('value')}),
+                [
+                    {'row_id': row_id, 'value': value.replace(tzinfo=legacy).astimezone(timezone.utc).replace(tzinfo=None)}
+                    for row_id, value in rows
+                ],
+            )
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('users', sa.Column(
+        'timezone', sa.String(length=64), server_default=LEGACY_TIMEZONE, nullable=False
+    ))
+
+    op.add_column('events', sa.Column('starts_at', sa.DateTime(timezone=True), nullable=True))
+    postgres = op.get_bind().dialect.name == 'postgresql'
+    if postgres:
+        op.execute(
+            "UPDATE events SET starts_at = (events.date + COALESCE(events.time, time '00:00')) "
+            "AT TIME ZONE users.timezone "
+            "FROM users WHERE users.id = events.user_id"
+        )
+    else:
+        _sqlite_backfill()
+    with op.batch_alter_table('events') as batch_op:
+        batch_op.alter_column('starts_at', existing_type=sa.DateTime(timezone=True), nullable=False)
+    op.create_index('ix_events_user_starts_at', 'events', ['user_id', 'starts_at'], unique=False)
+
+    op.drop_index('ix_events_pending_date_time', table_name='events')
+    op.create_index(
+        'ix_events_pending_starts_at', 'events', ['starts_at'],
+        unique=False,
+        postgresql_where=sa.text('is_done = false AND time IS NOT NULL'),
+        sqlite_where=sa.text('is_done = 0 AND time IS NOT NULL'),
+    )
+
+    # На SQLite тип колонки лише номінальний: значення вже переведені в UTC вище
+    if not postgres:
+        return
+    for table, column, nullable in UTC_COLUMNS:
+        op.alter_column(
+            table, column,
+            type_=sa.DateTime(timezone=True),
+            existing_type=sa.DateTime(),
+            existing_nullable=nullable,
+            postgresql_using=f"{column} AT TIME ZONE '{LEGACY_TIMEZONE}'",
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    postgres = op.get_bind().dialect.name == 'postgresql'
+    for table, column, nullable in UTC_COLUMNS if postgres else []:
+        op.alter_column(
+            table, column,
+            type_=sa.DateTime(),
+            existing_type=sa.DateTime(timezone=True),
+            existing_nullable=nullable,
+            postgresql_using=f"{column} AT TIME ZONE '{LEGACY_TIMEZONE}'",
+        )
+
+    op.drop_index('ix_events_pending_starts_at', table_name='events')
+    op.create_index(
+        'ix_events_pending_date_time', 'events', ['date', 'time'],
+        unique=False,
+        postgresql_where=sa.text('is_done = false AND time IS NOT NULL'),
+        sqlite_where=sa.text('is_done = 0 AND time IS NOT NULL'),
+    )
+    op.drop_index('ix_events_user_starts_at', table_name='events')
+    with op.batch_alter_table('events') as batch_op:
+        batch_op.drop_column('starts_at')
+    with op.batch_alter_table('users') as batch_op:
+        batch_op.drop_column('timezone')
@@ -0,0 +1,136 @@
+"""Move event tags and categories into lookup tables
+
+Revision ID: 9a3892e04cdb
+Revises: 3b1ef0a76add
+Create Date: 2026-10-18 19:04:52.731816
+
+"""
+from collections import defaultdict
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9a3892e04cdb'
+down_revision: Union[str, None] = '3b1ef0a76add'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _normalize(name: str) -> str:
+    """Та сама нормалізація, що й під час запису: без '#' і пробілів, нижній регістр."""
+    return name.strip().lstrip('#').strip().lower()[:64]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    categories = op.create_table('categories',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('name', sa.String(length=64), nullable=False),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('user_id', 'name', name='uq_categories_user_name')
+    )
+    tags = op.create_table('tags',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('name', sa.String(length=64), nullable=False),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('user_id', 'name', name='uq_tags_user_name')
+    )
+    event_tags = op.create_table('event_tags',
+    sa.Column('event_id', sa.Integer(), nullable=False),
+    sa.Column('tag_id', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['event_id'], ['events.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['tag_id'], ['tags.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('event_id', 'tag_id')
+    )
+    op.create_index('ix_event_tags_tag_id_event_id', 'event_tags', ['tag_id', 'event_id'], unique=False)
+
+    # batch: на SQLite зміна обмежень виконується перестворенням таблиці
+    with op.batch_alter_table('events') as batch_op:
+        batch_op.add_column(sa.Column('category_id', sa.Integer(), nullable=True))
+        batch_op.create_foreign_key(
+            'fk_events_category_id', 'categories', ['category_id'], ['id'], ondelete='SET NULL'
+        )
+    op.create_index(op.f('ix_events_category_id'), 'events', ['category_id'], unique=False)
+
+    # Розбиваємо наявні рядки: категорія — одна назва, теги — через кому
+    bind = op.get_bind()
+    rows = bind.execute(sa.text(
+        "SELECT id, user_id, category, tag FROM events WHERE category IS NOT NULL OR tag IS NOT NULL"
+    )).all()
+
+    event_category = {}
+    event_tag_names = defaultdict(list)
+    category_names, tag_names = set(), set()
+    for row in rows:
+        category = _normalize(row.category or '')
+        if category:
+            event_category[row.id] = (row.user_id, category)
+            category_names.add((row.user_id, category))
+        for part in (row.tag or '').split(','):
+            name = _normalize(part)
+            if name and name not in event_tag_names[row.id]:
+                event_tag_names[row.id].append(name)
+                tag_names.add((row.user_id, name))
+
+    if category_names:
+        op.bulk_insert(categories, [{'user_id': u, 'name': n} for u, n in category_names])
+        category_ids = {
+            (r.user_id, r.name): r.id
+            for r in bind.execute(sa.text("SELECT id, user_id, name FROM categories"))
+        }
+        bind.execute(
+            sa.text("UPDATE events SET category_id = :category_id WHERE id = :id"),
+            [{'id': event_id, 'category_id': category_ids[key]} for event_id, key in event_category.items()],
+        )
+
+    if tag_names:
+        op.bulk_insert(tags, [{'user_id': u, 'name': n} for u, n in tag_names])
+        tag_ids = {(r.user_id, r.name): r.id for r in bind.execute(sa.text("SELECT id, user_id, name FROM tags"))}
+        user_of = {row.id: row.user_id for row in rows}
+        op.bulk_insert(event_tags, [
+            {'event_id': event_id, 'tag_id': tag_ids[(user_of[event_id], name)]}
+            for event_id, names in event_tag_names.items()
+            for name in names
+        ])
+
+    with op.batch_alter_table('events') as batch_op:
+        batch_op.drop_column('tag')
+        batch_op.drop_column('category')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.add_column('events', sa.Column('category', sa.String(length=64), nullable=True))
+    op.add_column('events', sa.Column('tag', sa.String(length=64), nullable=True))
+
+    bind = op.get_bind()
+    bind.execute(sa.text(
+        "UPDATE events SET category = (SELECT name FROM categories WHERE categories.id = events.category_id)"
+    ))
+    tags_by_event = defaultdict(list)
+    for row in bind.execute(sa.text(
+        "SELECT event_tags.event_id, tags.name FROM event_tags "
+        "JOIN tags ON tags.id = event_tags.tag_id ORDER BY tags.name"
+    )):
+        tags_by_event[row.event_id].append(row.name)
+    if tags_by_event:
+        bind.execute(
+            sa.text("UPDATE events SET tag = :tag WHERE id = :id"),
+            [{'id': event_id, 'tag': ', '.join(names)[:64]} for event_id, names in tags_by_event.items()],
+        )
+
+    op.drop_index(op.f('ix_events_category_id'), table_name='events')
+    with op.batch_alter_table('events') as batch_op:
+        batch_op.drop_constraint('fk_events_category_id', type_='foreignkey')
+        batch_op.drop_column('category_id')
+    op.drop_index('ix_event_tags_tag_id_event_id', table_name='event_tags')
+    op.drop_table('event_tags')
+    op.drop_table('tags')
+    op.drop_table('categories')
@@ -0,0 +1,39 @@
+"""Store Google Calendar event id for import deduplication
+
+Revision ID: a5e2fdf0adab
+Revises: 4dd41e27086b
+Create Date: 2026-10-18 20:06:33.518402
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a5e2fdf0adab'
+down_revision: Union[str, None] = '4dd41e27086b'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('events', sa.Column('google_event_id', sa.String(length=255), nullable=True))
+    # NULL (події, створені в боті) не конфліктують між собою
+    if op.get_bind().dialect.name == 'sqlite':
+        # SQLite не додає обмеження до наявної таблиці, а перестворення events прибрало б
+        # FTS-тригери; унікальний індекс так само працює для ON CONFLICT
+        op.create_index('uq_events_user_google_event_id', 'events', ['user_id', 'google_event_id'], unique=True)
+    else:
+        op.create_unique_constraint('uq_events_user_google_event_id', 'events', ['user_id', 'google_event_id'])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name == 'sqlite':
+        op.drop_index('uq_events_user_google_event_id', table_name='events')
+    else:
+        op.drop_constraint('uq_events_user_google_event_id', 'events', type_='unique')
+    op.drop_column('events', 'google_event_id')
@@ -0,0 +1,99 @@
+"""Move reminders into event_reminders table
+
+Revision ID: e4633c55bda1
+Revises: 4f2fb661eb72
+Create Date: 2026-10-18 16:02:17.843920
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e4633c55bda1'
+down_revision: Union[str, None] = '4f2fb661eb72'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _nearest_reminder(column: str) -> str:
+    """Підзапит: значення `column` найближчого (з найменшим відступом) нагадування події."""
+    return (
+        f"(SELECT {column} FROM event_reminders r WHERE r.event_id = events.id "
+        'ORDER BY r."offset" LIMIT 1)'
+    )
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('event_reminders',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('event_id', sa.Integer(), nullable=False),
+    sa.Column('offset', sa.Integer(), nullable=False),
+    sa.Column('fire_at', sa.DateTime(), nullable=False),
+    sa.Column('sent_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['event_id'], ['events.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('event_id', 'offset', name='uq_event_reminders_event_offset')
+    )
+    op.create_index(
+        'ix_event_reminders_pending', 'event_reminders', ['fire_at'],
+        unique=False,
+        postgresql_where=sa.text('sent_at IS NULL'),
+        sqlite_where=sa.text('sent_at IS NULL'),
+    )
+
+    # Єдине нагадування кожної події стає першим записом event_reminders
+    op.execute(
+        'INSERT INTO event_reminders (event_id, "offset", fire_at, sent_at) '
+        "SELECT id, remind_before, remind_at, CASE WHEN notified THEN CURRENT_TIMESTAMP END "
+        "FROM events WHERE remind_at IS NOT NULL AND remind_before > 0"
+    )
+
+    # batch: на SQLite зміна обмежень виконується перестворенням таблиці
+    with op.batch_alter_table('reminder_outbox') as batch_op:
+        batch_op.add_column(sa.Column('reminder_id', sa.Integer(), nullable=True))
+        batch_op.create_foreign_key(
+            'fk_reminder_outbox_reminder_id', 'event_reminders',
+            ['reminder_id'], ['id'], ondelete='CASCADE'
+        )
+        batch_op.drop_constraint('uq_reminder_outbox_event_fire_at', type_='unique')
+        batch_op.create_unique_constraint('uq_reminder_outbox_reminder_fire_at', ['reminder_id', 'fire_at'])
+
+    op.drop_index('ix_events_remind_at_pending', table_name='events')
+    with op.batch_alter_table('events') as batch_op:
+        batch_op.drop_column('remind_at')
+        batch_op.drop_column('notified')
+        batch_op.drop_column('remind_before')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.add_column('events', sa.Column('remind_before', sa.Integer(), server_default='10', nullable=False))
+    op.add_column('events', sa.Column('notified', sa.Boolean(), server_default=sa.false(), nullable=False))
+    op.add_column('events', sa.Column('remind_at', sa.DateTime(), nullable=True))
+    # Повертається лише найближче (з найменшим відступом) нагадування події
+    offset, fire_at, notified = (
+        _nearest_reminder(column) for column in ('r."offset"', 'r.fire_at', 'r.sent_at IS NOT NULL')
+    )
+    op.execute(
+        f"UPDATE events SET remind_before = {offset}, remind_at = {fire_at}, notified = {notified} "
+        "WHERE EXISTS (SELECT 1 FROM event_reminders r WHERE r.event_id = events.id)"
+    )
+    op.create_index(
+        'ix_events_remind_at_pending', 'events', ['remind_at'],
+        unique=False,
+        postgresql_where=sa.text('notified = false AND is_done = false'),
+        sqlite_where=sa.text('notified = 0 AND is_done = 0'),
+    )
+
+    with op.batch_alter_table('reminder_outbox') as batch_op:
+        batch_op.drop_constraint('uq_reminder_outbox_reminder_fire_at', type_='unique')
+        batch_op.create_unique_constraint('uq_reminder_outbox_event_fire_at', ['event_id', 'fire_at'])
+        batch_op.drop_constraint('fk_reminder_outbox_reminder_id', type_='foreignkey')
+        batch_op.drop_column('reminder_id')
+
+    op.drop_index('ix_event_reminders_pending', table_name='event_reminders')
+    op.drop_table('event_reminders')
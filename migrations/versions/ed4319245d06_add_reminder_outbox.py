@@ -0,0 +1,49 @@
+"""Add reminder_outbox table
+
+Revision ID: ed4319245d06
+Revises: 7fab38d513c1
+Create Date: 2026-10-18 13:05:51.337410
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'ed4319245d06'
+down_revision: Union[str, None] = '7fab38d513c1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('reminder_outbox',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('event_id', sa.Integer(), nullable=False),
+    sa.Column('fire_at', sa.DateTime(), nullable=False),
+    sa.Column('attempts', sa.Integer(), nullable=False),
+    sa.Column('next_attempt_at', sa.DateTime(), nullable=False),
+    sa.Column('last_error', sa.Text(), nullable=True),
+    sa.Column('status', sa.Enum('pending', 'sent', 'failed', name='outbox_status_enum'), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('sent_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['event_id'], ['events.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('event_id', 'fire_at', name='uq_reminder_outbox_event_fire_at')
+    )
+    op.create_index(
+        'ix_reminder_outbox_pending', 'reminder_outbox', ['next_attempt_at'],
+        unique=False,
+        postgresql_where=sa.text("status = 'pending'"),
+        sqlite_where=sa.text("status = 'pending'"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_reminder_outbox_pending', table_name='reminder_outbox')
+    op.drop_table('reminder_outbox')
+    sa.Enum(name='outbox_status_enum').drop(op.get_bind(), checkfirst=True)
@@ -0,0 +1,44 @@
+from contextlib import asynccontextmanager
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.config import config
+from app.db import Base, enable_sqlite_foreign_keys
+from app.repositories.user_cache import user_cache
+from app.scheduler import tasks
+
+
+class SqliteDb:
+    """Тимчасова SQLite-база зі схемою моделей (`create_all`)."""
+
+    def __init__(self, path):
+        self.url = f"sqlite+aiosqlite:///{path}"
+        self.engine = None
+
+    @asynccontextmanager
+    async def connect(self):
+        """
+        Відкриває базу в поточному циклі подій; планувальник теж працює з нею.
+
+        Yields:
+            async_sessionmaker: Фабрика сесій тестової бази.
+        """
+        engine = self.engine = create_async_engine(self.url)
+        enable_sqlite_foreign_keys(engine)
+        try:
+            async with engine.begin() as conn:
+                await conn.run_sync(Base.metadata.create_all)
+            tasks.async_session = async_sessionmaker(bind=engine, expire_on_commit=False, class_=AsyncSession)
+            yield tasks.async_session
+        finally:
+            await engine.dispose()
+
+
+@pytest.fixture
+def sqlite_db(monkeypatch, tmp_path):
+    monkeypatch.setattr(config.db, "use_postgres", False)
+    monkeypatch.setattr(tasks, "async_session", tasks.async_session)
+    user_cache.clear()
+    yield SqliteDb(tmp_path / "test.db")
+    user_cache.clear()
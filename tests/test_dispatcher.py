@@ -0,0 +1,95 @@
+import asyncio
+import time
+
+from aiogram.exceptions import TelegramForbiddenError, TelegramRetryAfter
+
+from app.scheduler.dispatcher import OutgoingReminder, ReminderDispatcher
+from app.utils.tz import utc_now
+
+
+class SlowBot:
+    """Імітує Telegram: кожен запит триває `delay` секунд; помилки задаються для чатів."""
+
+    def __init__(self, delay: float = 0.0, errors: dict | None = None):
+        self.delay = delay
+        self.errors = errors or {}
+        self.active = 0
+        self.max_active = 0
+        self.sent_at: list[tuple[int, float]] = []
+
+    async def send_message(self, chat_id, text):
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        try:
+            await asyncio.sleep(self.delay)
+            queued = self.errors.get(chat_id)
+            if queued:
+                raise queued.pop(0)
+            self.sent_at.append((chat_id, time.monotonic()))
+        finally:
+            self.active -= 1
+
+
+def _reminders(chat_ids) -> list[OutgoingReminder]:
+    return [OutgoingReminder(key, chat_id, "text", utc_now()) for key, chat_id in enumerate(chat_ids)]
+
+
+def test_concurrency_is_capped_by_the_semaphore():
+    bot = SlowBot(delay=0.02)
+    dispatcher = ReminderDispatcher(bot, concurrency=3, global_rate=1000, per_chat_rate=1000)
+
+    sent, failures, stats = asyncio.run(dispatcher.dispatch(_reminders(range(12))))
+
+    assert sorted(sent) == list(range(12))
+    assert not failures
+    assert stats.sent == 12
+    assert bot.max_active == 3
+
+
+def test_global_rate_limits_a_burst():
+    bot = SlowBot()
+    dispatcher = ReminderDispatcher(bot, concurrency=50, global_rate=20, per_chat_rate=1000)
+
+    started = time.monotonic()
+    asyncio.run(dispatcher.dispatch(_reminders(range(30))))
+
+    # Сплеск 20 повідомлень одразу, решта 10 — зі швидкістю 20/сек
+    assert time.monotonic() - started >= 0.45
+    burst = [at for _, at in bot.sent_at if at - started < 0.2]
+    assert len(burst) <= 20 + 4 + 1
+
+
+def test_per_chat_rate_spaces_messages_to_one_chat():
+    bot = SlowBot()
+    dispatcher = ReminderDispatcher(bot, concurrency=10, global_rate=1000, per_chat_rate=10)
+
+    asyncio.run(dispatcher.dispatch(_reminders([7, 7, 7, 8])))
+
+    times = sorted(at for chat_id, at in bot.sent_at if chat_id == 7)
+    assert len(times) == 3
+    assert all(b - a >= 0.08 for a, b in zip(times, times[1:]))
+
+
+def test_retry_after_pauses_only_that_chat_and_retries():
+    bot = SlowBot(errors={1: [TelegramRetryAfter(method=None, message="flood", retry_after=0.2)]})
+    dispatcher = ReminderDispatcher(bot, concurrency=5, global_rate=1000, per_chat_rate=1000)
+
+    started = time.monotonic()
+    sent, failures, _ = asyncio.run(dispatcher.dispatch(_reminders([1, 2])))
+
+    assert sorted(sent) == [0, 1]
+    assert not failures
+    at = dict(bot.sent_at)
+    assert at[2] - started < 0.1
+    assert at[1] - started >= 0.2
+
+
+def test_permanent_errors_are_not_retried():
+    bot = SlowBot(errors={1: [TelegramForbiddenError(method=None, message="bot was blocked by the user")]})
+    dispatcher = ReminderDispatcher(bot, concurrency=5, global_rate=1000, per_chat_rate=1000)
+
+    sent, failures, stats = asyncio.run(dispatcher.dispatch(_reminders([1, 2])))
+
+    assert sent == [1]
+    assert failures[0].permanent
+    assert stats.permanent == 1
@@ -0,0 +1,118 @@
+import asyncio
+from datetime import datetime, time, timedelta, timezone
+
+from sqlalchemy import func, select
+
+from app.models.models import Event, EventReminder, User
+from app.repositories import event_repo
+from app.repositories.event_repo import delete_events, mark_events_done, mark_passed_today_done
+from app.scheduler.reminder_queue import ReminderQueue
+from app.repositories.tag_repo import set_event_category, set_event_tags
+from app.utils.tz import local_now
+
+TZ = "Europe/Kyiv"
+
+
+async def _seed(session) -> tuple[User, User, list[Event]]:
+    owner, other = User(telegram_id=1, timezone=TZ), User(telegram_id=2, timezone=TZ)
+    session.add_all([owner, other])
+    await session.flush()
+    tomorrow = local_now(TZ).date() + timedelta(days=1)
+    items = [
+        Event(user_id=owner.id, title="Report", date=tomorrow, time=time(9)),
+        Event(user_id=owner.id, title="Call", date=tomorrow + timedelta(days=1), time=time(10)),
+        Event(user_id=other.id, title="Foreign", date=tomorrow, time=time(9)),
+    ]
+    for item in items:
+        item.reminders = []
+        item.tags = []
+        item.sync_reminders(TZ, [10, 60])
+        session.add(item)
+    await set_event_category(session, items[0], "Work")
+    await set_event_tags(session, items[0], "b, a")
+    await session.commit()
+    return owner, other, items
+
+
+def test_mark_done_returns_display_rows_for_own_events_only(sqlite_db):
+    async def scenario():
+        async with sqlite_db.connect() as session_factory:
+            async with session_factory() as session:
+                owner, _, items = await _seed(session)
+                rows = await mark_events_done(session, [e.id for e in items] + [999], owner.id)
+                foreign_done = await session.scalar(select(Event.is_done).where(Event.id == items[2].id))
+                return rows, foreign_done
+
+    rows, foreign_done = asyncio.run(scenario())
+
+    assert sorted(row.title for row in rows) == ["Call", "Report"]
+    report = next(row for row in rows if row.title == "Report")
+    assert report.is_done
+    assert report.category == "work"
+    assert sorted(report.tag.split(", ")) == ["a", "b"]
+    assert not foreign_done
+
+
+def test_mark_passed_today_done_touches_only_started_events(sqlite_db):
+    async def scenario():
+        async with sqlite_db.connect() as session_factory:
+            async with session_factory() as session:
+                user = User(telegram_id=1, timezone=TZ)
+                session.add(user)
+                await session.flush()
+                now = local_now(TZ).replace(second=0, microsecond=0)
+                for title, delta in (("Past", -timedelta(minutes=30)), ("Future", timedelta(minutes=30))):
+                    at = now + delta
+                    if at.date() != now.date():
+                        return None
+                    item = Event(user_id=user.id, title=title, date=at.date(), time=at.time())
+                    item.reminders = []
+                    item.sync_reminders(TZ, [])
+                    session.add(item)
+                await session.commit()
+                return await mark_passed_today_done(session, user.id, now.date(), TZ)
+
+    rows = asyncio.run(scenario())
+
+    if rows is not None:
+        assert [row.title for row in rows] == ["Past"]
+
+
+def test_delete_returns_removed_rows_and_cascades_reminders(sqlite_db):
+    async def scenario():
+        async with sqlite_db.connect() as session_factory:
+            async with session_factory() as session:
+                owner, _, items = await _seed(session)
+                rows = await delete_events(session, [items[0].id, items[2].id], owner.id)
+                remaining = (await session.execute(select(Event.title).order_by(Event.id))).scalars().all()
+                reminders = await session.scalar(select(func.count()).select_from(EventReminder))
+                return rows, remaining, reminders
+
+    rows, remaining, reminders = asyncio.run(scenario())
+
+    assert [(row.title) for row in rows] == ["Report"]
+    assert remaining == ["Call", "Foreign"]
+    assert reminders == 4
+
+
+def test_done_and_deleted_events_leave_the_reminder_queue(sqlite_db, monkeypatch):
+    queue = ReminderQueue()
+    monkeypatch.setattr(event_repo, "reminder_queue", queue)
+
+    async def scenario():
+        async with sqlite_db.connect() as session_factory:
+            async with session_factory() as session:
+                owner, other, items = await _seed(session)
+                for item in items:
+                    queue.schedule_event(item)
+                scheduled = len(queue)
+                await mark_events_done(session, [items[0].id], owner.id)
+                await delete_events(session, [items[1].id, items[2].id], owner.id)
+                foreign = {r.id for r in items[2].reminders}
+                return scheduled, foreign
+
+    scheduled, foreign = asyncio.run(scenario())
+
+    assert scheduled == 6
+    # Лишилися тільки нагадування чужої події, яку видалити не вдалося
+    assert set(queue.pop_due(datetime(2100, 1, 1, tzinfo=timezone.utc))) == foreign
@@ -0,0 +1,80 @@
+import asyncio
+from datetime import date, time
+
+from app.models.models import Event, User
+from app.repositories.event_repo import get_events_by_user_page, get_events_in_range, get_events_in_range_page
+
+TZ = "Europe/Kyiv"
+
+
+async def _seed(session) -> int:
+    user = User(telegram_id=1, timezone=TZ)
+    session.add(user)
+    await session.flush()
+    items = [
+        # Кілька подій з однаковим starts_at: порядок між ними задає id
+        Event(user_id=user.id, title=f"Same {i}", date=date(2026, 5, 3), time=time(9)) for i in range(3)
+    ] + [
+        Event(user_id=user.id, title=f"Day {day}", date=date(2026, 5, day), time=time(12)) for day in range(1, 8)
+    ] + [
+        Event(user_id=user.id, title="All day", date=date(2026, 5, 5)),
+        Event(user_id=user.id, title="Series", date=date(2026, 4, 30), time=time(8), repeat="daily"),
+    ]
+    for item in items:
+        item.reminders = []
+        item.sync_reminders(TZ, [])
+    session.add_all(items)
+    await session.commit()
+    return user.id
+
+
+async def _all_pages(fetch, limit: int) -> list[list]:
+    pages, cursor = [], None
+    while True:
+        page, cursor = await fetch(after=cursor, limit=limit)
+        pages.append(page)
+        if cursor is None:
+            return pages
+
+
+def test_user_pages_cover_every_event_once_in_order(sqlite_db):
+    async def scenario():
+        async with sqlite_db.connect() as session_factory:
+            async with session_factory() as session:
+                user_id = await _seed(session)
+
+                async def fetch(**kwargs):
+                    return await get_events_by_user_page(session, user_id, **kwargs)
+
+                return await _all_pages(fetch, limit=4)
+
+    pages = asyncio.run(scenario())
+    flat = [e for page in pages for e in page]
+
+    assert [len(page) for page in pages] == [4, 4, 4]
+    assert len({e.id for e in flat}) == 12
+    assert [(e.starts_at, e.id) for e in flat] == sorted((e.starts_at, e.id) for e in flat)
+
+
+def test_range_pages_match_the_unpaged_range_with_series(sqlite_db):
+    async def scenario():
+        async with sqlite_db.connect() as session_factory:
+            async with session_factory() as session:
+                user_id = await _seed(session)
+                start, end = date(2026, 5, 1), date(2026, 5, 6)
+
+                async def fetch(**kwargs):
+                    return await get_events_in_range_page(session, user_id, start, end, tz=TZ, **kwargs)
+
+                pages = await _all_pages(fetch, limit=3)
+                full = await get_events_in_range(session, user_id, start, end, tz=TZ)
+                return pages, full
+
+    pages, full = asyncio.run(scenario())
+    flat = [(item.id, item.date) for page in pages for item in page]
+
+    assert all(len(page) <= 3 for page in pages)
+    assert len(flat) == len(set(flat))
+    assert sorted(flat) == sorted((item.id, item.date) for item in full)
+    # Шість входжень серії (1-6 травня) розгортаються віртуально, а не зберігаються
+    assert sum(1 for item in full if item.title == "Series") == 6
@@ -0,0 +1,58 @@
+import asyncio
+from datetime import date, time
+
+from app.models.models import Event, User
+from app.repositories.event_repo import search_events
+from app.utils.tz import to_utc
+
+
+def _event(user, title, day, at=None, description=None) -> Event:
+    return Event(
+        user_id=user.id, title=title, description=description, date=day, time=at, starts_at=to_utc(day, at)
+    )
+
+
+async def _search(db, query: str, **kwargs) -> tuple[list[str], int | None]:
+    async with db.connect() as session_factory:
+        async with session_factory() as session:
+            owner, other = User(telegram_id=1), User(telegram_id=2)
+            session.add_all([owner, other])
+            await session.flush()
+            session.add_all([
+                _event(owner, "Dentist", date(2026, 5, 1), time(9), "check-up"),
+                _event(owner, "Call mom", date(2026, 5, 2), description="ask about the dentist"),
+                _event(owner, "Gym", date(2026, 5, 3)),
+                _event(other, "Dentist", date(2026, 5, 1)),
+            ])
+            await session.commit()
+
+            gym = (await session.execute(Event.__table__.select().where(Event.title == "Gym"))).first()
+            await session.execute(
+                Event.__table__.update().where(Event.id == gym.id).values(title="Dentist appointment")
+            )
+            await session.commit()
+
+            events, next_offset = await search_events(session, owner.id, query, **kwargs)
+            return [e.title for e in events], next_offset
+
+
+def test_search_ranks_title_matches_first_and_skips_other_users(sqlite_db):
+    titles, next_offset = asyncio.run(_search(sqlite_db, "dentist"))
+
+    # Оновлена назва потрапила в індекс тригером, збіг в описі — останнім
+    assert sorted(titles[:2]) == ["Dentist", "Dentist appointment"]
+    assert titles[2] == "Call mom"
+    assert next_offset is None
+
+
+def test_search_pages_by_offset(sqlite_db):
+    titles, next_offset = asyncio.run(_search(sqlite_db, "dentist", limit=2))
+
+    assert len(titles) == 2
+    assert next_offset == 2
+
+
+def test_search_quotes_fts5_syntax(sqlite_db):
+    titles, _ = asyncio.run(_search(sqlite_db, 'mom" OR "gym'))
+
+    assert titles == []
@@ -0,0 +1,174 @@
+import asyncio
+from datetime import timedelta
+
+import pytest
+from aiogram.exceptions import TelegramForbiddenError
+from sqlalchemy import select, update
+
+from app.config import config
+from app.models.models import Event, EventReminder, ReminderOutbox, User
+from app.repositories.outbox_repo import claim_outbox_batch
+from app.scheduler import tasks
+from app.scheduler.dispatcher import ReminderDispatcher
+from app.utils.tz import get_zone, utc_now
+
+TZ = "Europe/Kyiv"
+
+
+class FailingBot:
+    """Кожне надсилання завершується помилкою `error` (None — успіх)."""
+
+    def __init__(self, error: Exception | None):
+        self.error = error
+        self.calls = 0
+
+    async def send_message(self, chat_id, text):
+        self.calls += 1
+        if self.error:
+            raise self.error
+
+
+@pytest.fixture
+def outbox_config(monkeypatch):
+    monkeypatch.setattr(config.scheduler, "max_delivery_attempts", 3)
+    monkeypatch.setattr(config.scheduler, "retry_base_delay", 30)
+    monkeypatch.setattr(config.scheduler, "claim_lease", 300)
+
+
+async def _seed_due(session, user: User | None = None, title: str = "Event") -> Event:
+    """Створює подію (і за потреби користувача), нагадування якої вже мало спрацювати."""
+    now = utc_now()
+    if user is None:
+        user = User(telegram_id=1, timezone=TZ)
+        session.add(user)
+        await session.flush()
+    starts = (now + timedelta(minutes=5)).astimezone(get_zone(TZ)).replace(microsecond=0)
+    item = Event(user_id=user.id, title=title, date=starts.date(), time=starts.time(), repeat="none")
+    item.reminders = []
+    item.sync_reminders(TZ, [10], now)
+    session.add(item)
+    await session.commit()
+    return item
+
+
+async def _outbox(session) -> ReminderOutbox:
+    session.expire_all()
+    return (await session.execute(select(ReminderOutbox))).scalar_one()
+
+
+async def _make_due(session):
+    """Переносить наступну спробу на минуле, ніби затримка вже минула."""
+    await session.execute(update(ReminderOutbox).values(next_attempt_at=utc_now() - timedelta(seconds=1)))
+    await session.commit()
+
+
+def test_claimed_rows_are_leased_until_the_lease_expires(sqlite_db, outbox_config):
+    async def scenario():
+        async with sqlite_db.connect() as session_factory:
+            async with session_factory() as session:
+                await _seed_due(session)
+            assert await tasks.enqueue_due_reminders() == 1
+
+            now = utc_now()
+            async with session_factory() as session:
+                first = await claim_outbox_batch(session, now, 10, lease_seconds=300)
+            async with session_factory() as session:
+                again = await claim_outbox_batch(session, now + timedelta(seconds=299), 10, lease_seconds=300)
+            async with session_factory() as session:
+                expired = await claim_outbox_batch(session, now + timedelta(seconds=301), 10, lease_seconds=300)
+            return first, again, expired, now
+
+    first, again, expired, now = asyncio.run(scenario())
+
+    assert len(first) == 1
+    assert first[0][0].next_attempt_at == now + timedelta(seconds=300)
+    assert again == []
+    assert [row[0].id for row in expired] == [first[0][0].id]
+
+
+def test_transient_failures_back_off_exponentially_then_fail(sqlite_db, outbox_config):
+    async def scenario():
+        async with sqlite_db.connect() as session_factory:
+            async with session_factory() as session:
+                await _seed_due(session)
+            await tasks.enqueue_due_reminders()
+
+            dispatcher = ReminderDispatcher(FailingBot(RuntimeError("network down")), 5, 1000, 1000)
+            delays = []
+            async with session_factory() as session:
+                for _ in range(config.scheduler.max_delivery_attempts):
+                    started = utc_now()
+                    assert await tasks.deliver_outbox(dispatcher) == 1
+                    entry = await _outbox(session)
+                    delays.append((entry.next_attempt_at - started).total_seconds())
+                    if entry.status != "pending":
+                        break
+                    assert await tasks.deliver_outbox(dispatcher) == 0
+                    await _make_due(session)
+                return entry, delays
+
+    entry, delays = asyncio.run(scenario())
+
+    assert entry.status == "failed"
+    assert entry.attempts == 3
+    assert "network down" in entry.last_error
+    assert delays[0] == pytest.approx(30, abs=2)
+    assert delays[1] == pytest.approx(60, abs=2)
+
+
+def test_retry_that_succeeds_clears_the_error(sqlite_db, outbox_config):
+    async def scenario():
+        async with sqlite_db.connect() as session_factory:
+            async with session_factory() as session:
+                await _seed_due(session)
+            await tasks.enqueue_due_reminders()
+
+            bot = FailingBot(RuntimeError("timeout"))
+            dispatcher = ReminderDispatcher(bot, 5, 1000, 1000)
+            await tasks.deliver_outbox(dispatcher)
+            async with session_factory() as session:
+                await _make_due(session)
+                bot.error = None
+                await tasks.deliver_outbox(dispatcher)
+                return await _outbox(session)
+
+    entry = asyncio.run(scenario())
+
+    assert entry.status == "sent"
+    assert entry.attempts == 2
+    assert entry.last_error is None
+
+
+def test_permanent_failure_marks_user_unreachable_and_stops_reminders(sqlite_db, outbox_config):
+    async def scenario():
+        async with sqlite_db.connect() as session_factory:
+            async with session_factory() as session:
+                await _seed_due(session)
+            await tasks.enqueue_due_reminders()
+
+            bot = FailingBot(TelegramForbiddenError(method=None, message="bot was blocked by the user"))
+            await tasks.deliver_outbox(ReminderDispatcher(bot, 5, 1000, 1000))
+
+            async with session_factory() as session:
+                entry = await _outbox(session)
+                user = (await session.execute(select(User))).scalar_one()
+                await _seed_due(session, user, "Second")
+
+            # Нове нагадування недосяжного користувача закривається без запису outbox
+            await tasks.enqueue_due_reminders()
+            async with session_factory() as session:
+                outbox = (await session.execute(select(ReminderOutbox))).scalars().all()
+                pending = (await session.execute(
+                    select(EventReminder).where(EventReminder.sent_at.is_(None))
+                )).scalars().all()
+            return entry, user, bot.calls, outbox, pending
+
+    entry, user, calls, outbox, pending = asyncio.run(scenario())
+
+    assert calls == 1
+    assert entry.status == "failed"
+    assert entry.attempts == 1
+    assert not user.is_reachable
+    assert user.blocked_at is not None
+    assert len(outbox) == 1
+    assert pending == []
@@ -0,0 +1,107 @@
+import asyncio
+from datetime import date, datetime, time, timedelta
+
+from sqlalchemy import select
+
+from app.models.models import Event, EventReminder, User
+from app.repositories.event_repo import get_events_in_range
+from app.scheduler import tasks
+from app.utils.recurrence import Occurrence, expand_event, first_remind_at, occurrence_dates
+from app.utils.tz import get_zone, to_utc, utc_now
+
+TZ = "Europe/Kyiv"
+
+
+def test_monthly_series_clamps_to_the_end_of_month():
+    dates = occurrence_dates(date(2026, 1, 31), "monthly", None, frozenset(), date(2026, 1, 1), date(2026, 4, 30))
+
+    assert dates == (date(2026, 1, 31), date(2026, 2, 28), date(2026, 3, 31), date(2026, 4, 30))
+
+
+def test_window_starts_mid_series_and_respects_until_and_exceptions():
+    dates = occurrence_dates(
+        date(2026, 1, 1), "weekly", date(2026, 3, 1), frozenset({date(2026, 2, 12)}),
+        date(2026, 2, 3), date(2026, 12, 31),
+    )
+
+    assert dates == (date(2026, 2, 5), date(2026, 2, 19), date(2026, 2, 26))
+
+
+def test_expand_event_marks_past_occurrences_done():
+    series = Event(title="Standup", date=date(2026, 5, 1), time=time(9), repeat="daily", is_done=False)
+
+    occurrences = expand_event(series, date(2026, 5, 1), date(2026, 5, 3), now=datetime(2026, 5, 2, 12))
+
+    assert all(isinstance(o, Occurrence) for o in occurrences)
+    assert [(o.date, o.is_done) for o in occurrences] == [
+        (date(2026, 5, 1), True), (date(2026, 5, 2), True), (date(2026, 5, 3), False),
+    ]
+    assert occurrences[0].title == "Standup"
+
+
+def test_first_remind_at_keeps_local_time_across_dst():
+    series = Event(date=date(2026, 3, 27), time=time(9), repeat="daily")
+
+    # 29.03 Київ переходить на літній час: 9:00 місцевого — це вже 6:00 UTC, а не 7:00
+    fire_at = first_remind_at(series, 15, to_utc(date(2026, 3, 29), time(0), TZ), TZ)
+
+    assert fire_at == to_utc(date(2026, 3, 29), time(9), TZ) - timedelta(minutes=15)
+    assert fire_at.hour == 5
+
+
+def test_series_is_stored_once_and_expanded_in_range(sqlite_db):
+    async def scenario():
+        async with sqlite_db.connect() as session_factory:
+            async with session_factory() as session:
+                user = User(telegram_id=1, timezone=TZ)
+                session.add(user)
+                await session.flush()
+                series = Event(
+                    user_id=user.id, title="Gym", date=date(2026, 5, 4), time=time(18), repeat="weekly",
+                    repeat_exceptions=["2026-05-11"],
+                )
+                single = Event(user_id=user.id, title="Dentist", date=date(2026, 5, 12), time=time(9))
+                for item in (series, single):
+                    item.reminders = []
+                    item.sync_reminders(TZ, [])
+                session.add_all([series, single])
+                await session.commit()
+
+                stored = (await session.execute(select(Event))).scalars().all()
+                items = await get_events_in_range(session, user.id, date(2026, 5, 1), date(2026, 5, 31), tz=TZ)
+                return len(stored), [(i.title, i.date) for i in items]
+
+    stored, items = asyncio.run(scenario())
+
+    assert stored == 2
+    assert items == [
+        ("Gym", date(2026, 5, 4)), ("Dentist", date(2026, 5, 12)), ("Gym", date(2026, 5, 18)), ("Gym", date(2026, 5, 25)),
+    ]
+
+
+def test_series_reminder_moves_to_the_next_occurrence(sqlite_db):
+    async def scenario():
+        async with sqlite_db.connect() as session_factory:
+            now = utc_now()
+            starts = (now + timedelta(minutes=5)).astimezone(get_zone(TZ)).replace(second=0, microsecond=0)
+            async with session_factory() as session:
+                user = User(telegram_id=1, timezone=TZ)
+                session.add(user)
+                await session.flush()
+                series = Event(user_id=user.id, title="Pills", date=starts.date(), time=starts.time(), repeat="daily")
+                series.reminders = []
+                # Нагадування сьогоднішнього входження (за 10 хв до початку) уже настало
+                series.sync_reminders(TZ, [10], now - timedelta(minutes=10))
+                session.add(series)
+                await session.commit()
+                first_fire_at = series.reminders[0].fire_at
+
+            assert await tasks.enqueue_due_reminders() == 1
+            async with session_factory() as session:
+                reminder = (await session.execute(select(EventReminder))).scalar_one()
+            return first_fire_at, reminder
+
+    first_fire_at, reminder = asyncio.run(scenario())
+
+    assert reminder.sent_at is None
+    assert reminder.fire_at == first_fire_at + timedelta(days=1)
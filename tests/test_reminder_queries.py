@@ -0,0 +1,82 @@
+import asyncio
+from datetime import timedelta
+
+import pytest
+from sqlalchemy import event
+
+from app.config import config
+from app.models.models import Event, User
+from app.scheduler import tasks
+from app.scheduler.dispatcher import ReminderDispatcher
+from app.utils.tz import get_zone, utc_now
+
+TZ = "Europe/Kyiv"
+
+
+class FakeBot:
+    """Замість Telegram запам'ятовує надіслані повідомлення."""
+
+    def __init__(self):
+        self.sent = []
+
+    async def send_message(self, chat_id, text):
+        self.sent.append((chat_id, text))
+
+
+async def _run_tick(db, first_telegram_id: int, due: int) -> tuple[int, int, int]:
+    """
+    Створює `due` подій різних користувачів із простроченим нагадуванням і виконує
+    один прохід планувальника.
+
+    Returns:
+        tuple[int, int, int]: Кількість SQL-запитів у `enqueue_due_reminders`,
+        у `deliver_outbox` та кількість надісланих повідомлень.
+    """
+    now = utc_now()
+    starts = (now + timedelta(minutes=5)).astimezone(get_zone(TZ)).replace(microsecond=0)
+    async with tasks.async_session() as session:
+        for i in range(due):
+            user = User(telegram_id=first_telegram_id + i, timezone=TZ)
+            session.add(user)
+            await session.flush()
+            item = Event(user_id=user.id, title=f"Event {i}", date=starts.date(), time=starts.time(), repeat="none")
+            item.reminders = []
+            item.sync_reminders(TZ, [10], now)
+            session.add(item)
+        await session.commit()
+
+    statements = [0]
+
+    def count(conn, cursor, statement, parameters, context, executemany):
+        statements[0] += 1
+
+    event.listen(db.engine.sync_engine, "before_cursor_execute", count)
+    try:
+        assert await tasks.enqueue_due_reminders() == due
+        enqueue_statements, statements[0] = statements[0], 0
+
+        bot = FakeBot()
+        assert await tasks.deliver_outbox(ReminderDispatcher(bot, 5, 1000, 1000)) == due
+        return enqueue_statements, statements[0], len(bot.sent)
+    finally:
+        event.remove(db.engine.sync_engine, "before_cursor_execute", count)
+
+
+@pytest.fixture
+def sqlite_scheduler(monkeypatch, sqlite_db):
+    monkeypatch.setattr(config.scheduler, "reminder_batch_size", 500)
+    return sqlite_db
+
+
+def test_statements_per_tick_do_not_grow_with_due_reminders(sqlite_scheduler):
+    async def scenario():
+        async with sqlite_scheduler.connect():
+            one = await _run_tick(sqlite_scheduler, 1000, 1)
+            many = await _run_tick(sqlite_scheduler, 2000, 25)
+            return one, many
+
+    one, many = asyncio.run(scenario())
+
+    assert one[2] == 1
+    assert many[2] == 25
+    assert many[:2] == one[:2]
@@ -0,0 +1,95 @@
+import asyncio
+import time
+from datetime import timedelta
+from types import SimpleNamespace
+
+from app.scheduler.reminder_queue import ReminderQueue
+from app.utils.tz import utc_now
+
+
+def test_pop_due_returns_reminders_in_fire_order():
+    queue = ReminderQueue()
+    now = utc_now()
+    queue.schedule(1, now + timedelta(minutes=5))
+    queue.schedule(2, now - timedelta(minutes=1))
+    queue.schedule(3, now - timedelta(minutes=2))
+
+    assert queue.pop_due(now) == [3, 2]
+    assert queue.next_fire_at() == now + timedelta(minutes=5)
+    assert len(queue) == 1
+
+
+def test_rescheduled_and_cancelled_entries_are_dropped_lazily():
+    queue = ReminderQueue()
+    now = utc_now()
+    queue.schedule(1, now - timedelta(minutes=1))
+    queue.schedule(2, now - timedelta(minutes=1))
+    queue.schedule(1, now + timedelta(hours=1))
+    queue.cancel(2)
+
+    assert queue.pop_due(now) == []
+    assert queue.next_fire_at() == now + timedelta(hours=1)
+
+
+def test_reminders_beyond_horizon_are_not_kept():
+    queue = ReminderQueue()
+    now = utc_now()
+    queue.horizon_end = now + timedelta(hours=24)
+    queue.schedule(1, now + timedelta(hours=1))
+    queue.schedule(1, now + timedelta(hours=48))
+
+    assert len(queue) == 0
+    assert queue.next_fire_at() is None
+
+
+def test_schedule_event_skips_done_events_and_sent_reminders():
+    queue = ReminderQueue()
+    now = utc_now()
+    pending = SimpleNamespace(id=1, fire_at=now, sent_at=None)
+    sent = SimpleNamespace(id=2, fire_at=now, sent_at=now)
+    queue.schedule(2, now)
+
+    queue.schedule_event(SimpleNamespace(id=10, is_done=False, reminders=[pending, sent]))
+    assert queue.pop_due(now) == [1]
+
+    queue.schedule(1, now)
+    queue.schedule_event(SimpleNamespace(id=10, is_done=True, reminders=[pending]))
+    assert len(queue) == 0
+
+
+def test_cancel_events_drops_every_reminder_of_the_event():
+    queue = ReminderQueue()
+    now = utc_now()
+    queue.schedule(1, now, event_id=10)
+    queue.schedule(2, now + timedelta(minutes=50), event_id=10)
+    queue.schedule(3, now, event_id=20)
+
+    queue.cancel_events([10, 99])
+
+    assert queue.pop_due(now + timedelta(hours=1)) == [3]
+    assert len(queue) == 0
+
+
+def test_wait_wakes_up_for_an_earlier_reminder():
+    async def scenario() -> float:
+        queue = ReminderQueue()
+        queue.schedule(1, utc_now() + timedelta(hours=1))
+        started = time.monotonic()
+        waiter = asyncio.create_task(queue.wait(30))
+        await asyncio.sleep(0.05)
+        queue.schedule(2, utc_now() + timedelta(seconds=1))
+        await asyncio.wait_for(waiter, 5)
+        return time.monotonic() - started
+
+    assert asyncio.run(scenario()) < 1
+
+
+def test_wait_sleeps_only_until_the_head_of_the_heap():
+    async def scenario() -> float:
+        queue = ReminderQueue()
+        queue.schedule(1, utc_now() + timedelta(seconds=0.2))
+        started = time.monotonic()
+        await queue.wait(30)
+        return time.monotonic() - started
+
+    assert 0.1 < asyncio.run(scenario()) < 1
@@ -0,0 +1,39 @@
+import asyncio
+from datetime import date, time, timedelta
+
+from app.models.models import Event, User
+from app.services.stats_service import get_stats_report
+from app.utils.tz import local_today
+
+TZ = "Europe/Kyiv"
+
+
+async def _report(db, events: list[dict]) -> str:
+    async with db.connect() as session_factory:
+        async with session_factory() as session:
+            user = User(telegram_id=1, timezone=TZ, language="en")
+            session.add(user)
+            await session.flush()
+            for fields in events:
+                item = Event(user_id=user.id, **fields)
+                item.reminders = []
+                item.sync_reminders(TZ, [])
+                session.add(item)
+            await session.commit()
+            _, report = await get_stats_report(session, user, "all")
+            return report
+
+
+def test_all_time_starts_at_the_first_event(sqlite_db):
+    today = local_today(TZ)
+    report = asyncio.run(_report(sqlite_db, [
+        {"title": "Old", "date": today - timedelta(days=9), "time": time(9), "is_done": True},
+        {"title": "Daily", "date": today - timedelta(days=4), "time": time(8), "repeat": "daily"},
+    ]))
+
+    # 1 одноразова подія + входження серії від її початку до 90 днів наперед
+    assert "Total events: <b>96</b>" in report
+
+
+def test_all_time_without_events(sqlite_db):
+    assert asyncio.run(_report(sqlite_db, [])) == "ℹ️ You have no events yet."
@@ -0,0 +1,63 @@
+import asyncio
+from datetime import date, time
+
+from sqlalchemy import func, select
+
+from app.models.models import Category, Event, Tag, User
+from app.repositories.event_repo import get_events_in_range
+from app.repositories.tag_repo import normalize_name, parse_tags, set_event_category, set_event_tags
+
+TZ = "Europe/Kyiv"
+
+
+def test_names_are_trimmed_lowercased_and_stripped_of_hash():
+    assert normalize_name("  #Робота ") == "робота"
+    assert normalize_name("x" * 100) == "x" * 64
+
+
+def test_parse_tags_drops_empty_and_duplicate_names():
+    assert parse_tags("#Work, home ,work,, #HOME") == ["work", "home"]
+    assert parse_tags("-") == []
+    assert parse_tags(None) == []
+
+
+def test_labels_are_shared_and_filter_case_insensitively(sqlite_db):
+    async def scenario():
+        async with sqlite_db.connect() as session_factory:
+            async with session_factory() as session:
+                user = User(telegram_id=1, timezone=TZ)
+                session.add(user)
+                await session.flush()
+
+                labels = [("Work", "#Urgent, home"), ("work ", "HOME"), ("-", "-")]
+                for i, (category, tags) in enumerate(labels):
+                    item = Event(user_id=user.id, title=f"Event {i}", date=date(2026, 5, 1 + i), time=time(9))
+                    item.reminders = []
+                    item.sync_reminders(TZ, [])
+                    item.tags = []
+                    session.add(item)
+                    await set_event_category(session, item, category)
+                    await set_event_tags(session, item, tags)
+                await session.commit()
+
+                counts = (
+                    await session.scalar(select(func.count()).select_from(Category)),
+                    await session.scalar(select(func.count()).select_from(Tag)),
+                )
+                by_category = await get_events_in_range(
+                    session, user.id, date(2026, 5, 1), date(2026, 5, 31), category="WORK", tz=TZ
+                )
+                by_tag = await get_events_in_range(
+                    session, user.id, date(2026, 5, 1), date(2026, 5, 31), tag="#home", tz=TZ
+                )
+                by_both = await get_events_in_range(
+                    session, user.id, date(2026, 5, 1), date(2026, 5, 31), category="work", tag="urgent", tz=TZ
+                )
+                return counts, [e.title for e in by_category], [e.title for e in by_tag], [e.title for e in by_both]
+
+    counts, by_category, by_tag, by_both = asyncio.run(scenario())
+
+    assert counts == (1, 2)
+    assert by_category == ["Event 0", "Event 1"]
+    assert by_tag == ["Event 0", "Event 1"]
+    assert by_both == ["Event 0"]
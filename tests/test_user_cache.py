@@ -0,0 +1,109 @@
+import asyncio
+
+from app.repositories.user_cache import user_cache
+from app.repositories.user_repo import (
+    get_cached_user, get_user_by_telegram_id, get_or_create_user, mark_users_unreachable,
+)
+from app.utils.tz import utc_now
+
+
+class CountingLoader:
+    """Обгортка над `get_user_by_telegram_id`, що рахує звернення до БД."""
+
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+        self.calls = 0
+
+    async def __call__(self, session, telegram_id):
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        return await get_user_by_telegram_id(session, telegram_id)
+
+
+def test_second_lookup_is_served_from_cache(sqlite_db):
+    async def scenario():
+        async with sqlite_db.connect() as session_factory:
+            async with session_factory() as session:
+                await get_or_create_user(session, 1, "ann", "Ann", None)
+            user_cache.clear()
+
+            loader = CountingLoader()
+            async with session_factory() as session:
+                first = await user_cache.get(session, 1, loader)
+            async with session_factory() as session:
+                second = await user_cache.get(session, 1, loader)
+                return loader.calls, first, second, second in session
+
+    calls, first, second, attached = asyncio.run(scenario())
+
+    assert calls == 1
+    assert second is not first
+    assert second.username == "ann"
+    assert attached
+
+
+def test_orm_update_invalidates_after_commit(sqlite_db):
+    async def scenario():
+        async with sqlite_db.connect() as session_factory:
+            async with session_factory() as session:
+                await get_or_create_user(session, 1, "ann", "Ann", None)
+            async with session_factory() as session:
+                user = await get_cached_user(session, 1)
+                user.language = "en"
+                await session.commit()
+            size = len(user_cache)
+            async with session_factory() as session:
+                return size, (await get_cached_user(session, 1)).language
+
+    size, language = asyncio.run(scenario())
+
+    assert size == 0
+    assert language == "en"
+
+
+def test_bulk_unreachable_update_invalidates_cache(sqlite_db):
+    async def scenario():
+        async with sqlite_db.connect() as session_factory:
+            async with session_factory() as session:
+                await get_or_create_user(session, 1, "ann", "Ann", None)
+            async with session_factory() as session:
+                await mark_users_unreachable(session, [1], utc_now())
+                await session.commit()
+            async with session_factory() as session:
+                return (await get_cached_user(session, 1)).is_reachable
+
+    assert asyncio.run(scenario()) is False
+
+
+def test_concurrent_misses_load_once(sqlite_db):
+    async def scenario():
+        async with sqlite_db.connect() as session_factory:
+            async with session_factory() as session:
+                await get_or_create_user(session, 1, "ann", "Ann", None)
+            user_cache.clear()
+
+            loader = CountingLoader(delay=0.05)
+
+            async def lookup():
+                async with session_factory() as session:
+                    return (await user_cache.get(session, 1, loader)).telegram_id
+
+            results = await asyncio.gather(*(lookup() for _ in range(5)))
+            return loader.calls, results
+
+    calls, results = asyncio.run(scenario())
+
+    assert calls == 1
+    assert results == [1] * 5
+
+
+def test_unknown_users_are_not_cached(sqlite_db):
+    async def scenario():
+        async with sqlite_db.connect() as session_factory:
+            loader = CountingLoader()
+            async with session_factory() as session:
+                assert await user_cache.get(session, 42, loader) is None
+                assert await user_cache.get(session, 42, loader) is None
+            return loader.calls
+
+    assert asyncio.run(scenario()) == 2